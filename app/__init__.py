@@ -9,8 +9,27 @@ from app.routes.upwork_jobs_routes import upwork_job_bp
 from app.routes.proposal_routes import proposal_bp
 from app.routes.project_routes import project_bp
 from app.routes.task_routes import task_bp
+from app.routes.search_routes import search_bp
+from app.routes.metrics_routes import metrics_bp
+from app.routes.export_routes import export_bp
+from app.utils.gemini_cache import init_gemini_cache
+from app.utils.gemini_gateway import init_gemini_gateway
+from app.utils.prompts import init_prompts
+from app.utils.proposal_queue import proposal_queue
+from app.utils.sql_profiler import init_sql_profiler
+from app.utils.db_pool import init_db_pool
+from app.utils.user_cache import init_user_cache, user_cache
+from app.utils.auth_tokens import init_auth_tokens, load_user_from_request
+from app.utils.password_hashing import init_password_hasher
+from app.utils.rate_limit import init_login_limiters
+from app.utils.code_allocator import init_code_allocator
+from app.utils.project_stats import rebuild_project_stats
+from app.utils.http_cache import init_http_cache
+from app.utils.compression import init_compression
 from flask_login import LoginManager
 from flask import jsonify
+from flask.cli import AppGroup
+import click
 
 
 login_manager = LoginManager()
@@ -22,8 +41,21 @@ def create_app():
 
     # Init extensions
     db.init_app(app)
+    init_db_pool(app, db)
     migrate.init_app(app, db)
     login_manager.init_app(app)
+    init_gemini_cache(app)
+    init_gemini_gateway(app)
+    init_prompts(app)
+    proposal_queue.init_app(app)
+    init_sql_profiler(app)
+    init_user_cache(app)
+    init_password_hasher(app)
+    init_login_limiters(app)
+    init_auth_tokens(app)
+    init_code_allocator(app)
+    init_http_cache(app)
+    init_compression(app)
 
     login_manager.login_view = 'auth.login'  # 'auth' = blueprint name, 'login' = function name
     login_manager.login_message = "Please log in to access website."
@@ -47,6 +79,10 @@ def create_app():
     from app.models.task_deliverable import TaskDeliverable
     from app.models.task_attachment import TaskAttachment
     from app.models.project_attachment import ProjectAttachment
+    from app.models.gemini_cache_entry import GeminiCacheEntry
+    from app.models.proposal_generation_job import ProposalGenerationJob
+    from app.models.code_sequence import CodeSequence
+    from app.models.project_stats import ProjectStats
 
     # Register Blueprints
     app.register_blueprint(auth_bp, url_prefix='/api/auth')
@@ -57,9 +93,38 @@ def create_app():
     app.register_blueprint(proposal_bp, url_prefix='/api/proposals')
     app.register_blueprint(project_bp, url_prefix='/api/projects')
     app.register_blueprint(task_bp, url_prefix='/api/tasks')
+    app.register_blueprint(search_bp, url_prefix='/api/search')
+    app.register_blueprint(metrics_bp, url_prefix='/metrics')
+    app.register_blueprint(export_bp, url_prefix='/api/exports')
+
+    # Standalone worker for queued proposal generation: `flask proposals work`
+    proposals_cli = AppGroup('proposals', help="Proposal generation queue commands.")
+
+    @proposals_cli.command('work')
+    @click.option('--once', is_flag=True, help="Process the pending jobs once and exit.")
+    @click.option('--poll-interval', default=2.0, show_default=True, help="Seconds to wait when the queue is empty.")
+    def work_proposal_queue(once, poll_interval):
+        proposal_queue.work(poll_interval=poll_interval, once=once)
+
+    app.cli.add_command(proposals_cli)
+
+    # Recount the materialized dashboard table from scratch: `flask stats rebuild`
+    stats_cli = AppGroup('stats', help="Project dashboard statistics commands.")
+
+    @stats_cli.command('rebuild')
+    def rebuild_stats():
+        rebuild_project_stats(db.session.connection())
+        db.session.commit()
+        click.echo("project_stats rebuilt.")
+
+    app.cli.add_command(stats_cli)
 
     @login_manager.user_loader
     def load_user(user_id):
-        return User.query.get(int(user_id))
+        # Cached immutable snapshot instead of a User SELECT on every request
+        return user_cache.get(int(user_id), lambda pk: db.session.get(User, pk))
+
+    # Token mode: `Authorization: Bearer <access_token>`, verified without a DB hit
+    login_manager.request_loader(load_user_from_request)
 
     return app
\ No newline at end of file
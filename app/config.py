@@ -1,10 +1,94 @@
 import os
+from app.utils.db_pool import build_engine_options
+from app.utils.db_routing import replica_binds
 
 class Config:
     SECRET_KEY = os.getenv("SECRET_KEY", "dev-secret")
-    SQLALCHEMY_DATABASE_URI = (
+    SQLALCHEMY_DATABASE_URI = os.getenv("DATABASE_URL") or (
         f"mysql+pymysql://{os.getenv('MYSQL_USER', 'root')}:{os.getenv('MYSQL_PASSWORD', '')}" 
         f"@{os.getenv('MYSQL_HOST', 'localhost')}:{os.getenv('MYSQL_PORT', '3306')}/{os.getenv('MYSQL_DB', 'dev_ventures')}"
     )
     SQLALCHEMY_TRACK_MODIFICATIONS = False
 
+    # Read replicas for @read_replica views, e.g.
+    # DB_REPLICA_URIS=sqlite:///replica1.db,sqlite:///replica2.db
+    SQLALCHEMY_BINDS = replica_binds(os.getenv("DB_REPLICA_URIS", ""))
+    # After a user writes, keep their reads on the primary for this long
+    READ_YOUR_WRITES_SECONDS = float(os.getenv("READ_YOUR_WRITES_SECONDS", "5"))
+
+    # Pool size/overflow/recycle/pre-ping and driver timeouts, see app/utils/db_pool.py
+    SQLALCHEMY_ENGINE_OPTIONS = build_engine_options(SQLALCHEMY_DATABASE_URI, os.getenv)
+    # Connections to pre-open at startup (0 disables warm-up)
+    DB_POOL_WARMUP = int(os.getenv("DB_POOL_WARMUP", "0"))
+
+    # Gemini
+    GEMINI_MAX_CONCURRENCY = int(os.getenv("GEMINI_MAX_CONCURRENCY", "5"))
+    GEMINI_TIMEOUT_SECONDS = float(os.getenv("GEMINI_TIMEOUT_SECONDS", "30"))
+
+    # Gemini response cache: "memory", "database" or "none"
+    GEMINI_CACHE_BACKEND = os.getenv("GEMINI_CACHE_BACKEND", "memory")
+    GEMINI_CACHE_TTL_SECONDS = int(os.getenv("GEMINI_CACHE_TTL_SECONDS", "3600"))
+    GEMINI_CACHE_MAXSIZE = int(os.getenv("GEMINI_CACHE_MAXSIZE", "1024"))
+
+    # Gemini gateway (app/utils/gemini_gateway.py); GEMINI_BASE_URL points the client at e.g. benchmarks/fake_gemini.py
+    GEMINI_API_KEY = os.getenv("GEMINI_API_KEY")
+    GEMINI_BASE_URL = os.getenv("GEMINI_BASE_URL")
+    GEMINI_RATE_LIMIT_RPM = int(os.getenv("GEMINI_RATE_LIMIT_RPM", "60"))  # 0 disables
+    GEMINI_RATE_LIMIT_TPM = int(os.getenv("GEMINI_RATE_LIMIT_TPM", "250000"))  # input tokens, 0 disables
+    GEMINI_RATE_LIMIT_MAX_WAIT_SECONDS = float(os.getenv("GEMINI_RATE_LIMIT_MAX_WAIT_SECONDS", "30"))
+    GEMINI_RETRY_ATTEMPTS = int(os.getenv("GEMINI_RETRY_ATTEMPTS", "4"))
+    GEMINI_RETRY_MAX_WAIT_SECONDS = float(os.getenv("GEMINI_RETRY_MAX_WAIT_SECONDS", "20"))
+    GEMINI_BREAKER_FAILURE_THRESHOLD = int(os.getenv("GEMINI_BREAKER_FAILURE_THRESHOLD", "5"))
+    GEMINI_BREAKER_RESET_SECONDS = float(os.getenv("GEMINI_BREAKER_RESET_SECONDS", "30"))
+    # Prompt template versions (app/utils/prompts.py), e.g. "job_feasibility=v1,proposal=v2"
+    GEMINI_PROMPT_VERSIONS = os.getenv("GEMINI_PROMPT_VERSIONS", "")
+
+    # Async proposal generation (app/utils/proposal_queue.py)
+    PROPOSAL_QUEUE_WORKERS = int(os.getenv("PROPOSAL_QUEUE_WORKERS", "4"))
+    # Set to "false" when jobs are processed only by `flask proposals work` processes
+    PROPOSAL_QUEUE_INLINE_WORKERS = os.getenv("PROPOSAL_QUEUE_INLINE_WORKERS", "true").lower() == "true"
+    # Inline mode re-submits pending rows this often (and once at startup)
+    PROPOSAL_QUEUE_SWEEP_SECONDS = float(os.getenv("PROPOSAL_QUEUE_SWEEP_SECONDS", "60"))
+    # Rows left "running" longer than this (e.g. after a crash) go back to pending
+    PROPOSAL_QUEUE_RUNNING_TIMEOUT_SECONDS = int(os.getenv("PROPOSAL_QUEUE_RUNNING_TIMEOUT_SECONDS", "600"))
+
+    # Batch proposal generation (POST /api/proposals/batch)
+    PROPOSAL_BATCH_MAX_JOBS = int(os.getenv("PROPOSAL_BATCH_MAX_JOBS", "50"))
+    PROPOSAL_BATCH_CONCURRENCY = int(os.getenv("PROPOSAL_BATCH_CONCURRENCY", "5"))
+
+    # Per-request SQL profiling (app/utils/sql_profiler.py)
+    SQL_PROFILER_ENABLED = os.getenv("SQL_PROFILER_ENABLED", "true").lower() == "true"
+    SQL_PROFILER_NPLUS1_THRESHOLD = int(os.getenv("SQL_PROFILER_NPLUS1_THRESHOLD", "5"))
+    SQL_PROFILER_SLOW_QUERY_MS = float(os.getenv("SQL_PROFILER_SLOW_QUERY_MS", "100"))
+
+    # Flask-Login user snapshot cache (app/utils/user_cache.py)
+    USER_CACHE_TTL_SECONDS = int(os.getenv("USER_CACHE_TTL_SECONDS", "60"))
+    USER_CACHE_MAXSIZE = int(os.getenv("USER_CACHE_MAXSIZE", "10000"))
+
+    # Signed bearer tokens (app/utils/auth_tokens.py)
+    ACCESS_TOKEN_TTL_SECONDS = int(os.getenv("ACCESS_TOKEN_TTL_SECONDS", "900"))
+    REFRESH_TOKEN_TTL_SECONDS = int(os.getenv("REFRESH_TOKEN_TTL_SECONDS", str(14 * 24 * 3600)))
+
+    # Login hardening (app/utils/password_hashing.py, app/utils/rate_limit.py)
+    PASSWORD_HASH_METHOD = os.getenv("PASSWORD_HASH_METHOD", "scrypt")
+    PASSWORD_HASH_WORKERS = int(os.getenv("PASSWORD_HASH_WORKERS", "2"))
+    PASSWORD_HASH_MAX_PENDING = int(os.getenv("PASSWORD_HASH_MAX_PENDING", "32"))
+    PASSWORD_HASH_TIMEOUT_SECONDS = float(os.getenv("PASSWORD_HASH_TIMEOUT_SECONDS", "10"))
+    LOGIN_RATE_LIMIT_PER_IP = int(os.getenv("LOGIN_RATE_LIMIT_PER_IP", "20"))
+    LOGIN_RATE_LIMIT_PER_EMAIL = int(os.getenv("LOGIN_RATE_LIMIT_PER_EMAIL", "5"))
+    LOGIN_RATE_LIMIT_WINDOW_SECONDS = float(os.getenv("LOGIN_RATE_LIMIT_WINDOW_SECONDS", "60"))
+
+    # Task codes reserved per sequence-table round trip (app/utils/code_allocator.py)
+    CODE_SEQUENCE_BLOCK_SIZE = int(os.getenv("CODE_SEQUENCE_BLOCK_SIZE", "50"))
+
+    # Max rows per bulk task import / update
+    TASK_BULK_MAX_ROWS = int(os.getenv("TASK_BULK_MAX_ROWS", "1000"))
+
+    # Rows fetched per server-side cursor batch for /api/exports streams
+    EXPORT_BATCH_SIZE = int(os.getenv("EXPORT_BATCH_SIZE", "1000"))
+
+    # Response compression (app/utils/compression.py); br / zstd need the brotli / zstandard packages
+    COMPRESSION_ENABLED = os.getenv("COMPRESSION_ENABLED", "true").lower() == "true"
+    COMPRESSION_ENCODINGS = os.getenv("COMPRESSION_ENCODINGS", "zstd,br,gzip")  # server preference order
+    COMPRESSION_MIN_SIZE = int(os.getenv("COMPRESSION_MIN_SIZE", "1024"))  # bytes; smaller bodies go out as-is
+    COMPRESSION_CACHE_BYTES = int(os.getenv("COMPRESSION_CACHE_BYTES", str(32 * 1024 * 1024)))  # ETag-keyed LRU
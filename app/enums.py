@@ -48,3 +48,9 @@ class UserRoleEnum(enum.Enum):
     employee = 'employee'
     salesman = 'salesman'
 
+
+class GenerationJobStatusEnum(enum.Enum):
+    pending = 'pending'
+    running = 'running'
+    done = 'done'
+    failed = 'failed'
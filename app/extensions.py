@@ -1,7 +1,8 @@
 from flask_sqlalchemy import SQLAlchemy
 from flask_migrate import Migrate
+from app.utils.db_routing import RoutingSession
 
-db = SQLAlchemy()
+db = SQLAlchemy(session_options={"class_": RoutingSession})
 migrate = Migrate()
 
 
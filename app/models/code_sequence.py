@@ -0,0 +1,11 @@
+from app.extensions import db
+
+
+class CodeSequence(db.Model):
+    __tablename__ = 'code_sequences'
+
+    prefix = db.Column(db.String(50), primary_key=True)  # e.g. "TSK"
+    next_value = db.Column(db.BigInteger, nullable=False, default=1)  # First value not yet handed out
+
+    def __repr__(self):
+        return f"<CodeSequence {self.prefix} - {self.next_value}>"
@@ -0,0 +1,18 @@
+from app.extensions import db
+from datetime import datetime, timezone
+
+
+class GeminiCacheEntry(db.Model):
+    __tablename__ = 'gemini_cache_entries'
+
+    key = db.Column(db.String(64), primary_key=True)  # sha256 of prompt kind + inputs + model
+
+    kind = db.Column(db.String(50), nullable=False)  # e.g. "job_feasibility", "proposal"
+    model = db.Column(db.String(100), nullable=False)
+    value = db.Column(db.JSON, nullable=False)  # Parsed Gemini result
+
+    created_at = db.Column(db.DateTime(timezone=True), default=lambda: datetime.now(timezone.utc), nullable=False)
+    expires_at = db.Column(db.DateTime(timezone=True), nullable=True)
+
+    def __repr__(self):
+        return f"<GeminiCacheEntry {self.kind} - {self.key[:12]}>"
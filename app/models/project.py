@@ -1,4 +1,6 @@
 from app.extensions import db
+from sqlalchemy.dialects import mysql
+from sqlalchemy import event, inspect
 from datetime import datetime, timezone
 from app.enums import ProjectStatusEnum
 
@@ -20,6 +22,14 @@ class Project(db.Model):
     start_date = db.Column(db.DateTime, nullable=True)
     end_date = db.Column(db.DateTime, nullable=True)
     created_at = db.Column(db.DateTime(timezone=True), default=lambda: datetime.now(timezone.utc))
+    # Row version for ETags; microsecond precision on MySQL so back-to-back edits differ
+    updated_at = db.Column(
+        db.DateTime(timezone=True).with_variant(mysql.DATETIME(timezone=True, fsp=6), 'mysql'),
+        default=lambda: datetime.now(timezone.utc),
+        onupdate=lambda: datetime.now(timezone.utc),
+        nullable=False,
+        index=True
+    )
 
     # Relationships
     job = db.relationship('UpworkJob', backref=db.backref('projects', cascade='all, delete-orphan'))
@@ -28,4 +38,31 @@ class Project(db.Model):
     proposal = db.relationship('Proposal', backref=db.backref('project', uselist=False, cascade='all, delete-orphan'))
 
     def __repr__(self):
-        return f"<Project {self.id} - {self.name}>"
\ No newline at end of file
+        return f"<Project {self.id} - {self.name}>"
+
+
+@event.listens_for(Project, 'after_insert')
+def create_project_stats(mapper, connection, target):
+    # local import here to avoid circular import
+    from app.utils.project_stats import rebuild_project_stats
+
+    rebuild_project_stats(connection, [target.id])
+
+
+@event.listens_for(Project, 'after_update')
+def move_project_stats(mapper, connection, target):
+    # local import here to avoid circular import
+    from app.utils.project_stats import rebuild_project_stats
+
+    state = inspect(target)
+    if state.attrs.workspace_id.history.has_changes() or state.attrs.job_id.history.has_changes():
+        rebuild_project_stats(connection, [target.id])
+
+
+@event.listens_for(Project, 'after_delete')
+def delete_project_stats(mapper, connection, target):
+    # local import here to avoid circular import
+    from app.models.project_stats import ProjectStats
+
+    connection.execute(ProjectStats.__table__.delete().where(ProjectStats.__table__.c.project_id == target.id))
+
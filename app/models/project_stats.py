@@ -0,0 +1,30 @@
+from app.extensions import db
+from datetime import datetime, timezone
+
+
+class ProjectStats(db.Model):
+    """Materialized per-project rollup, kept current by Task / Proposal events (see app/utils/project_stats.py)."""
+    __tablename__ = 'project_stats'
+
+    project_id = db.Column(db.Integer, db.ForeignKey('projects.id', ondelete='CASCADE'), primary_key=True)
+    workspace_id = db.Column(db.Integer, db.ForeignKey('workspaces.id', ondelete='CASCADE'), nullable=False, index=True)
+
+    # Task counts, one column per TaskStatusEnum value
+    total_tasks = db.Column(db.Integer, nullable=False, default=0)
+    backlog_tasks = db.Column(db.Integer, nullable=False, default=0)
+    todo_tasks = db.Column(db.Integer, nullable=False, default=0)
+    in_progress_tasks = db.Column(db.Integer, nullable=False, default=0)
+    in_review_tasks = db.Column(db.Integer, nullable=False, default=0)
+    done_tasks = db.Column(db.Integer, nullable=False, default=0)
+
+    # Proposals for the project's Upwork job
+    proposal_count = db.Column(db.Integer, nullable=False, default=0)
+    accepted_proposals = db.Column(db.Integer, nullable=False, default=0)
+    expected_earnings = db.Column(db.Numeric(12, 2), nullable=False, default=0)  # Sum over accepted proposals
+    feasibility_score_sum = db.Column(db.Float, nullable=False, default=0)
+    feasibility_score_count = db.Column(db.Integer, nullable=False, default=0)
+
+    updated_at = db.Column(db.DateTime(timezone=True), default=lambda: datetime.now(timezone.utc), nullable=False)
+
+    def __repr__(self):
+        return f"<ProjectStats {self.project_id} - {self.done_tasks}/{self.total_tasks} done>"
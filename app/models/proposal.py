@@ -1,10 +1,16 @@
 from app.extensions import db
+from sqlalchemy.dialects import mysql
+from sqlalchemy import event, inspect
 from datetime import datetime, timezone
 from app.enums import ContractTypeEnum, ProposalStatusEnum
 
 
 class Proposal(db.Model):
     __tablename__ = 'proposals'
+    __table_args__ = (
+        # Full-text search (MySQL only, see app/utils/search.py)
+        db.Index('ft_proposals_proposal_cover_letter', 'proposal', 'cover_letter', mysql_prefix='FULLTEXT'),
+    )
 
     id = db.Column(db.Integer, primary_key=True)  # Unique ID for each proposal
 
@@ -31,10 +37,40 @@ class Proposal(db.Model):
     # Other Info
     tags = db.Column(db.JSON, nullable=True)  # Skills or keywords extracted from job
     created_at = db.Column(db.DateTime(timezone=True), default=lambda: datetime.now(timezone.utc), nullable=False)  # Timestamp when proposal was created
+    # Row version for ETags; microsecond precision on MySQL so back-to-back edits differ
+    updated_at = db.Column(
+        db.DateTime(timezone=True).with_variant(mysql.DATETIME(timezone=True, fsp=6), 'mysql'),
+        default=lambda: datetime.now(timezone.utc),
+        onupdate=lambda: datetime.now(timezone.utc),
+        nullable=False,
+        index=True
+    )
 
     # Relationships
     job = db.relationship('UpworkJob', backref=db.backref('proposals', cascade='all, delete-orphan'))
     creator = db.relationship('User', backref=db.backref('proposals', cascade='all, delete-orphan'))
 
     def __repr__(self):
-        return f"<Proposal {self.id} - Job {self.job_id}>"
\ No newline at end of file
+        return f"<Proposal {self.id} - Job {self.job_id}>"
+
+
+# Proposal columns of project_stats are recomputed per job (a job has a handful of proposals)
+@event.listens_for(Proposal, 'after_insert')
+@event.listens_for(Proposal, 'after_delete')
+def refresh_stats_for_proposal(mapper, connection, target):
+    # local import here to avoid circular import
+    from app.utils.project_stats import refresh_proposal_stats
+
+    refresh_proposal_stats(connection, [target.job_id])
+
+
+@event.listens_for(Proposal, 'after_update')
+def refresh_stats_for_updated_proposal(mapper, connection, target):
+    # local import here to avoid circular import
+    from app.utils.project_stats import refresh_proposal_stats
+
+    state = inspect(target)
+    tracked = ('job_id', 'status', 'expected_earnings', 'feasibility_score')
+    if any(state.attrs[name].history.has_changes() for name in tracked):
+        refresh_proposal_stats(connection, [target.job_id, *state.attrs.job_id.history.deleted])
+
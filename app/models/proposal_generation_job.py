@@ -0,0 +1,32 @@
+from app.extensions import db
+from datetime import datetime, timezone
+from app.enums import GenerationJobStatusEnum
+
+
+class ProposalGenerationJob(db.Model):
+    __tablename__ = 'proposal_generation_jobs'
+    __table_args__ = (
+        db.Index('ix_proposal_generation_jobs_status_id', 'status', 'id'),  # worker polling
+    )
+
+    id = db.Column(db.Integer, primary_key=True)
+
+    upwork_job_id = db.Column(db.Integer, db.ForeignKey('upwork_jobs.id'), nullable=False)
+    requested_by = db.Column(db.Integer, db.ForeignKey('users.id'), nullable=False)
+    proposal_id = db.Column(db.Integer, db.ForeignKey('proposals.id'), nullable=True)  # Set once done
+
+    status = db.Column(db.Enum(GenerationJobStatusEnum), default=GenerationJobStatusEnum.pending, nullable=False)
+    error = db.Column(db.Text, nullable=True)  # Failure reason when status is failed
+    refresh = db.Column(db.Boolean, default=False, nullable=False)  # Bypass cached Gemini drafts
+
+    created_at = db.Column(db.DateTime(timezone=True), default=lambda: datetime.now(timezone.utc), nullable=False)
+    started_at = db.Column(db.DateTime(timezone=True), nullable=True)
+    finished_at = db.Column(db.DateTime(timezone=True), nullable=True)
+
+    # Relationships
+    job = db.relationship('UpworkJob', backref=db.backref('proposal_generation_jobs', cascade='all, delete-orphan'))
+    requester = db.relationship('User', backref=db.backref('proposal_generation_jobs', cascade='all, delete-orphan'))
+    proposal = db.relationship('Proposal')
+
+    def __repr__(self):
+        return f"<ProposalGenerationJob {self.id} - {self.status.value}>"
@@ -1,10 +1,18 @@
 from app.extensions import db
+from sqlalchemy.dialects import mysql
+from sqlalchemy import event, inspect
 from datetime import datetime, timezone
 from app.enums import TaskPriorityEnum, TaskStatusEnum
 
 
 class Task(db.Model):
     __tablename__ = 'tasks'
+    __table_args__ = (
+        # Board columns: one project, one status, newest first
+        db.Index('ix_tasks_project_status_created', 'project_id', 'status', 'created_at', 'id'),
+        # Overdue counts for dashboard rollups
+        db.Index('ix_tasks_project_due', 'project_id', 'due_date', 'status'),
+    )
 
     id = db.Column(db.Integer, primary_key=True)
 
@@ -21,6 +29,14 @@ class Task(db.Model):
 
     due_date = db.Column(db.DateTime, nullable=True)
     created_at = db.Column(db.DateTime(timezone=True), default=lambda: datetime.now(timezone.utc))
+    # Row version for ETags; microsecond precision on MySQL so back-to-back edits differ
+    updated_at = db.Column(
+        db.DateTime(timezone=True).with_variant(mysql.DATETIME(timezone=True, fsp=6), 'mysql'),
+        default=lambda: datetime.now(timezone.utc),
+        onupdate=lambda: datetime.now(timezone.utc),
+        nullable=False,
+        index=True
+    )
 
     # Relationships
     project = db.relationship('Project', backref=db.backref('tasks', cascade='all, delete-orphan'))
@@ -29,4 +45,47 @@ class Task(db.Model):
 
     def __repr__(self):
         return f"<Task {self.task_code} - {self.title}>"
-    
+
+
+# Keep the materialized project_stats counters in step with task writes
+@event.listens_for(Task, 'after_insert')
+def add_task_to_project_stats(mapper, connection, target):
+    # local import here to avoid circular import
+    from app.utils.project_stats import apply_task_change
+
+    apply_task_change(connection, new=(target.project_id, target.status))
+
+
+@event.listens_for(Task, 'after_update')
+def move_task_in_project_stats(mapper, connection, target):
+    # local import here to avoid circular import
+    from app.utils.project_stats import apply_task_change, as_status, rebuild_project_stats
+
+    state = inspect(target)
+    project_history = state.attrs.project_id.history
+    status_history = state.attrs.status.history
+    if not (project_history.has_changes() or status_history.has_changes()):
+        return
+
+    if (project_history.has_changes() and not project_history.deleted) or \
+            (status_history.has_changes() and not status_history.deleted):
+        # Previous value was never loaded, so recount the affected projects
+        rebuild_project_stats(connection, [target.project_id, *project_history.deleted])
+        return
+
+    old_project = project_history.deleted[0] if project_history.deleted else target.project_id
+    old_status = status_history.deleted[0] if status_history.deleted else target.status
+    apply_task_change(
+        connection,
+        old=(old_project, as_status(old_status)),
+        new=(target.project_id, as_status(target.status))
+    )
+
+
+@event.listens_for(Task, 'after_delete')
+def remove_task_from_project_stats(mapper, connection, target):
+    # local import here to avoid circular import
+    from app.utils.project_stats import apply_task_change
+
+    apply_task_change(connection, old=(target.project_id, target.status))
+
@@ -1,9 +1,22 @@
 from app.extensions import db
+from sqlalchemy.dialects import mysql
 from datetime import datetime, timezone
 from app.enums import BudgetTypeEnum, FeasibilityEnum
 
 class UpworkJob(db.Model):
     __tablename__ = 'upwork_jobs'
+    __table_args__ = (
+        db.Index('ix_upwork_jobs_created_at_id', 'created_at', 'id'),  # keyset pagination
+        # Server-side filters: equality column first, then the default sort / range column
+        db.Index('ix_upwork_jobs_feasibility_created', 'feasibility_status', 'created_at', 'id'),
+        db.Index('ix_upwork_jobs_budget_type_budget', 'budget_type', 'budget', 'id'),
+        db.Index('ix_upwork_jobs_country_created', 'client_country', 'created_at', 'id'),
+        db.Index('ix_upwork_jobs_category_created', 'category', 'created_at', 'id'),
+        db.Index('ix_upwork_jobs_budget_id', 'budget', 'id'),
+        db.Index('ix_upwork_jobs_posted_at_id', 'posted_at', 'id'),
+        # Full-text search (MySQL only, see app/utils/search.py)
+        db.Index('ft_upwork_jobs_title_description', 'title', 'description', mysql_prefix='FULLTEXT'),
+    )
 
     id = db.Column(db.Integer, primary_key=True)
     job_id = db.Column(db.String(50), unique=True, nullable=False)
@@ -43,6 +56,14 @@ class UpworkJob(db.Model):
     feasibility_status = db.Column(db.Enum(FeasibilityEnum), default=FeasibilityEnum.pending, nullable=False)
 
     created_at = db.Column(db.DateTime(timezone=True), default=lambda: datetime.now(timezone.utc))
+    # Row version for ETags; microsecond precision on MySQL so back-to-back edits differ
+    updated_at = db.Column(
+        db.DateTime(timezone=True).with_variant(mysql.DATETIME(timezone=True, fsp=6), 'mysql'),
+        default=lambda: datetime.now(timezone.utc),
+        onupdate=lambda: datetime.now(timezone.utc),
+        nullable=False,
+        index=True
+    )
 
     def __repr__(self):
         return f"<UpworkJob {self.job_id} - {self.title}>"
\ No newline at end of file
@@ -2,6 +2,8 @@ from app.extensions import db
 from datetime import datetime, timezone
 from app.enums import UserRoleEnum
 from flask_login import UserMixin
+from sqlalchemy import event, inspect
+from sqlalchemy.orm import Session
 
 class User(db.Model, UserMixin):
     __tablename__ = 'users'
@@ -22,4 +24,48 @@ class User(db.Model, UserMixin):
     created_at = db.Column(db.DateTime(timezone=True), default=lambda: datetime.now(timezone.utc))
 
     def __repr__(self):
-        return f"<User {self.id} - {self.email}>"
\ No newline at end of file
+        return f"<User {self.id} - {self.email}>"
+
+
+# Drop the cached Flask-Login snapshot when a user changes (role, is_active, ...),
+# once the change is committed; before that, a concurrent load_user would
+# re-cache the old row
+@event.listens_for(User, 'after_update')
+@event.listens_for(User, 'after_delete')
+def invalidate_cached_user(mapper, connection, target):
+    session = inspect(target).session
+    if session is not None:
+        session.info.setdefault("invalidate_user_ids", set()).add(target.id)
+
+
+@event.listens_for(Session, 'after_commit')
+def invalidate_committed_users(session):
+    # local import here to avoid circular import
+    from app.utils.user_cache import user_cache
+
+    for user_id in session.info.pop("invalidate_user_ids", ()):
+        user_cache.invalidate(user_id)
+
+
+# Role or active-flag changes invalidate every signed token issued before them,
+# once the change is committed
+@event.listens_for(User, 'after_update')
+def revoke_tokens_on_privilege_change(mapper, connection, target):
+    state = inspect(target)
+    if state.session and (state.attrs.role.history.has_changes() or state.attrs.is_active.history.has_changes()):
+        state.session.info.setdefault("revoke_user_ids", set()).add(target.id)
+
+
+@event.listens_for(Session, 'after_commit')
+def revoke_committed_user_tokens(session):
+    # local import here to avoid circular import
+    from app.utils.auth_tokens import revocation_list
+
+    for user_id in session.info.pop("revoke_user_ids", ()):
+        revocation_list.revoke_user(user_id)
+
+
+@event.listens_for(Session, 'after_rollback')
+def discard_pending_user_changes(session):
+    session.info.pop("invalidate_user_ids", None)
+    session.info.pop("revoke_user_ids", None)
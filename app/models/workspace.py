@@ -1,4 +1,5 @@
 from app.extensions import db
+from sqlalchemy.dialects import mysql
 from datetime import datetime, timezone
 from sqlalchemy import event
 
@@ -14,6 +15,14 @@ class Workspace(db.Model):
     invite_code = db.Column(db.String(50), unique=True, nullable=False)
     
     created_at = db.Column(db.DateTime(timezone=True), default=lambda: datetime.now(timezone.utc))
+    # Row version for ETags; microsecond precision on MySQL so back-to-back edits differ
+    updated_at = db.Column(
+        db.DateTime(timezone=True).with_variant(mysql.DATETIME(timezone=True, fsp=6), 'mysql'),
+        default=lambda: datetime.now(timezone.utc),
+        onupdate=lambda: datetime.now(timezone.utc),
+        nullable=False,
+        index=True
+    )
 
     def __repr__(self):
         return f"<Workspace {self.id} - {self.name}>"
@@ -22,7 +31,7 @@ class Workspace(db.Model):
 @event.listens_for(Workspace, 'before_insert')
 def add_invite_code(mapper, connection, target):
     # local import here to avoid circular import
-    from app.utils.invite_code import generate_unique_invite_code
+    from app.utils.invite_code import generate_invite_code
 
     if not target.invite_code:
-        target.invite_code = generate_unique_invite_code(target.name)
+        target.invite_code = generate_invite_code(target.name)
@@ -1,10 +1,17 @@
-from flask import Blueprint, request, jsonify
+from flask import Blueprint, current_app, request, jsonify
 from flask_login import login_user, login_required, logout_user, current_user
-from werkzeug.security import generate_password_hash, check_password_hash
+import math
+from sqlalchemy.exc import SQLAlchemyError
 from app.extensions import db
 from app.models.user import User
 from app.enums import UserRoleEnum
 from app.utils.role_required import role_required
+from app.utils.password_hashing import HashingBusy, password_hasher
+from app.utils.rate_limit import login_limiters
+from app.utils.user_cache import user_cache
+from app.utils.auth_tokens import (
+    ACCESS, REFRESH, TokenError, issue_token_pair, revoke_token, verify_token
+)
 
 auth_bp = Blueprint('auth', __name__)
 
@@ -25,7 +32,7 @@ def register():
 
     try:
         # Ensure password_hash gets hashed before creation
-        data['password'] = generate_password_hash(data['password'])  # You keep using "password" in input
+        data['password'] = password_hasher.hash(data['password'])  # You keep using "password" in input
         data['role'] = data.get('role', 'employee')
 
         validated_data = user_schema.load(data)
@@ -43,6 +50,8 @@ def register():
 
     except ValidationError as e:
         return jsonify({"errors": e.messages}), 400
+    except HashingBusy:
+        return jsonify({"error": "Service busy, please retry shortly."}), 503
     except Exception as e:
         db.session.rollback()
         return jsonify({"error": f"Internal error: {str(e)}"}), 500
@@ -50,32 +59,78 @@ def register():
 
 
 
-@auth_bp.route('/login', methods=['POST'])
-def login():
-    data = request.json or {}
+def authenticate(data):
+    """
+    Shared credential check for /login and /token.
 
+    Returns (user, None) on success or (None, error_response).
+    """
     email = data.get("email")
     password = data.get("password")
 
     if not email or not password:
-        return jsonify({
+        return None, (jsonify({
             "error": "Validation error",
             "message": "Both email and password are required."
-        }), 400
+        }), 400)
+
+    # Throttle per IP and per account before spending any CPU on hashing
+    for kind, value in (("ip", request.remote_addr), ("email", email.strip().lower())):
+        allowed, retry_after = login_limiters[kind].hit(f"{kind}:{value}")
+        if not allowed:
+            response = jsonify({
+                "error": "Too many login attempts",
+                "message": "Please wait before trying again."
+            })
+            response.headers["Retry-After"] = str(max(1, math.ceil(retry_after)))
+            return None, (response, 429)
 
     user = User.query.filter_by(email=email).first()
 
-    if not user or not check_password_hash(user.password, password):
-        return jsonify({
+    try:
+        if user:
+            valid = password_hasher.verify(user.password, password)
+        else:
+            valid = password_hasher.verify_dummy(password)
+    except HashingBusy:
+        response = jsonify({
+            "error": "Service busy",
+            "message": "Too many concurrent logins. Please retry shortly."
+        })
+        response.headers["Retry-After"] = "1"
+        return None, (response, 503)
+
+    if not valid:
+        return None, (jsonify({
             "error": "Authentication failed",
             "message": "Invalid email or password."
-        }), 401
+        }), 401)
 
     if not user.is_active:
-        return jsonify({
+        return None, (jsonify({
             "error": "Account deactivated",
             "message": "Your account is deactivated. Please contact admin."
-        }), 403
+        }), 403)
+
+    # Transparently upgrade hashes made with an older policy
+    if password_hasher.needs_rehash(user.password):
+        user_id = user.id
+        try:
+            user.password = password_hasher.hash(password)
+            db.session.commit()
+        except (SQLAlchemyError, HashingBusy):
+            # The login itself succeeded; the upgrade is retried on the next one
+            db.session.rollback()
+            current_app.logger.exception("Password rehash skipped for user %s", user_id)
+
+    return user, None
+
+
+@auth_bp.route('/login', methods=['POST'])
+def login():
+    user, error = authenticate(request.json or {})
+    if error:
+        return error
 
     login_user(user)
 
@@ -95,11 +150,77 @@ def logout():
 @auth_bp.route('/current-user', methods=['GET'])
 @login_required
 def get_profile():
+    # Bearer snapshots carry no profile fields, so read them via the user cache
+    user = user_cache.get(current_user.id, lambda pk: db.session.get(User, pk))
+    if user is None:
+        return jsonify({"error": "User not found"}), 404
+
+    return jsonify({
+        "id": user.id,
+        "first_name": user.first_name,
+        "last_name": user.last_name,
+        "email": user.email,
+        "profile_image_url": user.profile_image_url,
+        "role": user.role.value
+    })
+
+
+@auth_bp.route('/token', methods=['POST'])
+def issue_tokens():
+    """Stateless alternative to /login: returns signed access + refresh tokens."""
+    user, error = authenticate(request.json or {})
+    if error:
+        return error
+
     return jsonify({
-        "id": current_user.id,
-        "first_name": current_user.first_name,
-        "last_name": current_user.last_name,
-        "email": current_user.email,
-        "profile_image_url": current_user.profile_image_url,
-        "role": current_user.role.value
-    })
\ No newline at end of file
+        "message": "Login successful",
+        **issue_token_pair(user),
+        "user": user_schema.dump(user)
+    }), 200
+
+
+@auth_bp.route('/token/refresh', methods=['POST'])
+def refresh_tokens():
+    data = request.json or {}
+    refresh_token = data.get("refresh_token")
+    if not refresh_token:
+        return jsonify({"error": "Validation error", "message": "refresh_token is required."}), 400
+
+    try:
+        claims = verify_token(refresh_token, REFRESH)
+    except TokenError as e:
+        return jsonify({"error": "Authentication failed", "message": str(e)}), 401
+
+    # Re-read the user once per refresh so role / active changes are picked up
+    user = db.session.get(User, claims["sub"])
+    if not user or not user.is_active:
+        return jsonify({"error": "Authentication failed", "message": "User is no longer active."}), 401
+
+    # Refresh tokens are single use within what the revocation store can see:
+    # per process with the default MemoryRevocationStore
+    revoke_token(claims, REFRESH)
+    return jsonify(issue_token_pair(user)), 200
+
+
+@auth_bp.route('/token/revoke', methods=['POST'])
+def revoke_tokens():
+    """Revoke the bearer access token and, if given, a refresh token."""
+    data = request.json or {}
+    revoked = []
+
+    scheme, _, access_token = request.headers.get("Authorization", "").partition(" ")
+    candidates = [(access_token.strip(), ACCESS)] if scheme.lower() == "bearer" and access_token else []
+    if data.get("refresh_token"):
+        candidates.append((data["refresh_token"], REFRESH))
+
+    if not candidates:
+        return jsonify({"error": "Validation error", "message": "No token to revoke."}), 400
+
+    for token, kind in candidates:
+        try:
+            revoke_token(verify_token(token, kind), kind)
+            revoked.append(kind)
+        except TokenError as e:
+            return jsonify({"error": "Invalid token", "message": f"{kind} token: {str(e)}"}), 401
+
+    return jsonify({"message": "Token(s) revoked.", "revoked": revoked}), 200
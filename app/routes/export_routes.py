@@ -0,0 +1,79 @@
+from flask import Blueprint, request, jsonify, Response, current_app, stream_with_context
+from flask_login import login_required
+from datetime import datetime, timezone
+from app.extensions import db
+from app.models.upwork_job import UpworkJob
+from app.models.proposal import Proposal
+from app.models.task import Task
+from app.schemas.upwork_jobs_schema import UpworkJobSchema
+from app.schemas.proposal_schema import ProposalSchema
+from app.schemas.task_schema import TaskSchema
+from app.enums import UserRoleEnum
+from app.utils.role_required import role_required
+from app.utils.db_routing import read_replica
+from app.utils.fast_serializer import compile_schema
+from app.utils.exports import EXPORT_FORMATS
+
+export_bp = Blueprint('export', __name__)
+
+EXPORTABLE = {
+    "upwork_jobs": (UpworkJob, UpworkJobSchema),
+    "proposals": (Proposal, ProposalSchema),
+    "tasks": (Task, TaskSchema),
+}
+
+
+@export_bp.route('/<string:resource>', methods=['GET'])
+@login_required
+@role_required(UserRoleEnum.admin)
+@read_replica
+def export_resource(resource):
+    """
+    Stream a full table export.
+
+    Query params:
+      format - "ndjson" (default), "json" (one array) or "csv"
+
+    Rows are fetched from a server-side cursor in EXPORT_BATCH_SIZE batches
+    (yield_per), so memory stays flat and the first bytes go out immediately.
+    """
+    if resource not in EXPORTABLE:
+        return jsonify({"error": f"Unknown export '{resource}'. Use one of {sorted(EXPORTABLE)}."}), 404
+
+    export_format = request.args.get("format", "ndjson")
+    if export_format not in EXPORT_FORMATS:
+        return jsonify({"error": f"format must be one of {sorted(EXPORT_FORMATS)}."}), 400
+    chunks, mimetype, extension = EXPORT_FORMATS[export_format]
+
+    model, schema_class = EXPORTABLE[resource]
+    serializer = compile_schema(schema_class)
+    batch_size = current_app.config["EXPORT_BATCH_SIZE"]
+
+    try:
+        # Executed here (not in the generator) so @read_replica routing and errors apply up front
+        result = db.session.execute(
+            serializer.select().order_by(model.id).execution_options(yield_per=batch_size)
+        )
+    except Exception as e:
+        return jsonify({"error": f"Internal server error: {str(e)}"}), 500
+
+    dumps = current_app.json.dumps
+
+    def generate():
+        try:
+            yield from chunks(result.partitions(), serializer, dumps)
+        except Exception:
+            # Headers are already sent; a truncated body is the only signal left
+            current_app.logger.exception("Export of %s failed mid-stream", resource)
+        finally:
+            result.close()
+
+    filename = f"{resource}-{datetime.now(timezone.utc):%Y%m%d-%H%M%S}.{extension}"
+    return Response(
+        stream_with_context(generate()),
+        mimetype=mimetype,
+        headers={
+            "Content-Disposition": f'attachment; filename="{filename}"',
+            "X-Accel-Buffering": "no"
+        }
+    )
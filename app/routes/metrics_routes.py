@@ -0,0 +1,31 @@
+from flask import Blueprint, request, jsonify
+from flask_login import login_required
+from app.enums import UserRoleEnum
+from app.utils.role_required import role_required
+from app.utils.sql_profiler import route_metrics
+from app.utils.db_pool import pool_metrics
+from app.utils.compression import response_compressor
+from app.utils.gemini_gateway import gemini_gateway
+
+metrics_bp = Blueprint('metrics', __name__)
+
+
+@metrics_bp.route('/', methods=['GET'])
+@login_required
+@role_required(UserRoleEnum.admin)
+def get_metrics():
+    return jsonify({
+        "routes": route_metrics.snapshot(),
+        "db_pool": pool_metrics.snapshot(),
+        "compression": response_compressor.stats(),
+        "gemini": gemini_gateway.snapshot()
+    }), 200
+
+
+@metrics_bp.route('/', methods=['DELETE'])
+@login_required
+@role_required(UserRoleEnum.admin)
+def reset_metrics():
+    route_metrics.reset()
+    gemini_gateway.metrics.reset()
+    return jsonify({"message": "Metrics reset."}), 200
@@ -1,5 +1,6 @@
 from flask import Blueprint, request, jsonify
 from flask_login import login_required, current_user
+from sqlalchemy.orm import raiseload
 from app.extensions import db
 from app.models.project import Project
 from app.models.workspace_member import WorkspaceMember
@@ -7,10 +8,12 @@ from app.schemas.project_schema import ProjectSchema
 from app.schemas.user_schema import UserSchema
 from app.enums import UserRoleEnum
 from app.utils.role_required import role_required
+from app.utils.db_routing import read_replica
+from app.utils.http_cache import conditional_get, row_validators, table_validators
 from app.models.user import User
-from app.utils.invite_code import generate_unique_invite_code
 from app.models.project_member import ProjectMember
 from app.schemas.project_member_schema import ProjectMemberSchema
+from app.utils.project_stats import project_rollup
 
 project_bp = Blueprint('project', __name__)
 
@@ -59,6 +62,7 @@ def create_project():
 @project_bp.route('/<int:project_id>', methods=['GET'])
 @login_required
 @role_required(UserRoleEnum.admin, UserRoleEnum.team_lead)
+@conditional_get(row_validators(Project, 'project_id'))
 def get_project_by_id(project_id):
     try:
         project = Project.query.get(project_id)
@@ -74,9 +78,30 @@ def get_project_by_id(project_id):
     
 
 
+@project_bp.route('/<int:project_id>/stats', methods=['GET'])
+@login_required
+@role_required(UserRoleEnum.admin, UserRoleEnum.team_lead)
+def get_project_stats(project_id):
+    """Dashboard rollup read from the materialized project_stats row."""
+    try:
+        if not db.session.query(Project.id).filter_by(id=project_id).first():
+            return jsonify({"error": f"Project with ID {project_id} not found."}), 404
+
+        return jsonify({
+            "stats": project_rollup(db.session, project_id)
+        }), 200
+
+    except Exception as e:
+        db.session.rollback()
+        return jsonify({"error": f"Internal server error: {str(e)}"}), 500
+
+
+
 @project_bp.route('/', methods=['GET'])
 @login_required
 @role_required(UserRoleEnum.admin, UserRoleEnum.team_lead)
+@read_replica
+@conditional_get(table_validators(Project))
 def get_all_projects():
     try:
         projects = Project.query.all()
@@ -223,7 +248,8 @@ def list_project_members(project_id):
         if not project:
             return jsonify({"error": f"Project with ID {project_id} not found."}), 404
 
-        members = ProjectMember.query.filter_by(project_id=project_id).all()
+        # Only column data is serialized; raiseload guards against lazy loads creeping in
+        members = ProjectMember.query.filter_by(project_id=project_id).options(raiseload('*')).all()
         return jsonify({
             "project_id": project_id,
             "members": project_members_list_schema.dump(members)
@@ -1,19 +1,34 @@
-from flask import Blueprint, request, jsonify
+from flask import Blueprint, request, jsonify, url_for, Response, stream_with_context, current_app
+from datetime import datetime, timezone
+from sqlalchemy import insert
+import json
 from flask_login import login_required, current_user
 from app.extensions import db
 from app.models.proposal import Proposal
 from app.models.upwork_job import UpworkJob
 from app.schemas.proposal_schema import ProposalSchema
-from app.utils.gemini import assess_proposal_from_job, extract_json_from_text
-from app.enums import ProposalStatusEnum
+from app.utils.gemini import (
+    assess_proposal_from_job, assess_proposals_from_jobs, extract_json_from_text,
+    invalidate_proposal_cache, stream_proposal_from_job
+)
 from app.enums import UserRoleEnum
 from app.utils.role_required import role_required
+from app.utils.db_routing import read_replica
+from app.utils.http_cache import conditional_get, row_validators, table_validators
+from app.utils.search import get_search_service
+from app.utils.proposal_generation import build_job_data, build_proposal
+from app.utils.proposal_queue import proposal_queue
+from app.utils.project_stats import refresh_proposal_stats
+from app.utils.fast_serializer import compile_schema
+from app.models.proposal_generation_job import ProposalGenerationJob
+from app.schemas.proposal_generation_job_schema import ProposalGenerationJobSchema
 
 
 proposal_bp = Blueprint('proposal', __name__)
 
 proposal_schema = ProposalSchema(session=db.session)
 proposal_list_schema = ProposalSchema(many=True)
+generation_job_schema = ProposalGenerationJobSchema()
 
 
 @proposal_bp.route('/from-job/<string:job_id>', methods=['POST'])
@@ -27,35 +42,11 @@ def generate_proposal_from_job(job_id):
             return jsonify({"error": f"Upwork job with ID '{job_id}' not found"}), 404
 
         # 2. Prepare data for Gemini (cleaned + no duplicate keys)
-        job_data = {
-            "job_id": job.job_id,
-            "title": job.title,
-            "description": job.description,
-            "skills": job.skills,
-            "category": job.category,
-            "budget": float(job.budget or 0),
-            "budget_type": job.budget_type.value if job.budget_type else None,
-            "project_length": job.project_length,
-            "hours_per_week": job.hours_per_week,
-            "client_country": job.client_country,
-            "client_payment_verified": job.client_payment_verified,
-            "client_total_spent": float(job.client_total_spent or 0),
-            "client_jobs_posted": job.client_jobs_posted,
-            "client_hire_rate": job.client_hire_rate,
-            "connect_required": job.connect_required,
-            "expected_cost": float(job.expected_cost or 0),
-            "expected_earnings": float(job.expected_earnings or 0),
-            "feasibility_status": job.feasibility_status.value if job.feasibility_status else None,
-            "tags": job.tags,
-            "posted_at": str(job.posted_at) if job.posted_at else None,
-            "client_reviews": job.client_reviews,
-            "proposals_submitted": job.proposals_submitted,
-            "interviewing": job.interviewing,
-            "invites_sent": job.invites_sent,
-            "job_url": job.job_url
-        }
-
-        # 3. AI processing
+        job_data = build_job_data(job)
+
+        # 3. AI processing (pass ?refresh=true to bypass a cached draft)
+        if request.args.get("refresh", "").lower() == "true":
+            invalidate_proposal_cache(job_data)
         ai_result = assess_proposal_from_job(job_data)
         # print(ai_result)
 
@@ -67,27 +58,13 @@ def generate_proposal_from_job(job_id):
             print("Error:", e)
 
         # 4. Create proposal record
-        proposal_data = Proposal(
-            job_id=job.id,
-            generated_by=current_user.id,
-            cover_letter=parsed_data["cover_letter"],
-            proposal=parsed_data["proposal"],
-            feasibility_score=parsed_data["feasibility_score"],
-            feasibility_reason=parsed_data["feasibility_reason"],
-            connects_required=job.connect_required,
-            expected_cost=job.expected_cost,
-            expected_earnings=job.expected_earnings,
-            job_description=job.description,
-            summary=parsed_data["summary"],
-            project_duration=parsed_data["project_duration"],
-            overall_score=parsed_data["overall_score"],
-            tags=job.skills,
-            status=ProposalStatusEnum.draft
-        )
+        proposal_data = build_proposal(job, current_user.id, parsed_data)
 
         db.session.add(proposal_data)
         db.session.commit()
 
+        get_search_service("proposals").index(proposal_data)
+
         return jsonify({
             "message": "Proposal generated successfully using Gemini AI.",
             "proposal": proposal_schema.dump(proposal_data)
@@ -100,15 +77,207 @@ def generate_proposal_from_job(job_id):
 
 
 
+@proposal_bp.route('/batch', methods=['POST'])
+@login_required
+@role_required(UserRoleEnum.admin, UserRoleEnum.team_lead, UserRoleEnum.salesman)
+def generate_proposals_batch():
+    """
+    Body: {"job_ids": ["upwork-job-id", ...], "parallelism": 5, "refresh": false}
+    """
+    data = request.json or {}
+    job_ids = data.get("job_ids")
+    max_jobs = current_app.config["PROPOSAL_BATCH_MAX_JOBS"]
+
+    if not isinstance(job_ids, list) or not job_ids or not all(isinstance(j, str) for j in job_ids):
+        return jsonify({"error": "'job_ids' must be a non-empty list of job ID strings."}), 400
+    job_ids = list(dict.fromkeys(job_ids))
+    if len(job_ids) > max_jobs:
+        return jsonify({"error": f"At most {max_jobs} jobs can be generated per batch."}), 400
+
+    try:
+        parallelism = int(data.get("parallelism", current_app.config["PROPOSAL_BATCH_CONCURRENCY"]))
+    except (TypeError, ValueError):
+        return jsonify({"error": "'parallelism' must be an integer."}), 400
+    parallelism = max(1, min(parallelism, current_app.config["PROPOSAL_BATCH_CONCURRENCY"]))
+
+    # 1. Load every job in one IN query
+    jobs_by_id = {job.job_id: job for job in UpworkJob.query.filter(UpworkJob.job_id.in_(job_ids))}
+    found_jobs = [jobs_by_id[job_id] for job_id in job_ids if job_id in jobs_by_id]
+    jobs_data = [build_job_data(job) for job in found_jobs]
+
+    if data.get("refresh"):
+        for job_data in jobs_data:
+            invalidate_proposal_cache(job_data)
+
+    # 2. Generate concurrently, one result (or exception) per job in input order
+    ai_results = assess_proposals_from_jobs(
+        jobs_data,
+        max_concurrency=parallelism,
+        timeout=current_app.config["GEMINI_TIMEOUT_SECONDS"]
+    )
+
+    results = {job_id: {"job_id": job_id, "status": "not_found", "error": "Upwork job not found."}
+               for job_id in job_ids if job_id not in jobs_by_id}
+    proposals = []
+    created_at = datetime.now(timezone.utc)
+    for job, ai_result in zip(found_jobs, ai_results):
+        if isinstance(ai_result, Exception):
+            results[job.job_id] = {"job_id": job.job_id, "status": "failed", "error": f"{type(ai_result).__name__}: {ai_result}"}
+            continue
+        proposal = build_proposal(job, current_user.id, ai_result)
+        proposal.created_at = proposal.updated_at = created_at
+        proposals.append(proposal)
+
+    # 3. Insert every proposal: one executemany INSERT ... RETURNING where the
+    #    dialect supports it (ids come back in row order); otherwise an ORM
+    #    flush, which reads each id back (MySQL has no RETURNING)
+    if proposals:
+        try:
+            connection = db.session.connection()
+            if connection.dialect.insert_executemany_returning_sort_by_parameter_order:
+                rows = [
+                    {column.key: getattr(proposal, column.key) for column in Proposal.__table__.columns if column.key != "id"}
+                    for proposal in proposals
+                ]
+                created_ids = db.session.execute(
+                    insert(Proposal).returning(Proposal.id, sort_by_parameter_order=True), rows
+                ).scalars().all()
+                # Core executemany skips ORM events, so refresh project_stats explicitly
+                refresh_proposal_stats(connection, {row["job_id"] for row in rows})
+            else:
+                db.session.add_all(proposals)
+                db.session.flush()
+                created_ids = [proposal.id for proposal in proposals]
+            db.session.commit()
+        except Exception as e:
+            db.session.rollback()
+            return jsonify({"error": f"Failed to save proposals: {str(e)}"}), 500
+
+        created = {proposal.id: proposal for proposal in Proposal.query.filter(Proposal.id.in_(created_ids))}
+        search_service = get_search_service("proposals")
+        jobs_by_pk = {job.id: job for job in found_jobs}
+        for proposal_id in created_ids:
+            proposal = created[proposal_id]
+            search_service.index(proposal)
+            job_id = jobs_by_pk[proposal.job_id].job_id
+            results[job_id] = {"job_id": job_id, "status": "created", "proposal": proposal_schema.dump(proposal)}
+
+    ordered = [results[job_id] for job_id in job_ids if job_id in results]
+    return jsonify({
+        "message": "Batch proposal generation complete.",
+        "created": sum(1 for r in ordered if r["status"] == "created"),
+        "failed": sum(1 for r in ordered if r["status"] != "created"),
+        "results": ordered
+    }), 207
+
+
+def _sse(event, data):
+    return f"event: {event}\ndata: {json.dumps(data)}\n\n"
+
+
+@proposal_bp.route('/from-job/<string:job_id>/stream', methods=['POST'])
+@login_required
+@role_required(UserRoleEnum.admin, UserRoleEnum.team_lead, UserRoleEnum.salesman)
+def stream_proposal_from_job_route(job_id):
+    """
+    Server-Sent Events:
+      event: delta  data: {"field": "cover_letter" | "proposal", "text": "..."}
+      event: done   data: {"proposal": {...}}   (after the Proposal row is saved)
+      event: error  data: {"error": "..."}
+    """
+    job = UpworkJob.query.filter_by(job_id=job_id).first()
+    if not job:
+        return jsonify({"error": f"Upwork job with ID '{job_id}' not found"}), 404
+
+    job_data = build_job_data(job)
+    if request.args.get("refresh", "").lower() == "true":
+        invalidate_proposal_cache(job_data)
+    user_id = current_user.id
+
+    def generate():
+        try:
+            parsed_data = None
+            for kind, field, payload in stream_proposal_from_job(job_data):
+                if kind == "delta":
+                    yield _sse("delta", {"field": field, "text": payload})
+                else:
+                    parsed_data = payload
+
+            proposal_data = build_proposal(job, user_id, parsed_data)
+            db.session.add(proposal_data)
+            db.session.commit()
+
+            get_search_service("proposals").index(proposal_data)
+
+            yield _sse("done", {"proposal": proposal_schema.dump(proposal_data)})
+
+        except Exception as e:
+            db.session.rollback()
+            yield _sse("error", {"error": f"Internal server error: {str(e)}"})
+
+    return Response(
+        stream_with_context(generate()),
+        mimetype='text/event-stream',
+        headers={"Cache-Control": "no-cache", "X-Accel-Buffering": "no"}
+    )
+
+
+@proposal_bp.route('/from-job/<string:job_id>/async', methods=['POST'])
+@login_required
+@role_required(UserRoleEnum.admin, UserRoleEnum.team_lead, UserRoleEnum.salesman)
+def enqueue_proposal_from_job(job_id):
+    job = UpworkJob.query.filter_by(job_id=job_id).first()
+    if not job:
+        return jsonify({"error": f"Upwork job with ID '{job_id}' not found"}), 404
+
+    try:
+        generation_job = ProposalGenerationJob(
+            upwork_job_id=job.id,
+            requested_by=current_user.id,
+            refresh=request.args.get("refresh", "").lower() == "true"
+        )
+        db.session.add(generation_job)
+        db.session.commit()
+    except Exception as e:
+        db.session.rollback()
+        return jsonify({"error": f"Internal server error: {str(e)}"}), 500
+
+    proposal_queue.enqueue(generation_job.id)
+
+    return jsonify({
+        "message": "Proposal generation queued.",
+        "generation_job": generation_job_schema.dump(generation_job),
+        "status_url": url_for('proposal.get_generation_job', generation_job_id=generation_job.id)
+    }), 202
+
+
+@proposal_bp.route('/generation-jobs/<int:generation_job_id>', methods=['GET'])
+@login_required
+@role_required(UserRoleEnum.admin, UserRoleEnum.team_lead, UserRoleEnum.salesman)
+def get_generation_job(generation_job_id):
+    generation_job = db.session.get(ProposalGenerationJob, generation_job_id)
+    if not generation_job:
+        return jsonify({"error": f"Generation job with ID {generation_job_id} not found."}), 404
+
+    response = {"generation_job": generation_job_schema.dump(generation_job)}
+    if generation_job.proposal:
+        response["proposal"] = proposal_schema.dump(generation_job.proposal)
+    return jsonify(response), 200
+
+
 @proposal_bp.route('/get-all', methods=['GET'])
 @login_required
 @role_required(UserRoleEnum.admin, UserRoleEnum.team_lead, UserRoleEnum.salesman)
+@read_replica
+@conditional_get(table_validators(Proposal))
 def get_all_proposals():
     try:
-        proposals = Proposal.query.order_by(Proposal.created_at.desc()).all()
+        # Row tuples + compiled serializer instead of ORM objects + ProposalSchema.dump
+        serializer = compile_schema(ProposalSchema)
+        rows = db.session.execute(serializer.select().order_by(Proposal.created_at.desc())).all()
         return jsonify({
-            "proposals": proposal_list_schema.dump(proposals),
-            "count": len(proposals)
+            "proposals": serializer.dump_rows(rows),
+            "count": len(rows)
         }), 200
     except Exception as e:
         return jsonify({"error": f"Internal server error: {str(e)}"}), 500
@@ -118,6 +287,7 @@ def get_all_proposals():
 @proposal_bp.route('/<int:proposal_id>', methods=['GET'])
 @login_required
 @role_required(UserRoleEnum.admin, UserRoleEnum.team_lead, UserRoleEnum.salesman)
+@conditional_get(row_validators(Proposal, 'proposal_id'))
 def get_proposal_by_id(proposal_id):
     try:
         proposal = Proposal.query.get(proposal_id)
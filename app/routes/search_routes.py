@@ -0,0 +1,53 @@
+from flask import Blueprint, request, jsonify
+from flask_login import login_required
+from app.utils.search import get_search_service
+from app.utils.pagination import PaginationError, parse_limit
+
+search_bp = Blueprint('search', __name__)
+
+
+@search_bp.route('/', methods=['GET'])
+@login_required
+def search():
+    """
+    Query params:
+      q     - search text (required)
+      type  - "jobs" (default) or "proposals"
+      limit - max results (default 20, max 100)
+    """
+    query = (request.args.get("q") or "").strip()
+    if not query:
+        return jsonify({"error": "Query parameter 'q' is required."}), 400
+
+    kind = request.args.get("type", "jobs")
+    service = get_search_service(kind)
+    if not service:
+        return jsonify({"error": f"Unknown search type '{kind}'. Use 'jobs' or 'proposals'."}), 400
+
+    try:
+        limit = parse_limit(request.args.get("limit"), default=20, maximum=100)
+    except PaginationError as e:
+        return jsonify({"error": str(e)}), 400
+
+    try:
+        results = []
+        for obj, score in service.search(query, limit):
+            result = {
+                "id": obj.id,
+                "score": round(score, 4),
+                "highlights": service.snippets(obj, query)
+            }
+            if kind == "jobs":
+                result.update({"job_id": obj.job_id, "title": obj.title})
+            else:
+                result.update({"job_id": obj.job_id, "status": obj.status.value if obj.status else None})
+            results.append(result)
+
+        return jsonify({
+            "query": query,
+            "type": kind,
+            "results": results,
+            "count": len(results)
+        }), 200
+    except Exception as e:
+        return jsonify({"error": f"Search failed: {str(e)}"}), 500
@@ -1,14 +1,26 @@
-from flask import Blueprint, request, jsonify
+from flask import Blueprint, request, jsonify, current_app
 from flask_login import login_required, current_user
+from collections import defaultdict
+from datetime import datetime, timezone
+from marshmallow import ValidationError
+from sqlalchemy import insert, update
+import csv
+import io
 from app.extensions import db
 from app.models.project import Project
 from app.models.task import Task
 from app.schemas.task_schema import TaskSchema
 from app.schemas.user_schema import UserSchema
-from app.enums import UserRoleEnum
+from app.enums import UserRoleEnum, TaskStatusEnum, TaskPriorityEnum
 from app.utils.role_required import role_required
+from app.utils.db_routing import read_replica
+from app.utils.http_cache import conditional_get, row_validators, table_validators
 from app.models.user import User
-from app.utils.invite_code import generate_unique_invite_code
+from app.utils.code_allocator import code_allocator
+from app.utils.pagination import PaginationError, keyset_paginate, parse_limit
+from app.utils.task_board import board_aggregates, board_first_pages
+from app.utils.project_stats import rebuild_project_stats
+from app.utils.fast_serializer import compile_schema
 
 task_bp = Blueprint('task', __name__)
 
@@ -17,6 +29,14 @@ task_list_schema = TaskSchema(many=True)
 task_schema_partial = TaskSchema(partial=True)
 user_schema = UserSchema(session=db.session)
 users_schema = UserSchema(many=True)
+task_bulk_load_schema = TaskSchema(many=True, load_instance=False)
+
+# Fields PATCH /bulk may change, with their enum types where applicable
+BULK_UPDATABLE_FIELDS = {
+    "status": TaskStatusEnum,
+    "priority": TaskPriorityEnum,
+    "assigned_to": None,
+}
 
 
 
@@ -44,10 +64,8 @@ def create_task():
     if not user:
         return jsonify({"error": f"User with id {assigned_to} does not exist."}), 404
 
-    data["task_code"] = generate_unique_invite_code("TSK")
-    # Check for task_code duplication (edge case: extremely rare with UUID, but still good to check)
-    if Task.query.filter_by(task_code=data["task_code"]).first():
-        return jsonify({"error": f"Task with code '{data["task_code"]}' already exists."}), 409
+    # Sequence-allocated, unique by construction (no existence SELECT needed)
+    data["task_code"] = code_allocator.allocate("TSK")[0]
 
     # ✅ Assign creator
     data["created_by"] = current_user.id
@@ -94,11 +112,15 @@ def delete_task(task_id):
 @task_bp.route('/', methods=['GET'])
 @login_required
 @role_required(UserRoleEnum.admin, UserRoleEnum.team_lead)
+@read_replica
+@conditional_get(table_validators(Task))
 def get_all_tasks():
     try:
-        tasks = Task.query.order_by(Task.created_at.desc()).all()
+        # Row tuples + compiled serializer instead of ORM objects + TaskSchema.dump
+        serializer = compile_schema(TaskSchema)
+        rows = db.session.execute(serializer.select().order_by(Task.created_at.desc())).all()
         return jsonify({
-            "tasks": task_list_schema.dump(tasks)
+            "tasks": serializer.dump_rows(rows)
         }), 200
 
     except Exception as e:
@@ -111,6 +133,7 @@ def get_all_tasks():
 @task_bp.route('/<int:task_id>', methods=['GET'])
 @login_required
 @role_required(UserRoleEnum.admin, UserRoleEnum.team_lead)
+@conditional_get(row_validators(Task, 'task_id'))
 def get_task_by_id(task_id):
     task = Task.query.get(task_id)
 
@@ -162,4 +185,237 @@ def update_task(task_id):
 
     except Exception as e:
         db.session.rollback()
-        return jsonify({"error": f"Internal server error: {str(e)}"}), 500
\ No newline at end of file
+        return jsonify({"error": f"Internal server error: {str(e)}"}), 500
+
+
+
+@task_bp.route('/board/<int:project_id>', methods=['GET'])
+@login_required
+@role_required(UserRoleEnum.admin, UserRoleEnum.team_lead)
+@read_replica
+def get_project_board(project_id):
+    """
+    Kanban board for a project.
+
+    Without `status`: every column's first page (one windowed query) plus
+    per-status / priority / assignee counts (one GROUP BY).
+    With `status` and `cursor`: the next page of that single column.
+    """
+    if not db.session.query(Project.id).filter_by(id=project_id).first():
+        return jsonify({"error": f"Project with ID {project_id} not found."}), 404
+
+    try:
+        limit = parse_limit(request.args.get("limit"), default=20, maximum=100)
+    except PaginationError as e:
+        return jsonify({"error": str(e)}), 400
+
+    status = request.args.get("status")
+    if status:
+        if status not in [e.value for e in TaskStatusEnum]:
+            return jsonify({"error": f"status must be one of {[e.value for e in TaskStatusEnum]}."}), 400
+        try:
+            tasks, next_cursor = keyset_paginate(
+                Task.query.filter_by(project_id=project_id, status=TaskStatusEnum(status)),
+                Task, limit, cursor=request.args.get("cursor")
+            )
+        except PaginationError as e:
+            return jsonify({"error": str(e)}), 400
+
+        return jsonify({
+            "project_id": project_id,
+            "status": status,
+            "tasks": task_list_schema.dump(tasks),
+            "next_cursor": next_cursor
+        }), 200
+
+    try:
+        aggregates = board_aggregates(project_id)
+        pages = board_first_pages(project_id, limit)
+
+        columns = []
+        for column_status, (tasks, next_cursor) in pages.items():
+            columns.append({
+                "status": column_status,
+                **aggregates["columns"][column_status],
+                "tasks": task_list_schema.dump(tasks),
+                "next_cursor": next_cursor
+            })
+
+        return jsonify({
+            "project_id": project_id,
+            "limit": limit,
+            "totals": aggregates["totals"],
+            "columns": columns
+        }), 200
+
+    except Exception as e:
+        return jsonify({"error": f"Internal server error: {str(e)}"}), 500
+
+
+def _read_bulk_rows():
+    """Task rows from a JSON array ({"tasks": [...]} or bare list) or CSV (body or `file` upload)."""
+    upload = request.files.get("file")
+    if upload or request.mimetype == "text/csv":
+        text = upload.read().decode("utf-8-sig") if upload else request.get_data(as_text=True)
+        # Blank CSV cells mean "not provided"
+        return [{k.strip(): v.strip() for k, v in row.items() if k and v and v.strip()}
+                for row in csv.DictReader(io.StringIO(text))]
+
+    data = request.get_json(silent=True)
+    if isinstance(data, dict):
+        data = data.get("tasks")
+    return data
+
+
+@task_bp.route('/bulk', methods=['POST'])
+@login_required
+@role_required(UserRoleEnum.admin, UserRoleEnum.team_lead)
+def bulk_create_tasks():
+    rows = _read_bulk_rows()
+    max_rows = current_app.config["TASK_BULK_MAX_ROWS"]
+
+    if not isinstance(rows, list) or not rows:
+        return jsonify({"error": "Expected a non-empty JSON array of tasks or a CSV file."}), 400
+    if len(rows) > max_rows:
+        return jsonify({"error": f"At most {max_rows} tasks can be imported at once."}), 400
+
+    # 1. Validate every row up front (errors are keyed by row index)
+    try:
+        tasks = task_bulk_load_schema.load(rows, partial=("task_code", "created_by"))
+    except ValidationError as e:
+        return jsonify({"error": "Validation failed", "details": e.messages}), 400
+
+    # 2. Resolve referenced projects and users with one IN query each
+    project_ids = {task["project_id"] for task in tasks}
+    user_ids = {task["assigned_to"] for task in tasks}
+    found_projects = {row.id for row in db.session.query(Project.id).filter(Project.id.in_(project_ids))}
+    found_users = {row.id for row in db.session.query(User.id).filter(User.id.in_(user_ids))}
+
+    errors = {}
+    for idx, task in enumerate(tasks):
+        if task["project_id"] not in found_projects:
+            errors.setdefault(idx, {})["project_id"] = [f"Project with id {task['project_id']} does not exist."]
+        if task["assigned_to"] not in found_users:
+            errors.setdefault(idx, {})["assigned_to"] = [f"User with id {task['assigned_to']} does not exist."]
+    if errors:
+        return jsonify({"error": "Validation failed", "details": errors}), 400
+
+    # 3. Allocate all task codes in bulk and insert with a single executemany
+    codes = code_allocator.allocate("TSK", len(tasks))
+    created_at = datetime.now(timezone.utc)
+    values = []
+    for task, code in zip(tasks, codes):
+        values.append({
+            "task_code": code,
+            "project_id": task["project_id"],
+            "assigned_to": task["assigned_to"],
+            "created_by": current_user.id,
+            "title": task["title"],
+            "description": task.get("description"),
+            "status": TaskStatusEnum(task["status"]),
+            "priority": TaskPriorityEnum(task["priority"]),
+            "due_date": task.get("due_date"),
+            "created_at": created_at,
+        })
+
+    try:
+        db.session.execute(insert(Task), values)
+        # Core executemany skips ORM events, so recount the touched projects once
+        rebuild_project_stats(db.session.connection(), project_ids)
+        db.session.commit()
+    except Exception as e:
+        db.session.rollback()
+        return jsonify({"error": f"Internal server error: {str(e)}"}), 500
+
+    return jsonify({
+        "message": f"{len(values)} tasks created successfully.",
+        "count": len(values),
+        "task_codes": codes
+    }), 201
+
+
+def _is_int_id(value):
+    # bool is an int subclass; JSON true/false must not address id 1 / 0
+    return isinstance(value, int) and not isinstance(value, bool)
+
+
+@task_bp.route('/bulk', methods=['PATCH'])
+@login_required
+@role_required(UserRoleEnum.admin, UserRoleEnum.team_lead)
+def bulk_update_tasks():
+    """
+    Body: {"updates": [{"id": 1, "status": "done"}, {"id": 2, "priority": "high", "assigned_to": 7}, ...]}
+
+    Updates sharing the same change set are applied with one UPDATE ... WHERE id IN (...).
+    """
+    data = request.json or {}
+    updates = data.get("updates")
+    max_rows = current_app.config["TASK_BULK_MAX_ROWS"]
+
+    if not isinstance(updates, list) or not updates:
+        return jsonify({"error": "'updates' must be a non-empty list."}), 400
+    if len(updates) > max_rows:
+        return jsonify({"error": f"At most {max_rows} tasks can be updated at once."}), 400
+
+    # 1. Validate and group ids by identical change sets
+    errors = {}
+    groups = defaultdict(list)
+    for idx, item in enumerate(updates):
+        if not isinstance(item, dict) or not _is_int_id(item.get("id")):
+            errors[idx] = {"id": ["An integer task id is required."]}
+            continue
+        changes = {k: v for k, v in item.items() if k != "id"}
+        unknown = [k for k in changes if k not in BULK_UPDATABLE_FIELDS]
+        if not changes or unknown:
+            errors[idx] = {"fields": [f"Provide one or more of {sorted(BULK_UPDATABLE_FIELDS)}; unknown: {unknown}"]}
+            continue
+        for field, enum_class in BULK_UPDATABLE_FIELDS.items():
+            if field in changes and enum_class and changes[field] not in [e.value for e in enum_class]:
+                errors.setdefault(idx, {})[field] = [f"Must be one of {[e.value for e in enum_class]}."]
+        if "assigned_to" in changes and not _is_int_id(changes["assigned_to"]):
+            errors.setdefault(idx, {})["assigned_to"] = ["Must be an integer user id."]
+        if idx not in errors:
+            groups[tuple(sorted(changes.items()))].append(item["id"])
+
+    if errors:
+        return jsonify({"error": "Validation failed", "details": errors}), 400
+
+    # 2. Check referenced tasks and users with one IN query each
+    task_ids = {task_id for ids in groups.values() for task_id in ids}
+    task_projects = dict(db.session.query(Task.id, Task.project_id).filter(Task.id.in_(task_ids)).all())
+    found_tasks = set(task_projects)
+    missing_tasks = sorted(task_ids - found_tasks)
+    if missing_tasks:
+        return jsonify({"error": f"Tasks not found: {missing_tasks}"}), 404
+
+    user_ids = {dict(changes)["assigned_to"] for changes in groups if "assigned_to" in dict(changes)}
+    if user_ids:
+        found_users = {row.id for row in db.session.query(User.id).filter(User.id.in_(user_ids))}
+        missing_users = sorted(user_ids - found_users)
+        if missing_users:
+            return jsonify({"error": f"Assigned users not found: {missing_users}"}), 400
+
+    # 3. One UPDATE per distinct change set
+    try:
+        updated = 0
+        for changes, ids in groups.items():
+            values = {
+                field: BULK_UPDATABLE_FIELDS[field](value) if BULK_UPDATABLE_FIELDS[field] else value
+                for field, value in changes
+            }
+            result = db.session.execute(
+                update(Task).where(Task.id.in_(ids)).values(**values),
+                execution_options={"synchronize_session": False}
+            )
+            updated += result.rowcount
+        rebuild_project_stats(db.session.connection(), set(task_projects.values()))
+        db.session.commit()
+    except Exception as e:
+        db.session.rollback()
+        return jsonify({"error": f"Internal server error: {str(e)}"}), 500
+
+    return jsonify({
+        "message": "Tasks updated successfully.",
+        "updated": updated,
+        "statements": len(groups)
+    }), 200
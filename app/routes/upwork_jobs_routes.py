@@ -1,18 +1,47 @@
-from flask import Blueprint, request, jsonify
+from flask import Blueprint, request, jsonify, current_app
 from flask_login import login_required
 from app.extensions import db
 from app.models.upwork_job import UpworkJob
 from app.schemas.upwork_jobs_schema import UpworkJobSchema
 from app.enums import UserRoleEnum
 from app.utils.role_required import role_required
-from app.utils.gemini import assess_job_feasibility
+from app.utils.db_routing import read_replica
+from app.utils.http_cache import conditional_get, row_validators, table_validators
+from app.utils.gemini import assess_job_feasibility, assess_jobs_feasibility
 from app.utils.gemini import generate_dummy_upwork_jobs
+from app.utils.gemini_cache import gemini_cache
+from app.utils.pagination import PaginationError, keyset_paginate, parse_fields, parse_limit
+from app.utils.query_filters import FilterError, apply_filters, parse_sort
+from app.utils.search import get_search_service
+from app.utils.fast_serializer import compile_schema
+from sqlalchemy import func
 
 upwork_job_bp = Blueprint('upwork_job', __name__)
 
 upwork_jobs_schema = UpworkJobSchema(session=db.session)
 upwork_jobs_list_schema = UpworkJobSchema(many=True)
 
+# Server-side filters accepted by GET /all (see app/utils/query_filters.py)
+UPWORK_JOB_FILTERS = {
+    "budget": "range",
+    "client_total_spent": "range",
+    "connect_required": "range",
+    "proposals_submitted": "range",
+    "expected_earnings": "range",
+    "posted_at": "range",
+    "created_at": "range",
+    "budget_type": "enum",
+    "feasibility_status": "enum",
+    "client_country": "string",
+    "category": "string",
+    "skills": "json_array",
+    "tags": "json_array",
+}
+UPWORK_JOB_SORTABLE = {
+    "created_at", "posted_at", "budget", "client_total_spent",
+    "connect_required", "proposals_submitted", "expected_earnings",
+}
+
 
 @upwork_job_bp.route('/', methods=['POST'])
 @login_required
@@ -41,6 +70,8 @@ def create_upwork_job():
         db.session.add(upwork_job)
         db.session.commit()
 
+        get_search_service("jobs").index(upwork_job)
+
         return jsonify({
             "message": "Upwork job created successfully.",
             "job": upwork_jobs_schema.dump(upwork_job)
@@ -53,19 +84,55 @@ def create_upwork_job():
 
 @upwork_job_bp.route('/all', methods=['GET'])
 @login_required
+@read_replica
+@conditional_get(table_validators(UpworkJob))
 def get_all_upwork_jobs():
+    """
+    Query params:
+      limit  - page size (default 50, max 200)
+      cursor - `next_cursor` from the previous page
+      fields - comma separated projection, e.g. fields=title,budget,feasibility_status
+      sort   - one of UPWORK_JOB_SORTABLE, prefix with '-' for descending (default -created_at)
+
+    Filters (`field__op=value`, lists are comma separated):
+      budget__gte=500&budget__lte=2000      range on numeric / date columns
+      feasibility_status=valid,unsure       enum membership (also budget_type__in=...)
+      client_country__in=Canada,Germany     string membership
+      skills__contains=Python,AWS           JSON array contains all values (skills__any for any)
+    """
     try:
-        jobs = UpworkJob.query.order_by(UpworkJob.created_at.desc()).all()
+        limit = parse_limit(request.args.get("limit"))
+        fields = parse_fields(request.args.get("fields"), upwork_jobs_schema.fields, required=("id",))
+        sort_column, descending = parse_sort(request.args.get("sort"), UpworkJob, UPWORK_JOB_SORTABLE)
+        query = apply_filters(UpworkJob.query, UpworkJob, request.args, UPWORK_JOB_FILTERS, db.engine.dialect.name)
+    except (PaginationError, FilterError) as e:
+        return jsonify({"error": str(e)}), 400
+
+    try:
+        # Select only the serialized columns (plus cursor keys) as Row tuples
+        serializer = compile_schema(UpworkJobSchema, tuple(fields) if fields else None)
+        rows, next_cursor = keyset_paginate(
+            query.with_entities(*serializer.columns_with(UpworkJob.id, sort_column)), UpworkJob, limit,
+            cursor=request.args.get("cursor"),
+            sort_column=sort_column,
+            descending=descending
+        )
+        total = query.with_entities(func.count(UpworkJob.id)).scalar()
+
         return jsonify({
-            "jobs": upwork_jobs_list_schema.dump(jobs),
-            "count": len(jobs)
+            "jobs": serializer.dump_rows(rows),
+            "count": total,
+            "next_cursor": next_cursor
         }), 200
+    except PaginationError as e:
+        return jsonify({"error": str(e)}), 400
     except Exception as e:
         return jsonify({"error": f"Failed to fetch jobs: {str(e)}"}), 500
     
 
 @upwork_job_bp.route('/<int:job_id>', methods=['GET'])
 @login_required
+@conditional_get(row_validators(UpworkJob, 'job_id'))
 def get_upwork_job(job_id):
     job = UpworkJob.query.get(job_id)
     if not job:
@@ -104,6 +171,7 @@ def bulk_create_upwork_jobs():
     created_jobs = []
     skipped_jobs = []
     errors = []
+    pending_jobs = []  # (index, job_data) pairs that passed validation
 
     for idx, job_data in enumerate(jobs_data):
         try:
@@ -122,8 +190,25 @@ def bulk_create_upwork_jobs():
                 skipped_jobs.append(job_data.get("job_id"))
                 continue
 
-            # Step 3: AI feasibility assessment
-            job_data['feasibility_status'] = assess_job_feasibility(job_data)
+            pending_jobs.append((idx, job_data))
+
+        except Exception as e:
+            errors.append({
+                "job_index": idx,
+                "job_id": job_data.get("job_id"),
+                "error": str(e)
+            })
+
+    # Step 3: AI feasibility assessment (concurrent, results in input order)
+    statuses = assess_jobs_feasibility(
+        [job_data for _, job_data in pending_jobs],
+        max_concurrency=current_app.config["GEMINI_MAX_CONCURRENCY"],
+        timeout=current_app.config["GEMINI_TIMEOUT_SECONDS"]
+    )
+
+    for (idx, job_data), status in zip(pending_jobs, statuses):
+        try:
+            job_data['feasibility_status'] = status
 
             # Step 4: Deserialize and add to session
             upwork_job = upwork_jobs_schema.load(job_data)
@@ -143,9 +228,32 @@ def bulk_create_upwork_jobs():
         db.session.rollback()
         return jsonify({"error": f"Failed to commit jobs: {str(e)}"}), 500
 
+    search_service = get_search_service("jobs")
+    for job in created_jobs:
+        search_service.index(job)
+
     return jsonify({
         "message": "Bulk job insert complete.",
         "created": [upwork_jobs_schema.dump(job) for job in created_jobs],
         "skipped_existing_job_ids": skipped_jobs,
         "errors": errors
     }), 207  # 207 Multi-Status: Some succeeded, some failed
+
+
+@upwork_job_bp.route('/gemini-cache', methods=['GET'])
+@login_required
+@role_required(UserRoleEnum.admin)
+def get_gemini_cache_stats():
+    return jsonify({"cache": gemini_cache.stats()}), 200
+
+
+@upwork_job_bp.route('/gemini-cache', methods=['DELETE'])
+@login_required
+@role_required(UserRoleEnum.admin)
+def clear_gemini_cache():
+    kind = request.args.get("kind")  # "job_feasibility", "proposal" or all
+    try:
+        gemini_cache.clear(kind)
+        return jsonify({"message": "Gemini cache cleared.", "kind": kind or "all"}), 200
+    except Exception as e:
+        return jsonify({"error": f"Failed to clear Gemini cache: {str(e)}"}), 500
@@ -7,8 +7,12 @@ from app.schemas.workspace_schema import WorkspaceSchema
 from app.schemas.user_schema import UserSchema
 from app.enums import UserRoleEnum
 from app.utils.role_required import role_required
+from app.utils.db_routing import read_replica
+from app.utils.http_cache import conditional_get, row_validators, table_validators
 from app.models.user import User
-from app.utils.invite_code import generate_unique_invite_code
+from app.utils.invite_code import generate_invite_code
+from app.utils.code_allocator import add_with_unique_retry
+from app.utils.project_stats import workspace_rollup
 
 workspace_bp = Blueprint('workspace', __name__)
 
@@ -34,8 +38,9 @@ def create_workspace():
         return jsonify({"error": f"A workspace with the name '{data['name']}' already exists."}), 409
 
     try:
-        workspace = workspace_schema.load(data)  # invite_code is generated inside model or pre-hook
-        db.session.add(workspace)
+        workspace = workspace_schema.load(data)
+        # Optimistic insert: a colliding invite_code is regenerated on the unique constraint
+        add_with_unique_retry(workspace, "invite_code", lambda: generate_invite_code(workspace.name))
         db.session.commit()
 
         return jsonify({
@@ -50,6 +55,8 @@ def create_workspace():
 
 @workspace_bp.route('/', methods=['GET'])
 @login_required
+@read_replica
+@conditional_get(table_validators(Workspace))
 def get_workspaces():
     workspaces = Workspace.query.order_by(Workspace.created_at.desc()).all()
     return jsonify(workspace_list_schema.dump(workspaces)), 200
@@ -121,13 +128,15 @@ def join_workspace():
 @workspace_bp.route('/my-workspaces', methods=['GET'])
 @login_required
 def get_my_workspaces():
-    memberships = WorkspaceMember.query.filter_by(user_id=current_user.id).all()
-    
-    workspaces = [membership.workspace for membership in memberships]
+    # Single JOIN instead of lazy-loading membership.workspace per row
+    workspaces = (
+        Workspace.query
+        .join(WorkspaceMember, WorkspaceMember.workspace_id == Workspace.id)
+        .filter(WorkspaceMember.user_id == current_user.id)
+        .all()
+    )
 
-    
-    schema = WorkspaceSchema(many=True)
-    return jsonify(schema.dump(workspaces)), 200
+    return jsonify(workspace_list_schema.dump(workspaces)), 200
 
 @workspace_bp.route('/<int:workspace_id>/members/<int:user_id>', methods=['DELETE'])
 @login_required
@@ -185,6 +194,7 @@ def leave_workspace(workspace_id):
     
 @workspace_bp.route('/<int:workspace_id>', methods=['GET'])
 @login_required
+@conditional_get(row_validators(Workspace, 'workspace_id'))
 def get_workspace_by_id(workspace_id):
     workspace = Workspace.query.get(workspace_id)
 
@@ -203,8 +213,13 @@ def get_workspace_members(workspace_id):
     if not workspace:
         return jsonify({"error": "Workspace not found."}), 404
 
-    members = WorkspaceMember.query.filter_by(workspace_id=workspace_id).all()
-    users = [member.user for member in members]
+    # Single JOIN instead of lazy-loading member.user per row
+    users = (
+        User.query
+        .join(WorkspaceMember, WorkspaceMember.user_id == User.id)
+        .filter(WorkspaceMember.workspace_id == workspace_id)
+        .all()
+    )
 
     return jsonify({
         "workspace_id": workspace.id,
@@ -237,12 +252,34 @@ def update_workspace(workspace_id):
     if existing:
         return jsonify({"error": "Workspace name already in use"}), 409
 
-    workspace.name = new_name
-    workspace.invite_code = generate_unique_invite_code(new_name)
-
-    db.session.commit()
+    try:
+        workspace.name = new_name
+        add_with_unique_retry(workspace, "invite_code", lambda: generate_invite_code(new_name), regenerate=True)
+        db.session.commit()
+    except Exception as e:
+        db.session.rollback()
+        return jsonify({"error": f"Failed to update workspace: {str(e)}"}), 500
 
     return jsonify({
         "message": "Workspace updated successfully",
         "workspace": workspace_schema.dump(workspace)
-    }), 200
\ No newline at end of file
+    }), 200
+
+
+
+@workspace_bp.route('/<int:workspace_id>/stats', methods=['GET'])
+@login_required
+@role_required(UserRoleEnum.admin, UserRoleEnum.team_lead)
+def get_workspace_stats(workspace_id):
+    """Dashboard rollup summed from the workspace's project_stats rows."""
+    try:
+        if not Workspace.query.get(workspace_id):
+            return jsonify({"error": f"Workspace with ID {workspace_id} not found."}), 404
+
+        return jsonify({
+            "stats": workspace_rollup(db.session, workspace_id)
+        }), 200
+
+    except Exception as e:
+        db.session.rollback()
+        return jsonify({"error": f"Internal server error: {str(e)}"}), 500
@@ -44,6 +44,7 @@ class ProjectSchema(SQLAlchemyAutoSchema):
     )
 
     created_at = auto_field(dump_only=True)
+    updated_at = auto_field(dump_only=True)
 
     # Optional: Validate end_date > start_date
     @validates_schema
@@ -0,0 +1,20 @@
+from marshmallow_sqlalchemy import SQLAlchemySchema, auto_field
+from marshmallow_enum import EnumField
+from app.models.proposal_generation_job import ProposalGenerationJob
+from app.enums import GenerationJobStatusEnum
+
+class ProposalGenerationJobSchema(SQLAlchemySchema):
+    class Meta:
+        model = ProposalGenerationJob
+        load_instance = True
+        include_fk = True
+
+    id = auto_field(dump_only=True)
+    upwork_job_id = auto_field(dump_only=True)
+    requested_by = auto_field(dump_only=True)
+    proposal_id = auto_field(dump_only=True)
+    status = EnumField(GenerationJobStatusEnum, by_value=True, dump_only=True)
+    error = auto_field(dump_only=True)
+    created_at = auto_field(dump_only=True)
+    started_at = auto_field(dump_only=True)
+    finished_at = auto_field(dump_only=True)
@@ -36,4 +36,5 @@ class ProposalSchema(SQLAlchemySchema):
     # Other Info
     tags = auto_field()
     created_at = auto_field(dump_only=True)
+    updated_at = auto_field(dump_only=True)
 
@@ -38,6 +38,7 @@ class TaskSchema(SQLAlchemyAutoSchema):
     )
 
     created_at = auto_field(dump_only=True)
+    updated_at = auto_field(dump_only=True)
 
     @validates_schema
     def validate_due_date(self, data, **kwargs):
@@ -47,6 +47,7 @@ class UpworkJobSchema(SQLAlchemySchema):
     feasibility_status = EnumField(FeasibilityEnum, by_value=True, required=False)
 
     created_at = auto_field(dump_only=True)
+    updated_at = auto_field(dump_only=True)
 
     # Custom validations
     @validates("job_id")
@@ -22,6 +22,7 @@ class WorkspaceSchema(SQLAlchemySchema):
     )
 
     created_at = auto_field(dump_only=True)
+    updated_at = auto_field(dump_only=True)
 
     @validates("name")
     def validate_name(self, value, **kwargs):
@@ -0,0 +1,151 @@
+import secrets
+import threading
+import time
+
+from flask import current_app
+from itsdangerous import BadSignature, SignatureExpired, URLSafeTimedSerializer
+
+from app.enums import UserRoleEnum
+from app.utils.user_cache import UserSnapshot
+
+ACCESS = "access"
+REFRESH = "refresh"
+
+
+class TokenError(Exception):
+    pass
+
+
+class MemoryRevocationStore:
+    """
+    Process-local revocation state: each worker only sees its own revocations.
+
+    Horizontally scaled workers need a shared store (e.g. Redis) with the
+    same `set()` / `get()` signature, where entries expire at `expires_at`.
+    """
+
+    def __init__(self, max_keys=10000):
+        self.max_keys = max_keys
+        self._entries = {}  # key -> (value, expires_at)
+        self._lock = threading.Lock()
+
+    def set(self, key, value, expires_at):
+        with self._lock:
+            self._entries[key] = (value, expires_at)
+            if len(self._entries) > self.max_keys:
+                now = time.time()
+                self._entries = {k: v for k, v in self._entries.items() if v[1] > now}
+
+    def get(self, key):
+        with self._lock:
+            entry = self._entries.get(key)
+        if entry is None or entry[1] <= time.time():
+            return None
+        return entry[0]
+
+
+class RevocationList:
+    """
+    Revoked token ids plus per-user "not before" cut-offs.
+
+    Checks are a store lookup, so verification never touches the DB. Entries
+    expire once every token they revoke would have expired anyway.
+    """
+
+    def __init__(self, store, max_token_age=14 * 24 * 3600):
+        self.store = store
+        self.max_token_age = max_token_age  # longest token TTL (refresh)
+
+    def revoke(self, jti, expires_at):
+        self.store.set(f"jti:{jti}", True, expires_at)
+
+    def revoke_user(self, user_id):
+        # Token timestamps are whole seconds; a token issued later in
+        # this same second (e.g. a re-login) stays valid
+        now = int(time.time())
+        self.store.set(f"user:{user_id}", now, now + self.max_token_age)
+
+    def is_revoked(self, jti, user_id, issued_at):
+        not_before = self.store.get(f"user:{user_id}")
+        if not_before is not None and issued_at < not_before:
+            return True
+        return self.store.get(f"jti:{jti}") is not None
+
+
+revocation_store = MemoryRevocationStore()
+revocation_list = RevocationList(revocation_store)
+
+
+def _serializer(kind):
+    return URLSafeTimedSerializer(current_app.config["SECRET_KEY"], salt=f"auth-token-{kind}")
+
+
+def _max_age(kind):
+    if kind == ACCESS:
+        return current_app.config.get("ACCESS_TOKEN_TTL_SECONDS", 900)
+    return current_app.config.get("REFRESH_TOKEN_TTL_SECONDS", 14 * 24 * 3600)
+
+
+def issue_token(user, kind=ACCESS):
+    """Sign a compact token for `user` (a User or UserSnapshot)."""
+    # Signed, not encrypted: anyone holding the token can read these, so no personal data
+    claims = {
+        "sub": user.id,
+        "role": user.role.value,
+        "jti": secrets.token_urlsafe(8),
+    }
+    return _serializer(kind).dumps(claims)
+
+
+def issue_token_pair(user):
+    return {
+        "access_token": issue_token(user, ACCESS),
+        "refresh_token": issue_token(user, REFRESH),
+        "token_type": "Bearer",
+        "expires_in": _max_age(ACCESS),
+    }
+
+
+def verify_token(token, kind=ACCESS):
+    """Verify signature, expiry and revocation. Pure CPU, no DB access."""
+    try:
+        claims, issued_at = _serializer(kind).loads(token, max_age=_max_age(kind), return_timestamp=True)
+    except SignatureExpired:
+        raise TokenError("Token has expired.")
+    except BadSignature:
+        raise TokenError("Invalid token.")
+
+    issued_at = issued_at.timestamp()
+    if revocation_list.is_revoked(claims["jti"], claims["sub"], issued_at):
+        raise TokenError("Token has been revoked.")
+    claims["iat"] = issued_at
+    return claims
+
+
+def revoke_token(claims, kind=ACCESS):
+    revocation_list.revoke(claims["jti"], claims["iat"] + _max_age(kind))
+
+
+def snapshot_from_claims(claims):
+    # Only id and role; profile fields come from user_cache / the DB
+    return UserSnapshot(id=claims["sub"], role=UserRoleEnum(claims["role"]), is_active=True)
+
+
+def load_user_from_request(request):
+    """Flask-Login request_loader for `Authorization: Bearer <token>`."""
+    header = request.headers.get("Authorization", "")
+    scheme, _, token = header.partition(" ")
+    if scheme.lower() != "bearer" or not token:
+        return None
+    try:
+        return snapshot_from_claims(verify_token(token.strip(), ACCESS))
+    except TokenError:
+        return None
+
+
+def init_auth_tokens(app, store=None):
+    revocation_list.store = store or revocation_store
+    revocation_list.max_token_age = max(
+        app.config.get("ACCESS_TOKEN_TTL_SECONDS", 900),
+        app.config.get("REFRESH_TOKEN_TTL_SECONDS", 14 * 24 * 3600)
+    )
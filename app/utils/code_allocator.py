@@ -0,0 +1,107 @@
+import secrets
+import string
+import threading
+
+from sqlalchemy import insert, select, update
+from sqlalchemy.exc import IntegrityError
+
+from app.extensions import db
+
+CODE_CHARSET = string.ascii_uppercase + string.digits
+
+
+def random_code(prefix, length=5):
+    suffix = ''.join(secrets.choice(CODE_CHARSET) for _ in range(length))
+    return f"{prefix}-{suffix}"
+
+
+def add_with_unique_retry(obj, attr, generate, max_attempts=5, regenerate=False):
+    """
+    Optimistically write `obj` and regenerate `attr` on a unique violation.
+
+    Works for new rows (INSERT) and persistent ones (UPDATE). The value is
+    assigned and flushed inside a SAVEPOINT, so a collision costs one failed
+    statement instead of a SELECT before every write and only that statement
+    is rolled back. An existing value is kept on the first attempt unless
+    `regenerate` is set. IntegrityErrors caused by any other constraint are
+    re-raised at once.
+    """
+    for attempt in range(max_attempts):
+        try:
+            with db.session.begin_nested():
+                if attempt or regenerate or not getattr(obj, attr):
+                    setattr(obj, attr, generate())
+                db.session.add(obj)
+                db.session.flush()
+            return obj
+        except IntegrityError as e:
+            if attr not in str(e.orig) or attempt == max_attempts - 1:
+                raise
+
+
+class SequenceAllocator:
+    """
+    Hands out monotonic per-prefix codes like TSK-000042 with no pre-check.
+
+    Values come from the `code_sequences` table in blocks of `block_size`.
+    Each block is reserved by one atomic UPDATE in its own short
+    transaction, and the block is then served from memory. Values are
+    unique across processes. Gaps after a restart are expected.
+    """
+
+    def __init__(self, block_size=50, width=6):
+        self.block_size = block_size
+        self.width = width
+        self._blocks = {}  # prefix -> [next, end)
+        self._lock = threading.Lock()
+
+    def format(self, prefix, value):
+        return f"{prefix}-{value:0{self.width}d}"
+
+    def _reserve(self, prefix, count):
+        from app.models.code_sequence import CodeSequence
+
+        table = CodeSequence.__table__
+        for _ in range(3):
+            with db.engine.begin() as conn:
+                reserved = conn.execute(
+                    update(table)
+                    .where(table.c.prefix == prefix)
+                    .values(next_value=table.c.next_value + count)
+                ).rowcount
+                if reserved:
+                    end = conn.execute(select(table.c.next_value).where(table.c.prefix == prefix)).scalar_one()
+                    return end - count, end
+            try:
+                with db.engine.begin() as conn:
+                    conn.execute(insert(table).values(prefix=prefix, next_value=1 + count))
+                return 1, 1 + count
+            except IntegrityError:
+                continue  # another process created the row first, reserve via UPDATE
+        raise RuntimeError(f"Could not reserve codes for prefix '{prefix}'")
+
+    def allocate(self, prefix, count=1):
+        """Return `count` unused codes for `prefix`."""
+        codes = []
+        with self._lock:
+            while len(codes) < count:
+                block = self._blocks.get(prefix)
+                if not block or block[0] >= block[1]:
+                    needed = count - len(codes)
+                    block = list(self._reserve(prefix, max(self.block_size, needed)))
+                    self._blocks[prefix] = block
+                take = min(count - len(codes), block[1] - block[0])
+                codes.extend(self.format(prefix, value) for value in range(block[0], block[0] + take))
+                block[0] += take
+        return codes
+
+    def reset(self):
+        with self._lock:
+            self._blocks.clear()
+
+
+code_allocator = SequenceAllocator()
+
+
+def init_code_allocator(app):
+    code_allocator.block_size = app.config.get("CODE_SEQUENCE_BLOCK_SIZE", 50)
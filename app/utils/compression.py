@@ -0,0 +1,202 @@
+import gzip
+import threading
+import zlib
+from cachetools import LRUCache
+from flask import request
+
+try:
+    import brotli
+except ImportError:  # optional: br is simply not offered
+    brotli = None
+
+try:
+    import zstandard
+except ImportError:  # optional: zstd is simply not offered
+    zstandard = None
+
+COMPRESSIBLE_MIMETYPES = {
+    "application/json",
+    "application/x-ndjson",
+    "application/javascript",
+    "application/xml",
+    "text/event-stream",
+}
+
+
+class _GzipStream:
+    def __init__(self, level):
+        self._compressor = zlib.compressobj(level, zlib.DEFLATED, 31)  # wbits 31 = gzip container
+
+    def compress(self, chunk):
+        # Sync flush so each chunk of a stream reaches the client immediately
+        return self._compressor.compress(chunk) + self._compressor.flush(zlib.Z_SYNC_FLUSH)
+
+    def finish(self):
+        return self._compressor.flush(zlib.Z_FINISH)
+
+
+class _BrotliStream:
+    def __init__(self, level):
+        self._compressor = brotli.Compressor(quality=level)
+
+    def compress(self, chunk):
+        return self._compressor.process(chunk) + self._compressor.flush()
+
+    def finish(self):
+        return self._compressor.finish()
+
+
+class _ZstdStream:
+    def __init__(self, level):
+        self._compressor = zstandard.ZstdCompressor(level=level).compressobj()
+
+    def compress(self, chunk):
+        return self._compressor.compress(chunk) + self._compressor.flush(zstandard.COMPRESSOBJ_FLUSH_BLOCK)
+
+    def finish(self):
+        return self._compressor.flush()
+
+
+# Content-Encoding -> (one-shot compress(data, level), stream factory(level), default level)
+ENCODERS = {"gzip": (lambda data, level: gzip.compress(data, compresslevel=level, mtime=0), _GzipStream, 6)}
+if brotli is not None:
+    ENCODERS["br"] = (lambda data, level: brotli.compress(data, quality=level), _BrotliStream, 5)
+if zstandard is not None:
+    ENCODERS["zstd"] = (lambda data, level: zstandard.ZstdCompressor(level=level).compress(data), _ZstdStream, 3)
+
+# Every encoding an ETag may be suffixed with (see app/utils/http_cache.py)
+ETAG_SUFFIXES = ("gzip", "br", "zstd")
+
+
+def encoded_etag(etag, encoding):
+    # A compressed body is a different representation, so it needs its own strong ETag
+    return f"{etag}-{encoding}"
+
+
+class ResponseCompressor:
+    """
+    Negotiated gzip / br / zstd response compression.
+
+    - encoding picked from Accept-Encoding (q-values first, then server preference)
+    - buffered bodies under `min_size` bytes are left alone
+    - streamed bodies are compressed chunk by chunk and flushed per chunk
+    - compressed bodies of responses with a strong ETag are kept in an LRU
+      bounded by `cache_bytes`, so hot resources are compressed once
+    """
+
+    def __init__(self, preference=("zstd", "br", "gzip"), min_size=1024, cache_bytes=32 * 1024 * 1024):
+        self._lock = threading.Lock()
+        self.configure(preference, min_size, cache_bytes)
+
+    def configure(self, preference, min_size, cache_bytes):
+        self.preference = [encoding for encoding in preference if encoding in ENCODERS]
+        self.min_size = min_size
+        self.levels = {encoding: ENCODERS[encoding][2] for encoding in self.preference}
+        with self._lock:
+            self._cache = LRUCache(maxsize=cache_bytes, getsizeof=len) if cache_bytes else None
+            self.hits = 0
+            self.misses = 0
+
+    def negotiate(self):
+        if not self.preference:
+            return None
+        encoding = request.accept_encodings.best_match(self.preference)
+        return encoding if encoding in ENCODERS else None
+
+    def _compress_cached(self, etag, encoding, data):
+        compress = ENCODERS[encoding][0]
+        if self._cache is None or not etag:
+            return compress(data, self.levels[encoding])
+
+        key = (etag, encoding)
+        with self._lock:
+            cached = self._cache.get(key)
+            if cached is not None:
+                self.hits += 1
+                return cached
+            self.misses += 1
+
+        compressed = compress(data, self.levels[encoding])
+        with self._lock:
+            try:
+                self._cache[key] = compressed
+            except ValueError:  # larger than the whole cache
+                pass
+        return compressed
+
+    def _compress_stream(self, iterable, encoding):
+        stream = ENCODERS[encoding][1](self.levels[encoding])
+        try:
+            for chunk in iterable:
+                if isinstance(chunk, str):
+                    chunk = chunk.encode("utf-8")
+                data = stream.compress(chunk)
+                if data:
+                    yield data
+            yield stream.finish()
+        finally:
+            close = getattr(iterable, "close", None)
+            if close is not None:
+                close()
+
+    def process(self, response):
+        compressible = response.mimetype.startswith("text/") or response.mimetype in COMPRESSIBLE_MIMETYPES
+        if response.status_code == 304 and compressible:
+            # A 304 must carry the Vary its 200 would have, or caches mix up encodings
+            response.vary.add("Accept-Encoding")
+            return response
+        if (
+            response.status_code < 200 or response.status_code == 204
+            or response.direct_passthrough
+            or "Content-Encoding" in response.headers
+            or not compressible
+        ):
+            return response
+
+        response.vary.add("Accept-Encoding")
+        encoding = self.negotiate()
+        if encoding is None:
+            return response
+
+        etag, weak = response.get_etag()
+
+        if response.is_streamed:
+            response.response = self._compress_stream(response.response, encoding)
+            response.headers.pop("Content-Length", None)
+        else:
+            data = response.get_data()
+            if len(data) < self.min_size:
+                return response
+            response.set_data(self._compress_cached(etag if not weak else None, encoding, data))
+
+        response.headers["Content-Encoding"] = encoding
+        if etag:
+            response.set_etag(encoded_etag(etag, encoding), weak=weak)
+        return response
+
+    def stats(self):
+        with self._lock:
+            return {
+                "encodings": list(self.preference),
+                "cache_hits": self.hits,
+                "cache_misses": self.misses,
+                "cache_bytes": self._cache.currsize if self._cache is not None else 0,
+            }
+
+
+response_compressor = ResponseCompressor()
+
+
+def init_compression(app):
+    if not app.config.get("COMPRESSION_ENABLED", True):
+        return
+
+    response_compressor.configure(
+        preference=[e.strip() for e in app.config.get("COMPRESSION_ENCODINGS", "zstd,br,gzip").split(",") if e.strip()],
+        min_size=app.config.get("COMPRESSION_MIN_SIZE", 1024),
+        cache_bytes=app.config.get("COMPRESSION_CACHE_BYTES", 32 * 1024 * 1024),
+    )
+
+    @app.after_request
+    def compress_response(response):
+        return response_compressor.process(response)
@@ -0,0 +1,156 @@
+import threading
+import time
+from collections import deque
+
+from sqlalchemy.pool import QueuePool
+
+from app.utils.sql_profiler import percentile
+
+
+class PoolMetrics:
+    """Checkout wait times and connection churn for the instrumented pool."""
+
+    def __init__(self, window=1000):
+        self._lock = threading.Lock()
+        self._waits = deque(maxlen=window)
+        self.checkouts = 0
+        self.timeouts = 0
+        self.connects = 0
+        self.invalidations = 0
+        self.pools = []
+
+    def record_wait(self, seconds, timed_out=False):
+        with self._lock:
+            self._waits.append(seconds)
+            if timed_out:
+                self.timeouts += 1
+            else:
+                self.checkouts += 1
+
+    def snapshot(self):
+        with self._lock:
+            waits_ms = [w * 1000 for w in self._waits]
+            counters = {
+                "checkouts": self.checkouts,
+                "checkout_timeouts": self.timeouts,
+                "connects": self.connects,
+                "invalidations": self.invalidations,
+            }
+
+        pools = []
+        for pool in list(self.pools):
+            capacity = pool.size() + max(pool._max_overflow, 0)
+            pools.append({
+                "size": pool.size(),
+                "checked_out": pool.checkedout(),
+                "checked_in": pool.checkedin(),
+                "overflow": pool.overflow(),
+                "saturation": round(pool.checkedout() / capacity, 4) if capacity else None,
+            })
+
+        return {
+            **counters,
+            "checkout_wait_ms": {
+                "p50": round(percentile(waits_ms, 50), 3),
+                "p95": round(percentile(waits_ms, 95), 3),
+                "p99": round(percentile(waits_ms, 99), 3),
+                "max": round(max(waits_ms), 3) if waits_ms else 0.0,
+            },
+            "pools": pools,
+        }
+
+
+pool_metrics = PoolMetrics()
+
+
+class InstrumentedQueuePool(QueuePool):
+    """QueuePool that times how long each checkout waits for a connection."""
+
+    def __init__(self, *args, **kwargs):
+        super().__init__(*args, **kwargs)
+        pool_metrics.pools.append(self)
+
+    def _do_get(self):
+        started = time.perf_counter()
+        try:
+            connection = super()._do_get()
+        except Exception:
+            pool_metrics.record_wait(time.perf_counter() - started, timed_out=True)
+            raise
+        pool_metrics.record_wait(time.perf_counter() - started)
+        return connection
+
+    def recreate(self):
+        pool = super().recreate()
+        if self in pool_metrics.pools:
+            pool_metrics.pools.remove(self)
+        return pool
+
+
+def build_engine_options(uri, env):
+    """
+    SQLALCHEMY_ENGINE_OPTIONS for the given database URI.
+
+    Pool sizing/recycling and driver timeouts only apply to server databases
+    (MySQL); SQLite keeps Flask-SQLAlchemy's defaults.
+    """
+    if not uri.startswith("mysql"):
+        return {}
+
+    statement_timeout_ms = int(env("DB_STATEMENT_TIMEOUT_MS", "0"))
+    connect_args = {
+        "connect_timeout": int(env("DB_CONNECT_TIMEOUT", "10")),
+        "read_timeout": int(env("DB_READ_TIMEOUT", "30")),
+        "write_timeout": int(env("DB_WRITE_TIMEOUT", "30")),
+    }
+    if statement_timeout_ms:
+        # Server-side cap on SELECT execution time
+        connect_args["init_command"] = f"SET SESSION max_execution_time={statement_timeout_ms}"
+
+    return {
+        "poolclass": InstrumentedQueuePool,
+        "pool_size": int(env("DB_POOL_SIZE", "10")),
+        "max_overflow": int(env("DB_MAX_OVERFLOW", "20")),
+        "pool_timeout": float(env("DB_POOL_TIMEOUT", "10")),
+        "pool_recycle": int(env("DB_POOL_RECYCLE", "1800")),  # below MySQL wait_timeout
+        "pool_pre_ping": env("DB_POOL_PRE_PING", "true").lower() == "true",
+        "connect_args": connect_args,
+    }
+
+
+def init_db_pool(app, db):
+    """Count connects/invalidations and pre-open DB_POOL_WARMUP connections."""
+    from sqlalchemy import event, text
+
+    with app.app_context():
+        engines = list(db.engines.values())
+
+    for engine in engines:
+        if not event.contains(engine, "connect", _on_connect):
+            event.listen(engine, "connect", _on_connect)
+            event.listen(engine, "invalidate", _on_invalidate)
+
+    warmup = app.config.get("DB_POOL_WARMUP", 0)
+    if not warmup:
+        return
+
+    for engine in engines:
+        connections = []
+        try:
+            for _ in range(min(warmup, getattr(engine.pool, "size", lambda: warmup)())):
+                connection = engine.connect()
+                connection.execute(text("SELECT 1"))
+                connections.append(connection)
+        except Exception as e:
+            app.logger.warning(f"DB pool warm-up stopped after {len(connections)} connections: {e}")
+        finally:
+            for connection in connections:
+                connection.close()
+
+
+def _on_connect(dbapi_connection, connection_record):
+    pool_metrics.connects += 1
+
+
+def _on_invalidate(dbapi_connection, connection_record, exception):
+    pool_metrics.invalidations += 1
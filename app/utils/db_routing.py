@@ -0,0 +1,99 @@
+import random
+import threading
+import time
+from functools import wraps
+
+from flask import current_app, g, has_request_context
+from flask_sqlalchemy.session import Session
+from sqlalchemy import event
+from sqlalchemy.sql import Select
+
+REPLICA_BIND_PREFIX = "replica_"
+
+# user id -> time of that user's last committed write (per process)
+_last_writes = {}
+_last_writes_lock = threading.Lock()
+
+
+def _request_user_id():
+    # Only a user Flask-Login already loaded for this request; after_commit can't query
+    return getattr(g.get("_login_user"), "id", None)
+
+
+def replica_binds(uris):
+    """SQLALCHEMY_BINDS entries for a comma separated list of replica URIs."""
+    return {f"{REPLICA_BIND_PREFIX}{i}": uri.strip() for i, uri in enumerate(uris.split(",")) if uri.strip()}
+
+
+class RoutingSession(Session):
+    """
+    Session that sends plain SELECTs to a read replica bind.
+
+    Routing only happens inside views decorated with @read_replica. Reads
+    stay on the primary when:
+    - the session has flushed writes (read-your-writes within the request)
+    - the user wrote something within READ_YOUR_WRITES_SECONDS (tracked in
+      per user id in this process, so cookie and bearer clients both work)
+    - the statement locks rows (FOR UPDATE)
+    - the model uses a non-default bind
+    """
+
+    def get_bind(self, mapper=None, clause=None, bind=None, **kwargs):
+        if bind is None and self._should_use_replica(mapper, clause):
+            engine = self._pick_replica()
+            if engine is not None:
+                return engine
+        return super().get_bind(mapper=mapper, clause=clause, bind=bind, **kwargs)
+
+    def _should_use_replica(self, mapper, clause):
+        if self._flushing or self.info.get("wrote"):
+            return False
+        if not has_request_context() or not g.get("use_replica"):
+            return False
+        if not isinstance(clause, Select) or clause._for_update_arg is not None:
+            return False
+        if mapper is not None and mapper.persist_selectable.metadata.info.get("bind_key") is not None:
+            return False
+        window = current_app.config.get("READ_YOUR_WRITES_SECONDS", 0)
+        if window:
+            user_id = _request_user_id()
+            if user_id is not None and _last_writes.get(user_id, 0) + window > time.time():
+                return False
+        return True
+
+    def _pick_replica(self):
+        engines = [engine for key, engine in self._db.engines.items() if key and key.startswith(REPLICA_BIND_PREFIX)]
+        return random.choice(engines) if engines else None
+
+
+@event.listens_for(RoutingSession, "after_flush")
+def _mark_session_wrote(session, flush_context):
+    session.info["wrote"] = True
+
+
+@event.listens_for(RoutingSession, "after_commit")
+def _remember_user_write(session):
+    if not session.info.get("wrote") or not has_request_context():
+        return
+    user_id = _request_user_id()
+    window = current_app.config.get("READ_YOUR_WRITES_SECONDS", 0)
+    if user_id is None or not window:
+        return
+    now = time.time()
+    with _last_writes_lock:
+        _last_writes[user_id] = now
+        if len(_last_writes) > 10000:
+            for key in [key for key, at in _last_writes.items() if at + window <= now]:
+                del _last_writes[key]
+
+
+def read_replica(f):
+    """Opt a view into serving its reads from a replica bind."""
+    @wraps(f)
+    def decorated_function(*args, **kwargs):
+        g.use_replica = True
+        try:
+            return f(*args, **kwargs)
+        finally:
+            g.use_replica = False
+    return decorated_function
@@ -0,0 +1,60 @@
+import csv
+import io
+import json
+
+
+# Spreadsheets evaluate cells starting with these as formulas (CSV injection)
+FORMULA_PREFIXES = ("=", "+", "-", "@", "\t", "\r")
+
+
+def _csv_value(value):
+    if value is None:
+        return ""
+    if isinstance(value, (list, dict)):
+        return json.dumps(value)
+    if isinstance(value, str) and value.startswith(FORMULA_PREFIXES):
+        return "'" + value
+    return value
+
+
+def ndjson_chunks(partitions, serializer, dumps):
+    """One JSON document per line, one chunk per fetched partition."""
+    for rows in partitions:
+        yield "".join(dumps(item) + "\n" for item in serializer.dump_rows(rows))
+
+
+def json_array_chunks(partitions, serializer, dumps):
+    """A single JSON array, emitted incrementally."""
+    yield "["
+    first = True
+    for rows in partitions:
+        items = serializer.dump_rows(rows)
+        if not items:
+            continue
+        yield ("" if first else ",") + ",".join(dumps(item) for item in items)
+        first = False
+    yield "]\n"
+
+
+def csv_chunks(partitions, serializer, dumps=None):
+    """CSV with a header row; JSON columns (skills, tags, ...) are written as JSON text."""
+    header = list(serializer.schema.dump_fields)
+    buffer = io.StringIO()
+    writer = csv.writer(buffer)
+    writer.writerow(header)
+    yield buffer.getvalue()
+
+    for rows in partitions:
+        buffer.seek(0)
+        buffer.truncate()
+        for item in serializer.dump_rows(rows):
+            writer.writerow([_csv_value(item.get(key)) for key in header])
+        yield buffer.getvalue()
+
+
+# format -> (chunk generator, mimetype, file extension)
+EXPORT_FORMATS = {
+    "ndjson": (ndjson_chunks, "application/x-ndjson", "ndjson"),
+    "json": (json_array_chunks, "application/json", "json"),
+    "csv": (csv_chunks, "text/csv", "csv"),
+}
@@ -0,0 +1,101 @@
+from datetime import date, datetime
+from functools import lru_cache
+from marshmallow import fields
+from marshmallow_enum import EnumField
+from sqlalchemy import select
+from sqlalchemy.orm import ColumnProperty
+
+
+class SerializerCompileError(ValueError):
+    pass
+
+
+class CompiledSerializer:
+    """
+    List serializer generated once from a marshmallow schema.
+
+    Reads SQLAlchemy `Row` tuples (select `columns`, not ORM entities) and
+    returns dicts that encode to the same JSON bytes as `schema.dump()`:
+    - enum fields use a member -> dumped value table built from the field itself
+    - datetimes use the field's format function, Decimals become str() as jsonify would
+    - fields with no direct column mapping are rejected at compile time
+    """
+
+    def __init__(self, schema):
+        self.schema = schema
+        self.model = schema.opts.model
+        self.columns = []
+        namespace = {}
+        entries = []
+
+        for index, (name, field) in enumerate(schema.dump_fields.items()):
+            attribute = field.attribute or name
+            column = getattr(self.model, attribute, None)
+            if column is None or not isinstance(getattr(column, "property", None), ColumnProperty):
+                raise SerializerCompileError(f"{type(schema).__name__}.{name} is not a column of {self.model.__name__}.")
+            self.columns.append(column.label(attribute))
+
+            key = field.data_key if field.data_key is not None else name
+            entries.append(f"{key!r}: {self._expression(index, name, field, namespace)}")
+
+        source = "def dump_rows(rows):\n    return [{%s} for row in rows]\n" % ", ".join(entries)
+        exec(compile(source, f"<serializer {type(schema).__name__}>", "exec"), namespace)
+        self.source = source
+        self.dump_rows = namespace["dump_rows"]
+
+    @staticmethod
+    def _expression(index, name, field, namespace):
+        value = f"row[{index}]"
+        field_type = type(field)
+
+        # Fields whose _serialize is the identity (Raw, Boolean)
+        if field_type._serialize is fields.Field._serialize:
+            return value
+
+        if isinstance(field, (EnumField, fields.Enum)):
+            enum_class = field.enum
+            table = {None: None}
+            for member in enum_class:
+                table[member] = field._serialize(member, name, None)
+            namespace[f"_enum_{index}"] = table
+            return f"_enum_{index}[{value}]"
+
+        if field_type in (fields.Integer, fields.Float) and not field.as_string:
+            namespace[f"_num_{index}"] = field.num_type
+            return f"(None if {value} is None else _num_{index}({value}))"
+
+        if field_type is fields.Decimal and field.places is None and not field.as_string:
+            # jsonify writes Decimals as str(); Decimal(str(v)) round-trips to the same text
+            return f"(None if {value} is None else str({value}))"
+
+        if field_type is fields.String:
+            return f"(None if {value} is None else {value} if type({value}) is str else str({value}))"
+
+        if field_type in (fields.DateTime, fields.Date):
+            data_format = field.format or field.DEFAULT_FORMAT
+            format_func = field.SERIALIZATION_FUNCS.get(data_format)
+            if format_func in (datetime.isoformat, date.isoformat):
+                return f"(None if {value} is None else {value}.isoformat())"
+
+        # Anything else goes through the field itself (Row supports attribute access)
+        namespace[f"_field_{index}"] = field
+        return f"_field_{index}.serialize({name!r}, row)"
+
+    def columns_with(self, *extra):
+        """`columns` plus any extra columns (e.g. keyset cursor keys) not already selected."""
+        selected = {column.key for column in self.columns}
+        return self.columns + [column.label(column.key) for column in extra if column.key not in selected]
+
+    def select(self):
+        return select(*self.columns)
+
+
+@lru_cache(maxsize=128)
+def _compile_schema(schema_class, only):
+    return CompiledSerializer(schema_class(many=True, only=only))
+
+
+def compile_schema(schema_class, only=None):
+    """Compiled serializer for `schema_class(only=only)`, built once per projection."""
+    # Output order follows the schema, so field order in `only` must not split the cache
+    return _compile_schema(schema_class, tuple(sorted(set(only))) if only else None)
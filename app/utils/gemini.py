@@ -1,103 +1,133 @@
-from google import genai
+import asyncio
 import os
 import json
 import re
+from app.utils.gemini_cache import gemini_cache
+from app.utils.json_stream import StreamingJSONExtractor
+from app.utils.gemini_gateway import GEMINI_MODEL, gemini_gateway
+from app.utils.prompts import render_prompt
+
+FEASIBILITY_STATUSES = ('valid', 'scam', 'unsure')
+
+
+def _parse_feasibility_status(text: str, cache_inputs: dict = None) -> str:
+    status = (text or "").strip().lower()
+
+    # Validate output
+    if status not in FEASIBILITY_STATUSES:
+        print(status)
+        return 'unsure'  # fallback if Gemini returns something unexpected
+
+    # Only genuine answers are cached, never fallbacks
+    if cache_inputs is not None:
+        gemini_cache.set("job_feasibility", cache_inputs, GEMINI_MODEL, status)
+    return status
 
-# The client gets the API key from the environment variable `GEMINI_API_KEY`.
-client = genai.Client(api_key="")
 
 def assess_job_feasibility(job_data: dict) -> str:
-    # Remove `feasibility_status` if present
-    job_data.pop('feasibility_status', None)
-
-    # Create a structured prompt
-    prompt = f"""
-    You are an Upwork job analyzer. Your job is to assess whether a given job post is:
-    - valid (real and trustworthy),
-    - scam (fraudulent or suspicious), or
-    - unsure (not enough information).
-
-    Here is the job data in JSON:
-    {job_data}
-
-    Based on the data above, respond only with one of the following:
-    - valid
-    - scam
-    - unsure
-    """
+    prompt = render_prompt("job_feasibility", job_data)
+
+    cached = gemini_cache.get("job_feasibility", prompt.cache_inputs, GEMINI_MODEL)
+    if cached is not None:
+        return cached
 
     # Call Gemini API
     try:
-        
-        response = client.models.generate_content(
-        model="gemini-2.5-flash", contents=prompt
-        )
-        status = response.text.strip().lower()
-
-        # Validate output
-        if status not in ['valid', 'scam', 'unsure']:
-            print(status)
-            return 'unsure'  # fallback if Gemini returns something unexpected
-        return status
+        response = gemini_gateway.generate(prompt.text, kind=prompt.template.key)
+        return _parse_feasibility_status(response.text, prompt.cache_inputs)
     except Exception as e:
         print("Error in Gemini call:", e)
         return 'unsure'
 
 
+async def _assess_job_feasibility_async(job_data: dict, semaphore: asyncio.Semaphore, timeout: float) -> str:
+    prompt = render_prompt("job_feasibility", job_data)
 
+    cached = gemini_cache.get("job_feasibility", prompt.cache_inputs, GEMINI_MODEL)
+    if cached is not None:
+        return cached
 
+    async with semaphore:
+        try:
+            response = await gemini_gateway.agenerate(prompt.text, kind=prompt.template.key, timeout=timeout)
+            return _parse_feasibility_status(response.text, prompt.cache_inputs)
+        except asyncio.TimeoutError:
+            print(f"Gemini call timed out after {timeout}s for job {job_data.get('job_id')}")
+            return 'unsure'
+        except Exception as e:
+            print("Error in Gemini call:", e)
+            return 'unsure'
 
-def assess_proposal_from_job(job_data: dict) -> dict:
 
-    prompt = f"""
-    You are a senior Upwork bidding assistant AI.
+async def _assess_jobs_feasibility_async(jobs_data: list, max_concurrency: int, timeout: float) -> list:
+    semaphore = asyncio.Semaphore(max(1, max_concurrency))
+    try:
+        return await asyncio.gather(*(
+            _assess_job_feasibility_async(job_data, semaphore, timeout) for job_data in jobs_data
+        ))
+    finally:
+        await gemini_gateway.aclose()
 
-    Given this job data, return a JSON with the following fields:
 
-    - "cover_letter": A professional Upwork cover letter in natural language.
-    - "proposal": A professional Upwork cproposal in natural language.
-    - "feasibility_score": A float between 0 and 100 (how feasible this job is to win).
-    - "feasibility_reason": 1-2 sentence reason explaining the score.
-    - "summary": A 1-2 sentence summary of the job.
-    - "project_duration": Estimated duration (e.g., "2-3 weeks", "1-2 months").
-    - "overall_score": Float between 0 and 100 representing AI confidence in job quality.
+def assess_jobs_feasibility(jobs_data: list, max_concurrency: int = 5, timeout: float = 30.0) -> list:
+    """
+    Score many jobs concurrently using the async Gemini client.
 
-    Job data:
-    {json.dumps(job_data, indent=2)}
+    At most `max_concurrency` calls are in flight at once and each call is
+    bounded by `timeout` seconds (timed out calls fall back to 'unsure').
+    Statuses are returned in the same order as `jobs_data`.
     """
+    if not jobs_data:
+        return []
+    return asyncio.run(_assess_jobs_feasibility_async(jobs_data, max_concurrency, timeout))
+
+
+
+
+
+PROPOSAL_STREAM_FIELDS = ("cover_letter", "proposal")
+
+
+def _normalize_proposal_result(result: dict) -> dict:
+    # Ensure required fields exist
+    return {
+        "cover_letter": result["cover_letter"],
+        "proposal": result["proposal"],
+        "feasibility_score": float(result["feasibility_score"]),
+        "feasibility_reason": result["feasibility_reason"],
+        "summary": result["summary"],
+        "project_duration": result["project_duration"],
+        "overall_score": float(result["overall_score"]),
+    }
+
+
+def assess_proposal_from_job(job_data: dict, fallback: bool = True) -> dict:
+    """
+    Draft a proposal for one job. On failure returns an empty fallback
+    draft, or re-raises the error when `fallback` is False.
+    """
+    prompt = render_prompt("proposal", job_data)
+
+    cached = gemini_cache.get("proposal", prompt.cache_inputs, GEMINI_MODEL)
+    if cached is not None:
+        return cached
 
     try:
-        response = client.models.generate_content(
-        model="gemini-2.5-flash", contents=prompt
-        )
+        response = gemini_gateway.generate(prompt.text, kind=prompt.template.key)
         output = response.text.strip()
 
         # Optional logging
         # print("[Gemini Raw Output]", output)
         result = extract_json_from_text(output)
-        # print(parsed_data)
-        # Parse AI response
-        # result = json.loads(parsed_data)
         print(result)
-        # Ensure required fields exist and default if needed
-        return {
-            "cover_letter": result["cover_letter"],
-            "proposal": result["proposal"],
-            "feasibility_score": float(result["feasibility_score"]),
-            "feasibility_reason": result["feasibility_reason"],
-            "summary": result["summary"],
-            "project_duration": result["project_duration"],
-            "overall_score": float(result["overall_score"]),
-            # "cover_letter": result.get("cover_letter", ""),
-            # "feasibility_score": float(result.get("feasibility_score", 0)),
-            # "feasibility_reason": result.get("feasibility_reason", ""),
-            # "summary": result.get("summary", ""),
-            # "project_duration": result.get("project_duration", ""),
-            # "overall_score": float(result.get("overall_score", 0)),
-        }
+        proposal = _normalize_proposal_result(result)
+        gemini_cache.set("proposal", prompt.cache_inputs, GEMINI_MODEL, proposal)
+        return proposal
 
     except Exception as e:
         print("[Gemini Error]", e)
+        if not fallback:
+            raise
         return {
             "cover_letter": "",
             "feasibility_score": 0,
@@ -106,7 +136,78 @@ def assess_proposal_from_job(job_data: dict) -> dict:
             "project_duration": "",
             "overall_score": 0,
         }
-    
+
+
+async def _assess_proposal_from_job_async(job_data: dict, semaphore: asyncio.Semaphore, timeout: float) -> dict:
+    prompt = render_prompt("proposal", job_data)
+
+    cached = gemini_cache.get("proposal", prompt.cache_inputs, GEMINI_MODEL)
+    if cached is not None:
+        return cached
+
+    async with semaphore:
+        response = await gemini_gateway.agenerate(prompt.text, kind=prompt.template.key, timeout=timeout)
+    proposal = _normalize_proposal_result(extract_json_from_text(response.text.strip()))
+    gemini_cache.set("proposal", prompt.cache_inputs, GEMINI_MODEL, proposal)
+    return proposal
+
+
+async def _assess_proposals_from_jobs_async(jobs_data: list, max_concurrency: int, timeout: float) -> list:
+    semaphore = asyncio.Semaphore(max(1, max_concurrency))
+    try:
+        return await asyncio.gather(*(
+            _assess_proposal_from_job_async(job_data, semaphore, timeout) for job_data in jobs_data
+        ), return_exceptions=True)
+    finally:
+        await gemini_gateway.aclose()
+
+
+def assess_proposals_from_jobs(jobs_data: list, max_concurrency: int = 5, timeout: float = 60.0) -> list:
+    """
+    Draft proposals for many jobs concurrently using the async Gemini client.
+
+    Returns one entry per job in input order: the parsed proposal dict, or
+    the exception that call raised (timeouts included) so a single failure
+    doesn't abort the batch.
+    """
+    if not jobs_data:
+        return []
+    return asyncio.run(_assess_proposals_from_jobs_async(jobs_data, max_concurrency, timeout))
+
+
+def stream_proposal_from_job(job_data: dict):
+    """
+    Stream a proposal draft from Gemini.
+
+    Yields ("delta", field, text) for cover_letter / proposal text as it
+    arrives and finishes with ("result", None, proposal_dict). Errors are
+    raised to the caller instead of returning a fallback.
+    """
+    prompt = render_prompt("proposal", job_data)
+
+    cached = gemini_cache.get("proposal", prompt.cache_inputs, GEMINI_MODEL)
+    if cached is not None:
+        for field in PROPOSAL_STREAM_FIELDS:
+            if cached.get(field):
+                yield ("delta", field, cached[field])
+        yield ("result", None, cached)
+        return
+
+    extractor = StreamingJSONExtractor(PROPOSAL_STREAM_FIELDS)
+    for chunk in gemini_gateway.stream(prompt.text, kind=f"{prompt.template.key}:stream"):
+        for field, text in extractor.feed(chunk.text or ""):
+            yield ("delta", field, text)
+        if extractor.done:
+            break
+
+    proposal = _normalize_proposal_result(extractor.result())
+    gemini_cache.set("proposal", prompt.cache_inputs, GEMINI_MODEL, proposal)
+    yield ("result", None, proposal)
+
+def invalidate_proposal_cache(job_data: dict) -> None:
+    gemini_cache.invalidate("proposal", render_prompt("proposal", job_data).cache_inputs, GEMINI_MODEL)
+
+
 def generate_dummy_upwork_jobs() -> list:
     prompt = """
 Create 10 realistic Upwork job postings in JSON format. Each job should follow this exact structure:
@@ -142,9 +243,7 @@ Return only the list of 10 jobs as JSON array.
 """
 
 
-    response = client.models.generate_content(
-        model="gemini-2.5-flash", contents=prompt
-        )
+    response = gemini_gateway.generate(prompt, kind="dummy_jobs")
     
     # Step 1: Extract the JSON string
     raw_text = response.candidates[0].content.parts[0].text.strip()
@@ -179,15 +278,6 @@ def extract_json_from_text(text):
     """
     Extract the JSON object from a string that may be wrapped in ```json ... ```
     """
-    match = re.search(r"```json\s*(.*?)\s*```", text, re.DOTALL)
-    if match:
-        json_str = match.group(1).strip()
-    else:
-        # Fallback: try to extract first {...} JSON block
-        match = re.search(r"({.*})", text, re.DOTALL)
-        if match:
-            json_str = match.group(1).strip()
-        else:
-            raise ValueError("No JSON content found in Gemini output.")
-    print(json_str)
-    return json.loads(json_str)
\ No newline at end of file
+    extractor = StreamingJSONExtractor()
+    extractor.feed(text)
+    return extractor.result()
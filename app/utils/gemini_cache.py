@@ -0,0 +1,196 @@
+import hashlib
+import json
+import threading
+from datetime import datetime, timedelta, timezone
+
+from cachetools import TTLCache
+
+
+def make_cache_key(kind: str, inputs, model: str) -> str:
+    """
+    Canonical content hash of the prompt inputs plus the model name.
+
+    Keys are sorted and non-JSON values (Decimal, datetime, ...) are
+    stringified so equal inputs always hash the same.
+    """
+    payload = json.dumps(
+        {"kind": kind, "model": model, "inputs": inputs},
+        sort_keys=True,
+        separators=(",", ":"),
+        default=str
+    )
+    return hashlib.sha256(payload.encode("utf-8")).hexdigest()
+
+
+class MemoryCacheBackend:
+    """In-process TTL/LRU cache built on cachetools."""
+
+    def __init__(self, maxsize=1024, ttl=3600):
+        self._cache = TTLCache(maxsize=maxsize, ttl=ttl)
+        self._lock = threading.Lock()
+
+    def get(self, key):
+        with self._lock:
+            entry = self._cache.get(key)
+        return entry[1] if entry is not None else None
+
+    def set(self, key, value, kind=None, model=None):
+        with self._lock:
+            self._cache[key] = (kind, value)
+
+    def delete(self, key):
+        with self._lock:
+            self._cache.pop(key, None)
+
+    def clear(self, kind=None):
+        with self._lock:
+            if not kind:
+                self._cache.clear()
+                return
+            for key in [key for key, entry in self._cache.items() if entry[0] == kind]:
+                self._cache.pop(key, None)
+
+
+class DatabaseCacheBackend:
+    """
+    Persistent cache stored in the `gemini_cache_entries` table.
+
+    Writes run in their own transaction on a separate connection, so they
+    never commit or roll back whatever the caller's session has pending.
+    """
+
+    def __init__(self, ttl=7 * 24 * 3600):
+        self.ttl = ttl
+
+    def get(self, key):
+        from app.extensions import db
+        from app.models.gemini_cache_entry import GeminiCacheEntry
+
+        entry = db.session.get(GeminiCacheEntry, key)
+        if not entry:
+            return None
+
+        expires_at = entry.expires_at
+        if expires_at is not None:
+            if expires_at.tzinfo is None:
+                expires_at = expires_at.replace(tzinfo=timezone.utc)
+            if expires_at <= datetime.now(timezone.utc):
+                return None
+        return entry.value
+
+    def set(self, key, value, kind=None, model=None):
+        from app.extensions import db
+        from app.models.gemini_cache_entry import GeminiCacheEntry
+
+        table = GeminiCacheEntry.__table__
+        expires_at = datetime.now(timezone.utc) + timedelta(seconds=self.ttl) if self.ttl else None
+        try:
+            with db.engine.begin() as connection:
+                connection.execute(table.delete().where(table.c.key == key))
+                connection.execute(table.insert().values(
+                    key=key,
+                    kind=kind or "unknown",
+                    model=model or "unknown",
+                    value=value,
+                    created_at=datetime.now(timezone.utc),
+                    expires_at=expires_at
+                ))
+        except Exception as e:
+            print("[Gemini Cache] Failed to persist entry:", e)
+
+    def delete(self, key):
+        from app.extensions import db
+        from app.models.gemini_cache_entry import GeminiCacheEntry
+
+        table = GeminiCacheEntry.__table__
+        with db.engine.begin() as connection:
+            connection.execute(table.delete().where(table.c.key == key))
+
+    def clear(self, kind=None):
+        from app.extensions import db
+        from app.models.gemini_cache_entry import GeminiCacheEntry
+
+        table = GeminiCacheEntry.__table__
+        statement = table.delete()
+        if kind:
+            statement = statement.where(table.c.kind == kind)
+        with db.engine.begin() as connection:
+            connection.execute(statement)
+
+
+class GeminiCache:
+    """Content-addressed cache for parsed Gemini responses with hit/miss counters."""
+
+    def __init__(self, backend=None):
+        self.backend = backend
+        self.hits = 0
+        self.misses = 0
+        self._lock = threading.Lock()
+
+    @property
+    def enabled(self):
+        return self.backend is not None
+
+    def _count(self, hit):
+        with self._lock:
+            if hit:
+                self.hits += 1
+            else:
+                self.misses += 1
+
+    def get(self, kind, inputs, model):
+        if not self.enabled:
+            return None
+        try:
+            value = self.backend.get(make_cache_key(kind, inputs, model))
+        except Exception as e:
+            print("[Gemini Cache] Lookup failed:", e)
+            value = None
+        self._count(value is not None)
+        return value
+
+    def set(self, kind, inputs, model, value):
+        if not self.enabled:
+            return
+        self.backend.set(make_cache_key(kind, inputs, model), value, kind=kind, model=model)
+
+    def invalidate(self, kind, inputs, model):
+        if self.enabled:
+            self.backend.delete(make_cache_key(kind, inputs, model))
+
+    def clear(self, kind=None):
+        if self.enabled:
+            self.backend.clear(kind)
+
+    def stats(self):
+        with self._lock:
+            total = self.hits + self.misses
+            return {
+                "backend": type(self.backend).__name__ if self.backend else None,
+                "hits": self.hits,
+                "misses": self.misses,
+                "hit_rate": round(self.hits / total, 4) if total else 0.0
+            }
+
+    def reset_stats(self):
+        with self._lock:
+            self.hits = 0
+            self.misses = 0
+
+
+# Shared cache used by app/utils/gemini.py, configured in create_app()
+gemini_cache = GeminiCache(MemoryCacheBackend())
+
+
+def init_gemini_cache(app):
+    backend = app.config.get("GEMINI_CACHE_BACKEND", "memory")
+    ttl = app.config.get("GEMINI_CACHE_TTL_SECONDS", 3600)
+
+    if backend == "memory":
+        gemini_cache.backend = MemoryCacheBackend(maxsize=app.config.get("GEMINI_CACHE_MAXSIZE", 1024), ttl=ttl)
+    elif backend == "database":
+        gemini_cache.backend = DatabaseCacheBackend(ttl=ttl)
+    elif backend in (None, "", "none"):
+        gemini_cache.backend = None
+    else:
+        raise ValueError(f"Unknown GEMINI_CACHE_BACKEND '{backend}'")
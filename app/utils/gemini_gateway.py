@@ -0,0 +1,374 @@
+import asyncio
+import threading
+import time
+from collections import Counter, defaultdict, deque
+
+import httpx
+from google import genai
+from google.genai import errors as genai_errors
+from google.genai import types as genai_types
+from tenacity import (
+    AsyncRetrying, Retrying, retry_if_exception, stop_after_attempt, stop_after_delay, wait_random_exponential
+)
+
+from app.utils.prompts import estimate_tokens
+from app.utils.rate_limit import MemoryBucketStore
+from app.utils.sql_profiler import percentile
+
+GEMINI_MODEL = "gemini-2.5-flash"
+
+# Upstream statuses worth retrying (and counted against the circuit breaker)
+RETRYABLE_STATUS = {408, 429, 500, 502, 503, 504}
+
+
+class GatewayError(Exception):
+    pass
+
+
+class CircuitOpenError(GatewayError):
+    pass
+
+
+class RateLimitExceeded(GatewayError):
+    pass
+
+
+def is_retryable(exc):
+    if isinstance(exc, genai_errors.APIError):
+        return exc.code in RETRYABLE_STATUS
+    return isinstance(exc, (httpx.TransportError, asyncio.TimeoutError, TimeoutError))
+
+
+class CircuitBreaker:
+    """
+    Consecutive-failure breaker.
+
+    closed -> open after `failure_threshold` upstream failures in a row;
+    open -> half_open after `reset_timeout` seconds, letting one trial call
+    through; the trial's outcome closes or re-opens the circuit.
+    """
+
+    CLOSED, OPEN, HALF_OPEN = "closed", "open", "half_open"
+
+    def __init__(self, failure_threshold=5, reset_timeout=30.0):
+        self.failure_threshold = failure_threshold
+        self.reset_timeout = reset_timeout
+        self.state = self.CLOSED
+        self.failures = 0
+        self.opened_at = 0.0
+        self._trial_in_flight = False
+        self._lock = threading.Lock()
+
+    def allow(self) -> bool:
+        with self._lock:
+            if self.state == self.OPEN and time.monotonic() - self.opened_at >= self.reset_timeout:
+                self.state = self.HALF_OPEN
+                self._trial_in_flight = False
+            if self.state == self.CLOSED:
+                return True
+            if self.state == self.HALF_OPEN and not self._trial_in_flight:
+                self._trial_in_flight = True
+                return True
+            return False
+
+    def record_success(self):
+        with self._lock:
+            self.state = self.CLOSED
+            self.failures = 0
+            self._trial_in_flight = False
+
+    def record_failure(self):
+        with self._lock:
+            self.failures += 1
+            self._trial_in_flight = False
+            if self.state == self.HALF_OPEN or self.failures >= self.failure_threshold:
+                self.state = self.OPEN
+                self.opened_at = time.monotonic()
+
+    def release(self):
+        # The call never reached the upstream; let the next caller take the trial
+        with self._lock:
+            self._trial_in_flight = False
+
+    def snapshot(self):
+        with self._lock:
+            return {"state": self.state, "consecutive_failures": self.failures}
+
+
+class GeminiRateLimiter:
+    """Request and input-token buckets per minute, waiting up to `max_wait` seconds for capacity."""
+
+    def __init__(self, requests_per_minute=60, tokens_per_minute=250000, max_wait=30.0, store=None):
+        self.store = store or MemoryBucketStore()
+        self.requests_per_minute = requests_per_minute
+        self.tokens_per_minute = tokens_per_minute
+        self.max_wait = max_wait
+
+    def acquire_steps(self, tokens):
+        """Yields how long to sleep until both buckets grant; raises RateLimitExceeded past max_wait."""
+        deadline = time.monotonic() + self.max_wait
+        buckets = (
+            ("gemini:requests", self.requests_per_minute, 1),
+            ("gemini:tokens", self.tokens_per_minute, min(tokens, self.tokens_per_minute)),
+        )
+        for key, per_minute, cost in buckets:
+            if not per_minute:
+                continue
+            while True:
+                allowed, retry_after = self.store.consume(key, per_minute, per_minute / 60.0, cost)
+                if allowed:
+                    break
+                if time.monotonic() + retry_after > deadline:
+                    raise RateLimitExceeded(f"Gemini {key.split(':')[1]} budget exhausted for {self.max_wait}s.")
+                yield retry_after
+
+
+class GatewayMetrics:
+    """Per-kind call counts, retries, latency samples and token usage."""
+
+    def __init__(self, window=1000):
+        self.window = window
+        self._lock = threading.Lock()
+        self._latencies = defaultdict(lambda: deque(maxlen=self.window))
+        self._counts = defaultdict(Counter)
+
+    def record(self, kind, outcome, latency=None, attempts=1, usage=None, estimated_tokens=None):
+        with self._lock:
+            counts = self._counts[kind]
+            counts[outcome] += 1
+            counts["retries"] += max(0, attempts - 1)
+            if latency is not None:
+                self._latencies[kind].append(latency)
+            if estimated_tokens is not None:
+                counts["estimated_prompt_tokens"] += estimated_tokens
+            if usage is not None:
+                counts["prompt_tokens"] += usage.prompt_token_count or 0
+                counts["output_tokens"] += usage.candidates_token_count or 0
+                counts["total_tokens"] += usage.total_token_count or 0
+
+    def throttled(self, kind, seconds):
+        with self._lock:
+            self._counts[kind]["throttled"] += 1
+            self._counts[kind]["throttled_ms"] += int(seconds * 1000)
+
+    def snapshot(self):
+        with self._lock:
+            counts = {kind: dict(values) for kind, values in self._counts.items()}
+            latencies = {kind: [v * 1000 for v in values] for kind, values in self._latencies.items()}
+        return {
+            kind: {
+                **values,
+                "latency_ms": {p: round(percentile(latencies.get(kind, []), n), 2) for p, n in (("p50", 50), ("p95", 95), ("p99", 99))},
+            }
+            for kind, values in counts.items()
+        }
+
+    def reset(self):
+        with self._lock:
+            self._latencies.clear()
+            self._counts.clear()
+
+
+class GeminiGateway:
+    """
+    Single entry point for Gemini calls: rate limiting, retries with
+    exponential backoff (tenacity), a circuit breaker and metrics.
+
+    The genai client is built lazily, so importing the app needs no API key,
+    and GEMINI_BASE_URL can point it at a local fake server
+    (see benchmarks/fake_gemini.py).
+    """
+
+    def __init__(self):
+        self.api_key = None
+        self.base_url = None
+        self.timeout = 30.0
+        self.retry_attempts = 4
+        self.retry_max_wait = 20.0
+        self.limiter = GeminiRateLimiter()
+        self.breaker = CircuitBreaker()
+        self.metrics = GatewayMetrics()
+        self._client = None
+        self._async_clients = {}
+        self._lock = threading.Lock()
+
+    def configure(self, api_key=None, base_url=None, timeout=30.0, retry_attempts=4, retry_max_wait=20.0,
+                  requests_per_minute=60, tokens_per_minute=250000, max_wait=30.0,
+                  failure_threshold=5, reset_timeout=30.0):
+        self.api_key = api_key
+        self.base_url = base_url
+        self.timeout = timeout
+        self.retry_attempts = retry_attempts
+        self.retry_max_wait = retry_max_wait
+        self.limiter = GeminiRateLimiter(requests_per_minute, tokens_per_minute, max_wait)
+        self.breaker = CircuitBreaker(failure_threshold, reset_timeout)
+        with self._lock:
+            self._client = None
+            self._async_clients = {}
+
+    def _new_client(self):
+        http_options = genai_types.HttpOptions(
+            base_url=self.base_url or None,
+            timeout=int(self.timeout * 1000) if self.timeout else None
+        )
+        # api_key=None falls back to the GEMINI_API_KEY / GOOGLE_API_KEY environment variables
+        return genai.Client(api_key=self.api_key or None, http_options=http_options)
+
+    @property
+    def client(self):
+        with self._lock:
+            if self._client is None:
+                self._client = self._new_client()
+            return self._client
+
+    def _async_client(self):
+        # httpx async pools are bound to one event loop; each asyncio.run() gets its own client
+        loop = asyncio.get_running_loop()
+        with self._lock:
+            self._async_clients = {key: value for key, value in self._async_clients.items() if not key[1].is_closed()}
+            key = (id(loop), loop)
+            if key not in self._async_clients:
+                self._async_clients[key] = self._new_client().aio
+            return self._async_clients[key]
+
+    async def aclose(self):
+        """Close the running loop's async client; call before the loop ends (e.g. at the end of asyncio.run)."""
+        loop = asyncio.get_running_loop()
+        with self._lock:
+            aio = self._async_clients.pop((id(loop), loop), None)
+        # google-genai (pinned in requirements.txt) has no public close for the
+        # async client; skip it if an upgrade renames these private attributes
+        httpx_client = getattr(getattr(aio, "_api_client", None), "_async_httpx_client", None)
+        if httpx_client is not None:
+            await httpx_client.aclose()
+
+    def _retrying(self, retrying_class, deadline=None):
+        stop = stop_after_attempt(self.retry_attempts)
+        if deadline:
+            # Don't start another backoff once the overall budget is spent
+            stop = stop | stop_after_delay(deadline)
+        return retrying_class(
+            stop=stop,
+            wait=wait_random_exponential(multiplier=0.5, max=self.retry_max_wait),
+            retry=retry_if_exception(is_retryable),
+            reraise=True,
+        )
+
+    def _check_breaker(self, kind):
+        if not self.breaker.allow():
+            self.metrics.record(kind, "short_circuited")
+            raise CircuitOpenError("Gemini circuit is open; failing fast while the upstream recovers.")
+
+    def _finish(self, kind, started, attempts, tokens, response=None, error=None):
+        latency = time.perf_counter() - started
+        if isinstance(error, RateLimitExceeded):
+            self.breaker.release()
+            self.metrics.record(kind, "rate_limited", attempts=attempts)
+        elif error is None:
+            self.breaker.record_success()
+            self.metrics.record(kind, "success", latency, attempts, getattr(response, "usage_metadata", None), tokens)
+        elif is_retryable(error):
+            self.breaker.record_failure()
+            self.metrics.record(kind, "failure", latency, attempts)
+        else:
+            # The upstream answered (e.g. 400); that says nothing about its health
+            self.breaker.record_success()
+            self.metrics.record(kind, "error", latency, attempts)
+
+    def generate(self, contents, kind="generate", model=GEMINI_MODEL):
+        self._check_breaker(kind)
+        started, attempts, tokens = time.perf_counter(), 0, estimate_tokens(contents)
+        try:
+            for attempt in self._retrying(Retrying):
+                with attempt:
+                    attempts += 1
+                    for delay in self.limiter.acquire_steps(tokens):
+                        self.metrics.throttled(kind, delay)
+                        time.sleep(delay)
+                    response = self.client.models.generate_content(model=model, contents=contents)
+        except Exception as e:
+            self._finish(kind, started, attempts, tokens, error=e)
+            raise
+        self._finish(kind, started, attempts, tokens, response=response)
+        return response
+
+    async def agenerate(self, contents, kind="generate", model=GEMINI_MODEL, timeout=None):
+        """
+        `timeout` bounds the whole call: rate-limit waits, every attempt and
+        the backoff between them. Past it, asyncio.TimeoutError is raised.
+        """
+        self._check_breaker(kind)
+        timeout = timeout or self.timeout
+        started, attempts, tokens = time.perf_counter(), 0, estimate_tokens(contents)
+
+        async def call():
+            nonlocal attempts
+            async for attempt in self._retrying(AsyncRetrying, deadline=timeout):
+                with attempt:
+                    attempts += 1
+                    for delay in self.limiter.acquire_steps(tokens):
+                        self.metrics.throttled(kind, delay)
+                        await asyncio.sleep(delay)
+                    result = await self._async_client().models.generate_content(model=model, contents=contents)
+            return result
+
+        try:
+            response = await asyncio.wait_for(call(), timeout=timeout)
+        except Exception as e:
+            self._finish(kind, started, attempts, tokens, error=e)
+            raise
+        self._finish(kind, started, attempts, tokens, response=response)
+        return response
+
+    def stream(self, contents, kind="stream", model=GEMINI_MODEL):
+        """
+        Stream response chunks. Retries only cover opening the stream (up to
+        the first chunk); once text has been yielded, errors are raised.
+        """
+        self._check_breaker(kind)
+        started, attempts, last = time.perf_counter(), 0, None
+        tokens = estimate_tokens(contents)
+        try:
+            for attempt in self._retrying(Retrying):
+                with attempt:
+                    attempts += 1
+                    for delay in self.limiter.acquire_steps(tokens):
+                        self.metrics.throttled(kind, delay)
+                        time.sleep(delay)
+                    chunks = iter(self.client.models.generate_content_stream(model=model, contents=contents))
+                    first = next(chunks, None)
+
+            for chunk in ([first] if first is not None else []):
+                last = chunk
+                yield chunk
+            for chunk in chunks:
+                last = chunk
+                yield chunk
+        except GeneratorExit:
+            self._finish(kind, started, attempts, tokens, response=last)
+            raise
+        except Exception as e:
+            self._finish(kind, started, attempts, tokens, error=e)
+            raise
+        self._finish(kind, started, attempts, tokens, response=last)
+
+    def snapshot(self):
+        return {"circuit": self.breaker.snapshot(), "calls": self.metrics.snapshot()}
+
+
+gemini_gateway = GeminiGateway()
+
+
+def init_gemini_gateway(app):
+    gemini_gateway.configure(
+        api_key=app.config.get("GEMINI_API_KEY"),
+        base_url=app.config.get("GEMINI_BASE_URL"),
+        timeout=app.config.get("GEMINI_TIMEOUT_SECONDS", 30.0),
+        retry_attempts=app.config.get("GEMINI_RETRY_ATTEMPTS", 4),
+        retry_max_wait=app.config.get("GEMINI_RETRY_MAX_WAIT_SECONDS", 20.0),
+        requests_per_minute=app.config.get("GEMINI_RATE_LIMIT_RPM", 60),
+        tokens_per_minute=app.config.get("GEMINI_RATE_LIMIT_TPM", 250000),
+        max_wait=app.config.get("GEMINI_RATE_LIMIT_MAX_WAIT_SECONDS", 30.0),
+        failure_threshold=app.config.get("GEMINI_BREAKER_FAILURE_THRESHOLD", 5),
+        reset_timeout=app.config.get("GEMINI_BREAKER_RESET_SECONDS", 30.0),
+    )
@@ -0,0 +1,124 @@
+import hashlib
+from datetime import timezone
+from functools import wraps
+from flask import current_app, make_response, request
+from sqlalchemy import func
+from app.extensions import db
+from app.utils.compression import ETAG_SUFFIXES, encoded_etag
+
+# Cache-Control per blueprint for GET / HEAD responses (override with HTTP_CACHE_CONTROL)
+DEFAULT_CACHE_CONTROL = {
+    "project": "private, no-cache",
+    "task": "private, no-cache",
+    "workspace": "private, no-cache",
+    "upwork_job": "private, no-cache",
+    "proposal": "private, no-cache",
+    "search": "private, no-cache",
+    "auth": "no-store",
+    "metrics": "no-store",
+    "export": "no-store",
+}
+
+
+def make_etag(*parts) -> str:
+    return hashlib.sha1("|".join(str(part) for part in parts).encode("utf-8")).hexdigest()
+
+
+def _as_utc(value):
+    if value is None:
+        return None
+    if value.tzinfo is None:
+        value = value.replace(tzinfo=timezone.utc)
+    return value.astimezone(timezone.utc)
+
+
+def row_validators(model, pk_arg):
+    """
+    Validators for a single-row endpoint: the row's updated_at, read with a narrow query.
+
+    Returns a callable(**view_args) -> (etag, last_modified), or None when the row is missing.
+    """
+    def validators(**view_args):
+        row = (
+            db.session.query(model.updated_at, model.created_at)
+            .filter(model.id == view_args[pk_arg])
+            .first()
+        )
+        if row is None:
+            return None
+        version = _as_utc(row.updated_at or row.created_at)
+        return make_etag(request.endpoint, view_args[pk_arg], version and version.isoformat()), version
+    return validators
+
+
+def table_validators(model):
+    """
+    Validators for a list endpoint: MAX(updated_at) plus COUNT(*) so deletes change the ETag too.
+    """
+    def validators(**view_args):
+        last_modified, count = db.session.query(func.max(model.updated_at), func.count(model.id)).one()
+        last_modified = _as_utc(last_modified)
+        return make_etag(request.endpoint, request.query_string.decode("utf-8"), count,
+                         last_modified and last_modified.isoformat()), last_modified
+    return validators
+
+
+def _matching_etag(etag, last_modified):
+    """The validator to echo on a 304, or None when the client's copy is stale."""
+    # If-None-Match wins over If-Modified-Since (RFC 9110 13.2.2)
+    if request.if_none_match:
+        # Compressed representations carry "<etag>-<encoding>" (app/utils/compression.py)
+        for candidate in (etag, *(encoded_etag(etag, encoding) for encoding in ETAG_SUFFIXES)):
+            if request.if_none_match.contains(candidate):
+                return candidate
+        return None
+    if last_modified is not None and request.if_modified_since is not None:
+        if last_modified.replace(microsecond=0) <= request.if_modified_since:
+            return etag
+    return None
+
+
+def conditional_get(validators):
+    """
+    Answer GET / HEAD with 304 Not Modified before the view loads or serializes anything.
+
+    `validators(**view_args)` returns (etag, last_modified) or None to let the view handle a miss.
+    Successful responses get strong ETag and Last-Modified headers.
+    """
+    def decorator(view):
+        @wraps(view)
+        def wrapper(*args, **kwargs):
+            found = validators(**kwargs)
+            if found is None:
+                return view(*args, **kwargs)
+
+            etag, last_modified = found
+            matched = _matching_etag(etag, last_modified)
+            if matched is not None:
+                response = make_response("", 304)
+                etag = matched
+            else:
+                response = make_response(view(*args, **kwargs))
+                if response.status_code != 200:
+                    return response
+
+            response.set_etag(etag)
+            if last_modified is not None:
+                response.last_modified = last_modified
+            return response
+        return wrapper
+    return decorator
+
+
+def init_http_cache(app):
+    policies = {**DEFAULT_CACHE_CONTROL, **app.config.get("HTTP_CACHE_CONTROL", {})}
+
+    @app.after_request
+    def apply_cache_control(response):
+        if request.method not in ("GET", "HEAD") or "Cache-Control" in response.headers:
+            return response
+        policy = policies.get(request.blueprint)
+        if policy:
+            response.headers["Cache-Control"] = policy
+            response.vary.update(("Cookie", "Authorization"))
+        return response
@@ -1,9 +1,5 @@
-import secrets
-import string
-import uuid
 import re
-from app.extensions import db
-from app.models.workspace import Workspace
+from app.utils.code_allocator import random_code
 
 def slugify_name(name):
     """
@@ -12,16 +8,11 @@ def slugify_name(name):
     slug = re.sub(r'[^A-Za-z0-9]', '', name)[:5].upper()
     return slug or "WS"
 
-def generate_unique_invite_code(name, length=5, max_attempts=10):
-    prefix = slugify_name(name)
-    charset = string.ascii_uppercase + string.digits
-
-    for _ in range(max_attempts):
-        suffix = ''.join(secrets.choice(charset) for _ in range(length))
-        code = f"{prefix}-{suffix}"
-        exists = db.session.query(Workspace.id).filter_by(invite_code=code).first()
-        if not exists:
-            return code
+def generate_invite_code(name, length=5):
+    """
+    Random invite code like FRONT-7K2QX.
 
-    # Fallback to UUID
-    return f"{prefix}-{uuid.uuid4().hex[:8].upper()}"
+    Uniqueness is enforced by the unique constraint on insert
+    (see add_with_unique_retry), not by probing the table first.
+    """
+    return random_code(slugify_name(name), length)
@@ -0,0 +1,137 @@
+import json
+
+
+class StreamingJSONExtractor:
+    """
+    Incremental extractor for the first top-level JSON object in LLM output.
+
+    Text before the opening brace (e.g. a ```json fence) is ignored. While
+    chunks arrive, `feed()` returns (key, text) deltas for the top-level
+    string values named in `stream_keys`, so they can be forwarded before
+    the object is complete. `result()` returns the fully parsed object.
+    """
+
+    def __init__(self, stream_keys=()):
+        self.stream_keys = set(stream_keys)
+        self.done = False
+
+        self._started = False
+        self._buffer = []
+        self._depth = 0
+        self._in_string = False
+        self._escape = False
+        self._expect_key = False
+        self._is_key = False
+
+        self._key_raw = []
+        self._current_key = None
+        self._value_raw = []
+        self._streaming_value = False
+        self._emitted = 0
+
+    def feed(self, chunk):
+        events = []
+        for ch in chunk:
+            if self.done:
+                break
+
+            if not self._started:
+                if ch == '{':
+                    self._started = True
+                    self._depth = 1
+                    self._expect_key = True
+                    self._buffer.append(ch)
+                continue
+
+            self._buffer.append(ch)
+
+            if self._in_string:
+                if self._escape:
+                    self._escape = False
+                    self._collect(ch)
+                elif ch == '\\':
+                    self._escape = True
+                    self._collect(ch)
+                elif ch == '"':
+                    self._in_string = False
+                    if self._is_key:
+                        self._current_key = _decode_string(''.join(self._key_raw))
+                    elif self._streaming_value:
+                        self._emit(events, final=True)
+                        self._streaming_value = False
+                else:
+                    self._collect(ch)
+                continue
+
+            if ch == '"':
+                self._in_string = True
+                if self._depth == 1 and self._expect_key:
+                    self._is_key = True
+                    self._key_raw = []
+                else:
+                    self._is_key = False
+                    self._streaming_value = self._depth == 1 and self._current_key in self.stream_keys
+                    self._value_raw = []
+                    self._emitted = 0
+            elif ch in '{[':
+                self._depth += 1
+            elif ch in '}]':
+                self._depth -= 1
+                if self._depth == 0:
+                    self.done = True
+            elif self._depth == 1 and ch == ':':
+                self._expect_key = False
+            elif self._depth == 1 and ch == ',':
+                self._expect_key = True
+
+        if self._in_string and self._streaming_value:
+            self._emit(events)
+        return events
+
+    def _collect(self, ch):
+        if self._is_key:
+            self._key_raw.append(ch)
+        elif self._streaming_value:
+            self._value_raw.append(ch)
+
+    def _emit(self, events, final=False):
+        raw = ''.join(self._value_raw)
+        if not final:
+            raw = _trim_partial_escape(raw)
+        text = _decode_string(raw)
+        if text is None:
+            return
+        if not final and text and '\ud800' <= text[-1] <= '\udbff':
+            text = text[:-1]  # wait for the low half of a surrogate pair
+        delta = text[self._emitted:]
+        if delta:
+            events.append((self._current_key, delta))
+            self._emitted = len(text)
+
+    def result(self):
+        if not self._started:
+            raise ValueError("No JSON content found in Gemini output.")
+        if not self.done:
+            raise ValueError("Gemini output ended before the JSON object was complete.")
+        return json.loads(''.join(self._buffer))
+
+
+def _trim_partial_escape(raw):
+    # Drop a trailing escape sequence that hasn't fully arrived yet (\ or \uXX)
+    trailing = len(raw) - len(raw.rstrip('\\'))
+    if trailing % 2 == 1:
+        return raw[:-1]
+
+    start = raw.rfind('\\u', max(0, len(raw) - 5))
+    if start != -1:
+        preceding = start - len(raw[:start].rstrip('\\'))
+        if preceding % 2 == 0:
+            return raw[:start]
+    return raw
+
+
+def _decode_string(raw):
+    try:
+        return json.loads('"' + raw + '"')
+    except ValueError:
+        return None
@@ -0,0 +1,124 @@
+import base64
+import json
+from datetime import date, datetime
+from decimal import Decimal
+from sqlalchemy import and_, or_
+from sqlalchemy.orm import load_only
+
+DEFAULT_PAGE_SIZE = 50
+MAX_PAGE_SIZE = 200
+
+
+class PaginationError(ValueError):
+    pass
+
+
+def parse_limit(value, default=DEFAULT_PAGE_SIZE, maximum=MAX_PAGE_SIZE):
+    if value in (None, ""):
+        return default
+    try:
+        limit = int(value)
+    except (TypeError, ValueError):
+        raise PaginationError("limit must be an integer.")
+    if limit < 1:
+        raise PaginationError("limit must be at least 1.")
+    return min(limit, maximum)
+
+
+def _encode_value(value):
+    if isinstance(value, (datetime, date)):
+        return value.isoformat()
+    if isinstance(value, Decimal):
+        return str(value)
+    return value
+
+
+def _decode_value(column, value):
+    if value is None:
+        return None
+    python_type = column.type.python_type
+    if python_type is datetime:
+        return datetime.fromisoformat(value)
+    if python_type is Decimal:
+        return Decimal(value)
+    return python_type(value)
+
+
+def encode_cursor(sort_value, row_id, sort_key="created_at"):
+    payload = json.dumps([sort_key, _encode_value(sort_value), row_id])
+    return base64.urlsafe_b64encode(payload.encode("utf-8")).decode("ascii")
+
+
+def decode_cursor(cursor, sort_column):
+    try:
+        sort_key, value, row_id = json.loads(base64.urlsafe_b64decode(cursor.encode("ascii")))
+    except Exception:
+        raise PaginationError("Invalid cursor.")
+    if sort_key != sort_column.key:
+        raise PaginationError("Cursor does not match the requested sort order.")
+    try:
+        return _decode_value(sort_column, value), int(row_id)
+    except Exception:
+        raise PaginationError("Invalid cursor.")
+
+
+def parse_fields(value, schema_fields, required=()):
+    """
+    Turn a `fields=a,b,c` query value into the list of schema fields to dump.
+
+    Returns None when no projection was requested (dump everything).
+    """
+    if not value:
+        return None
+    requested = [name.strip() for name in value.split(",") if name.strip()]
+    unknown = [name for name in requested if name not in schema_fields]
+    if unknown:
+        raise PaginationError(f"Unknown fields: {', '.join(unknown)}")
+    return list(dict.fromkeys(list(required) + requested))
+
+
+def _after_cursor(model, sort_column, descending, value, row_id):
+    # NULLs sort lowest on both MySQL and SQLite: last when descending, first when ascending
+    if descending:
+        if value is None:
+            return and_(sort_column.is_(None), model.id < row_id)
+        return or_(
+            sort_column < value,
+            and_(sort_column == value, model.id < row_id),
+            sort_column.is_(None)
+        )
+    if value is None:
+        return or_(and_(sort_column.is_(None), model.id > row_id), sort_column.isnot(None))
+    return or_(sort_column > value, and_(sort_column == value, model.id > row_id))
+
+
+def keyset_paginate(query, model, limit, cursor=None, fields=None, sort_column=None, descending=True):
+    """
+    Keyset pagination on (sort_column, id), newest `created_at` first by default.
+
+    Loads only `fields` (plus the cursor columns) when a projection is given.
+    Returns (items, next_cursor); next_cursor is None on the last page.
+    """
+    sort_column = sort_column if sort_column is not None else model.created_at
+
+    if fields:
+        columns = {"id", sort_column.key, *fields}
+        query = query.options(load_only(*[getattr(model, name) for name in columns if hasattr(model, name)]))
+
+    if cursor:
+        value, row_id = decode_cursor(cursor, sort_column)
+        query = query.filter(_after_cursor(model, sort_column, descending, value, row_id))
+
+    if descending:
+        query = query.order_by(sort_column.desc(), model.id.desc())
+    else:
+        query = query.order_by(sort_column.asc(), model.id.asc())
+
+    items = query.limit(limit + 1).all()
+
+    next_cursor = None
+    if len(items) > limit:
+        items = items[:limit]
+        last = items[-1]
+        next_cursor = encode_cursor(getattr(last, sort_column.key), last.id, sort_column.key)
+    return items, next_cursor
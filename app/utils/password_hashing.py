@@ -0,0 +1,94 @@
+import secrets
+import threading
+from concurrent.futures import ProcessPoolExecutor, TimeoutError as FutureTimeout
+
+from werkzeug.security import check_password_hash, generate_password_hash
+
+
+class HashingBusy(Exception):
+    """Raised when the hashing pool's queue is full."""
+
+
+class PasswordHasher:
+    """
+    Runs password hashing in a bounded process pool.
+
+    Slow hashes (scrypt/pbkdf2) are deliberately CPU heavy. Running them in
+    request threads lets a login burst starve every other endpoint, so they
+    go to `workers` processes, and at most `max_pending` jobs may wait.
+    Extra requests get HashingBusy and can be answered with 503 right away.
+    """
+
+    def __init__(self, workers=2, max_pending=32, timeout=10.0, method="scrypt"):
+        self.workers = workers
+        self.timeout = timeout
+        self.method = method
+        self._slots = threading.BoundedSemaphore(max_pending)
+        self._executor = None
+        self._lock = threading.Lock()
+        self._policy_prefix = None
+        self._dummy_hash = None
+
+    def configure(self, workers, max_pending, timeout, method):
+        with self._lock:
+            if self._executor is not None:
+                self._executor.shutdown(wait=False)
+                self._executor = None
+            self.workers = workers
+            self.timeout = timeout
+            self.method = method
+            self._slots = threading.BoundedSemaphore(max_pending)
+            self._policy_prefix = None
+            self._dummy_hash = None
+
+    def _pool(self):
+        # Created lazily so each (forked) server process gets its own pool
+        if self._executor is None:
+            with self._lock:
+                if self._executor is None:
+                    self._executor = ProcessPoolExecutor(max_workers=self.workers)
+        return self._executor
+
+    def _run(self, fn, *args):
+        if not self._slots.acquire(blocking=False):
+            raise HashingBusy()
+        try:
+            return self._pool().submit(fn, *args).result(timeout=self.timeout)
+        except FutureTimeout:
+            raise HashingBusy()
+        finally:
+            self._slots.release()
+
+    def verify(self, password_hash, password):
+        return self._run(check_password_hash, password_hash, password)
+
+    def verify_dummy(self, password):
+        """
+        Same cost as verify() for an account that doesn't exist, so response
+        time doesn't reveal which emails are registered. Always False.
+        """
+        if self._dummy_hash is None:
+            self._dummy_hash = generate_password_hash("dummy-" + secrets.token_hex(16), self.method)
+        self.verify(self._dummy_hash, password)
+        return False
+
+    def hash(self, password):
+        return self._run(generate_password_hash, password, self.method)
+
+    def needs_rehash(self, password_hash):
+        """True when the stored hash was made with different parameters than the policy."""
+        if self._policy_prefix is None:
+            self._policy_prefix = generate_password_hash("policy-probe", self.method).split("$", 1)[0]
+        return password_hash.split("$", 1)[0] != self._policy_prefix
+
+
+password_hasher = PasswordHasher()
+
+
+def init_password_hasher(app):
+    password_hasher.configure(
+        workers=app.config.get("PASSWORD_HASH_WORKERS", 2),
+        max_pending=app.config.get("PASSWORD_HASH_MAX_PENDING", 32),
+        timeout=app.config.get("PASSWORD_HASH_TIMEOUT_SECONDS", 10.0),
+        method=app.config.get("PASSWORD_HASH_METHOD", "scrypt"),
+    )
@@ -0,0 +1,238 @@
+from collections import defaultdict
+from datetime import datetime, timezone
+from decimal import Decimal
+from types import SimpleNamespace
+from sqlalchemy import case, delete, func, insert, select, update
+from app.models.project import Project
+from app.models.project_stats import ProjectStats
+from app.models.proposal import Proposal
+from app.models.task import Task
+from app.enums import ProposalStatusEnum, TaskStatusEnum
+
+# TaskStatusEnum -> ProjectStats counter column
+STATUS_COLUMNS = {status: f"{status.value}_tasks" for status in TaskStatusEnum}
+OPEN_STATUSES = [status for status in TaskStatusEnum if status is not TaskStatusEnum.done]
+
+stats_table = ProjectStats.__table__
+
+
+def as_status(value):
+    # Schema loads leave plain strings on the instance until the next refresh
+    if value is None or isinstance(value, TaskStatusEnum):
+        return value
+    return TaskStatusEnum(value)
+
+
+def compute_project_stats(connection, project_ids=None):
+    """
+    Stats rows computed from the base tables, without writing them.
+
+    `connection` may also be a Session, so read-only callers stay on its routing.
+    """
+    projects_query = select(Project.id, Project.workspace_id, Project.job_id)
+    tasks_query = select(Task.project_id, Task.status, func.count(Task.id)).group_by(Task.project_id, Task.status)
+    if project_ids is not None:
+        project_ids = list(set(project_ids))
+        if not project_ids:
+            return []
+        projects_query = projects_query.where(Project.id.in_(project_ids))
+        tasks_query = tasks_query.where(Task.project_id.in_(project_ids))
+
+    projects = connection.execute(projects_query).all()
+    task_counts = defaultdict(dict)
+    for project_id, status, count in connection.execute(tasks_query):
+        task_counts[project_id][as_status(status)] = count
+    proposal_stats = _proposal_aggregates(connection, {project.job_id for project in projects})
+
+    now = datetime.now(timezone.utc)
+    rows = []
+    for project in projects:
+        counts = task_counts.get(project.id, {})
+        row = {
+            "project_id": project.id,
+            "workspace_id": project.workspace_id,
+            "total_tasks": sum(counts.values()),
+            **{column: counts.get(status, 0) for status, column in STATUS_COLUMNS.items()},
+            **proposal_stats.get(project.job_id, _empty_proposal_stats()),
+            "updated_at": now,
+        }
+        rows.append(row)
+    return rows
+
+
+def rebuild_project_stats(connection, project_ids=None):
+    """
+    Recompute stats rows from the base tables (all projects when `project_ids` is None).
+
+    Used for bulk writes that bypass ORM events and `flask stats rebuild`.
+    """
+    if project_ids is not None:
+        project_ids = list(set(project_ids))
+        if not project_ids:
+            return
+    rows = compute_project_stats(connection, project_ids)
+
+    if project_ids is None:
+        connection.execute(delete(stats_table))
+    else:
+        connection.execute(delete(stats_table).where(stats_table.c.project_id.in_(project_ids)))
+    if rows:
+        connection.execute(insert(stats_table), rows)
+
+
+def _empty_proposal_stats():
+    return {
+        "proposal_count": 0,
+        "accepted_proposals": 0,
+        "expected_earnings": Decimal("0"),
+        "feasibility_score_sum": 0.0,
+        "feasibility_score_count": 0,
+    }
+
+
+def _proposal_aggregates(connection, job_ids):
+    if not job_ids:
+        return {}
+    accepted = Proposal.status == ProposalStatusEnum.accepted
+    rows = connection.execute(
+        select(
+            Proposal.job_id,
+            func.count(Proposal.id),
+            func.sum(case((accepted, 1), else_=0)),
+            func.sum(case((accepted, Proposal.expected_earnings), else_=0)),
+            func.sum(Proposal.feasibility_score),
+            func.count(Proposal.feasibility_score),
+        )
+        .where(Proposal.job_id.in_(list(job_ids)))
+        .group_by(Proposal.job_id)
+    )
+    return {
+        job_id: {
+            "proposal_count": count,
+            "accepted_proposals": int(accepted_count or 0),
+            "expected_earnings": Decimal(str(earnings or 0)),
+            "feasibility_score_sum": float(score_sum or 0),
+            "feasibility_score_count": score_count,
+        }
+        for job_id, count, accepted_count, earnings, score_sum, score_count in rows
+    }
+
+
+def apply_task_change(connection, old=None, new=None):
+    """
+    Move one task between (project_id, status) buckets; `old` / `new` are None on insert / delete.
+
+    Each side is a single UPDATE col = col +/- 1, so the cost does not grow with task count.
+    """
+    if old == new:
+        return
+    now = datetime.now(timezone.utc)
+    for bucket, delta in ((old, -1), (new, 1)):
+        if bucket is None:
+            continue
+        project_id, status = bucket
+        column = stats_table.c[STATUS_COLUMNS[as_status(status)]]
+        result = connection.execute(
+            update(stats_table)
+            .where(stats_table.c.project_id == project_id)
+            .values({
+                column: column + delta,
+                stats_table.c.total_tasks: stats_table.c.total_tasks + delta,
+                stats_table.c.updated_at: now,
+            })
+        )
+        if result.rowcount == 0:
+            # Project predates the stats table: materialize its row from scratch
+            rebuild_project_stats(connection, [project_id])
+
+
+def refresh_proposal_stats(connection, job_ids):
+    """Recompute the proposal columns for every project on the given Upwork jobs."""
+    job_ids = {job_id for job_id in job_ids if job_id is not None}
+    if not job_ids:
+        return
+    aggregates = _proposal_aggregates(connection, job_ids)
+    projects = connection.execute(select(Project.id, Project.job_id).where(Project.job_id.in_(list(job_ids)))).all()
+    now = datetime.now(timezone.utc)
+    for project_id, job_id in projects:
+        result = connection.execute(
+            update(stats_table)
+            .where(stats_table.c.project_id == project_id)
+            .values(**aggregates.get(job_id, _empty_proposal_stats()), updated_at=now)
+        )
+        if result.rowcount == 0:
+            rebuild_project_stats(connection, [project_id])
+
+
+def _overdue_counts(session, project_filter):
+    # Depends on the clock, so it is counted at read time off ix_tasks_project_due
+    now = datetime.now(timezone.utc).replace(tzinfo=None)
+    return dict(
+        session.query(Task.project_id, func.count(Task.id))
+        .filter(project_filter, Task.due_date.isnot(None), Task.due_date < now, Task.status.in_(OPEN_STATUSES))
+        .group_by(Task.project_id)
+        .all()
+    )
+
+
+def _rollup(stats_rows, overdue):
+    totals = {
+        "total_tasks": 0,
+        "tasks_by_status": {status.value: 0 for status in TaskStatusEnum},
+        "overdue_tasks": sum(overdue.values()),
+        "proposal_count": 0,
+        "accepted_proposals": 0,
+        "expected_earnings": Decimal("0"),
+    }
+    score_sum, score_count = 0.0, 0
+    for stats in stats_rows:
+        totals["total_tasks"] += stats.total_tasks
+        for status, column in STATUS_COLUMNS.items():
+            totals["tasks_by_status"][status.value] += getattr(stats, column)
+        totals["proposal_count"] += stats.proposal_count
+        totals["accepted_proposals"] += stats.accepted_proposals
+        totals["expected_earnings"] += Decimal(str(stats.expected_earnings or 0))
+        score_sum += stats.feasibility_score_sum
+        score_count += stats.feasibility_score_count
+
+    done = totals["tasks_by_status"][TaskStatusEnum.done.value]
+    totals["completion_percent"] = round(done * 100.0 / totals["total_tasks"], 2) if totals["total_tasks"] else 0.0
+    totals["avg_feasibility_score"] = round(score_sum / score_count, 2) if score_count else None
+    totals["expected_earnings"] = float(totals["expected_earnings"])
+    totals["updated_at"] = max((stats.updated_at for stats in stats_rows if stats.updated_at is not None), default=None)
+    if totals["updated_at"] is not None:
+        totals["updated_at"] = totals["updated_at"].isoformat()
+    return totals
+
+
+def _computed_stats(session, project_ids):
+    # Projects without a stats row (created before the table existed) are
+    # counted on the fly; `flask stats rebuild` materializes them. They have
+    # no stored updated_at.
+    return [SimpleNamespace(**{**row, "updated_at": None}) for row in compute_project_stats(session, project_ids)]
+
+
+def project_rollup(session, project_id):
+    stats = session.get(ProjectStats, project_id)
+    if stats is None:
+        stats = next(iter(_computed_stats(session, [project_id])), None)
+    overdue = _overdue_counts(session, Task.project_id == project_id)
+    return {"project_id": project_id, **_rollup([stats] if stats else [], overdue)}
+
+
+def workspace_rollup(session, workspace_id):
+    stats_rows = session.query(ProjectStats).filter_by(workspace_id=workspace_id).all()
+
+    known = {stats.project_id for stats in stats_rows}
+    project_ids = [row.id for row in session.query(Project.id).filter_by(workspace_id=workspace_id)]
+    missing = [project_id for project_id in project_ids if project_id not in known]
+    if missing:
+        stats_rows += _computed_stats(session, missing)
+
+    overdue = _overdue_counts(session, Task.project_id.in_(project_ids)) if project_ids else {}
+    rollup = _rollup(stats_rows, overdue)
+    rollup["projects"] = [
+        {"project_id": stats.project_id, **_rollup([stats], {stats.project_id: overdue.get(stats.project_id, 0)})}
+        for stats in stats_rows
+    ]
+    return {"workspace_id": workspace_id, "project_count": len(stats_rows), **rollup}
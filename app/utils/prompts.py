@@ -0,0 +1,252 @@
+import json
+import re
+from dataclasses import dataclass
+from datetime import date, datetime
+from decimal import Decimal
+
+# Word / number / symbol pieces; a cheap stand-in for Gemini's tokenizer
+_PIECE_RE = re.compile(r"[^\W\d_]+|\d|[^\w\s]|_", re.UNICODE)
+_WORD_RE = re.compile(r"[^\W\d_]+", re.UNICODE)
+_SINGLE_RE = re.compile(r"\d|[^\w\s]|_", re.UNICODE)
+_WHITESPACE_RE = re.compile(r"\s+")
+
+TRUNCATION_MARK = " …"
+
+
+def _piece_tokens(piece: str) -> int:
+    # Digits are tokenized one by one; long words split into a few subwords
+    return (len(piece) + 6) // 7 if piece[0].isalpha() else 1
+
+
+def estimate_tokens(text) -> int:
+    """Fast local token estimate (no tokenizer round trip); good enough for budgets and rate limits."""
+    text = str(text)
+    # Same count as summing _piece_tokens over _PIECE_RE, without a Python call per piece
+    words = _WORD_RE.findall(text)
+    return max(1, len(_SINGLE_RE.findall(text)) + sum((len(word) + 6) // 7 for word in words))
+
+
+def truncate_to_tokens(text: str, max_tokens: int) -> str:
+    """Cut `text` at a piece boundary so it estimates to at most `max_tokens` (plus the marker)."""
+    if max_tokens <= 0:
+        return ""
+    used = 0
+    for match in _PIECE_RE.finditer(text):
+        used += _piece_tokens(match.group())
+        if used > max_tokens:
+            return text[:match.start()].rstrip() + TRUNCATION_MARK
+    return text
+
+
+def _canonical_value(value):
+    if isinstance(value, str):
+        value = _WHITESPACE_RE.sub(" ", value).strip()
+        return value or None
+    if isinstance(value, (Decimal, float)):
+        value = float(value)
+        return int(value) if value.is_integer() else round(value, 2)
+    if isinstance(value, datetime):
+        return value.date().isoformat()
+    if isinstance(value, date):
+        return value.isoformat()
+    if isinstance(value, (list, tuple)):
+        seen, items = set(), []
+        for item in value:
+            item = _canonical_value(item)
+            if item is not None and str(item).lower() not in seen:
+                seen.add(str(item).lower())
+                items.append(item)
+        return items or None
+    if isinstance(value, dict):
+        return {k: v for k, v in ((k, _canonical_value(v)) for k, v in value.items()) if v is not None} or None
+    return value
+
+
+def compact_job_data(job_data: dict, fields) -> dict:
+    """
+    Canonical, compacted copy of `job_data` limited to `fields` (in that order).
+
+    Whitespace is collapsed, empty values are dropped, numbers lose trailing
+    .0, datetimes become dates and list items are de-duplicated, so equal jobs
+    give equal dicts (and equal cache keys) however they were built.
+    """
+    compacted = {}
+    for name in fields:
+        value = _canonical_value(job_data.get(name))
+        if name == "posted_at" and isinstance(value, str):
+            value = value[:10]
+        if value is not None:
+            compacted[name] = value
+    return compacted
+
+
+def format_job_block(data: dict) -> str:
+    # "key: value" lines cost fewer tokens than indented JSON
+    lines = []
+    for name, value in data.items():
+        if isinstance(value, list):
+            value = ", ".join(str(item) for item in value)
+        elif isinstance(value, bool):
+            value = "yes" if value else "no"
+        elif isinstance(value, dict):
+            value = json.dumps(value, separators=(",", ":"), ensure_ascii=False)
+        lines.append(f"{name}: {value}")
+    return "\n".join(lines)
+
+
+@dataclass(frozen=True)
+class RenderedPrompt:
+    template: "PromptTemplate"
+    text: str
+    inputs: dict
+    tokens: int
+    truncated: tuple = ()
+
+    @property
+    def cache_inputs(self) -> dict:
+        # Version is part of the key so template changes never serve stale answers
+        return {"template": self.template.key, "job": self.inputs}
+
+
+@dataclass(frozen=True)
+class PromptTemplate:
+    """
+    A versioned prompt. Bump `version` whenever `text`, `fields` or the
+    budgets change; the version is part of cache keys and gateway metric kinds.
+
+    `job_budget` caps the estimated tokens of the job block. When it is over,
+    `truncate` fields are shortened in order, each down to its minimum.
+    """
+    kind: str
+    version: str
+    text: str
+    fields: tuple
+    job_budget: int = 0  # 0 = no budget
+    truncate: tuple = ()  # ((field, min_tokens), ...) cheapest to lose first
+    legacy_format: callable = None  # pre-compaction rendering, kept for A/B comparisons
+    exclude: tuple = ()  # fields the legacy format leaves out
+
+    @property
+    def key(self) -> str:
+        return f"{self.kind}@{self.version}"
+
+    def _fit(self, data: dict):
+        truncated = []
+        if not self.job_budget:
+            return data, truncated
+
+        overflow = estimate_tokens(format_job_block(data)) - self.job_budget
+        for name, min_tokens in self.truncate:
+            if overflow <= 0:
+                break
+            if name not in data:
+                continue
+            current = estimate_tokens(data[name])
+            allowed = max(min_tokens, current - overflow)
+            if allowed >= current:
+                continue
+            shortened = truncate_to_tokens(data[name], allowed)
+            if shortened:
+                data[name] = shortened
+                overflow -= current - estimate_tokens(shortened)
+            else:
+                data.pop(name)
+                overflow -= current + estimate_tokens(f"{name}:")
+            truncated.append(name)
+        return data, truncated
+
+    def render(self, job_data: dict) -> RenderedPrompt:
+        if self.legacy_format is not None:
+            data = {k: v for k, v in job_data.items() if k not in self.exclude}
+            text = self.text.format(job=self.legacy_format(data))
+            return RenderedPrompt(self, text, _canonical_value(data) or {}, estimate_tokens(text))
+
+        data, truncated = self._fit(compact_job_data(job_data, self.fields))
+        text = self.text.format(job=format_job_block(data))
+        return RenderedPrompt(self, text, data, estimate_tokens(text), tuple(truncated))
+
+
+_FEASIBILITY_TEXT = """
+    You are an Upwork job analyzer. Your job is to assess whether a given job post is:
+    - valid (real and trustworthy),
+    - scam (fraudulent or suspicious), or
+    - unsure (not enough information).
+
+    Here is the job data:
+{job}
+
+    Based on the data above, respond only with one of the following:
+    - valid
+    - scam
+    - unsure
+    """
+
+_PROPOSAL_TEXT = """
+    You are a senior Upwork bidding assistant AI.
+
+    Given this job data, return a JSON with the following fields:
+
+    - "cover_letter": A professional Upwork cover letter in natural language.
+    - "proposal": A professional Upwork cproposal in natural language.
+    - "feasibility_score": A float between 0 and 100 (how feasible this job is to win).
+    - "feasibility_reason": 1-2 sentence reason explaining the score.
+    - "summary": A 1-2 sentence summary of the job.
+    - "project_duration": Estimated duration (e.g., "2-3 weeks", "1-2 months").
+    - "overall_score": Float between 0 and 100 representing AI confidence in job quality.
+
+    Job data:
+{job}
+    """
+
+_FEASIBILITY_FIELDS = (
+    "title", "description", "category", "skills", "budget", "budget_type", "project_length", "hours_per_week",
+    "posted_at", "connect_required", "proposals_submitted", "interviewing", "invites_sent",
+    "client_country", "client_payment_verified", "client_total_spent", "client_jobs_posted",
+    "client_hire_rate", "client_reviews",
+)
+
+_PROPOSAL_FIELDS = (
+    "title", "description", "category", "skills", "tags", "budget", "budget_type", "project_length",
+    "hours_per_week", "connect_required", "proposals_submitted", "interviewing", "invites_sent",
+    "client_country", "client_payment_verified", "client_total_spent", "client_jobs_posted",
+    "client_hire_rate", "client_reviews", "expected_earnings", "feasibility_status",
+)
+
+TEMPLATES = {
+    template.key: template
+    for template in (
+        # v1: the original prompts (raw dict repr / indented JSON, every field)
+        PromptTemplate("job_feasibility", "v1", _FEASIBILITY_TEXT.replace("job data:", "job data in JSON:"),
+                       (), legacy_format=lambda data: "    " + str(data), exclude=("feasibility_status",)),
+        PromptTemplate("proposal", "v1", _PROPOSAL_TEXT, (),
+                       legacy_format=lambda data: "    " + json.dumps(data, indent=2)),
+        # v2: compacted job block with token budgets
+        PromptTemplate("job_feasibility", "v2", _FEASIBILITY_TEXT, _FEASIBILITY_FIELDS, job_budget=500,
+                       truncate=(("client_reviews", 40), ("description", 250))),
+        PromptTemplate("proposal", "v2", _PROPOSAL_TEXT, _PROPOSAL_FIELDS, job_budget=1200,
+                       truncate=(("client_reviews", 60), ("description", 800))),
+    )
+}
+
+# kind -> active version; overridden by GEMINI_PROMPT_VERSIONS
+active_versions = {"job_feasibility": "v2", "proposal": "v2"}
+
+
+def get_template(kind: str, version: str = None) -> PromptTemplate:
+    key = f"{kind}@{version or active_versions[kind]}"
+    if key not in TEMPLATES:
+        raise KeyError(f"Unknown prompt template '{key}'.")
+    return TEMPLATES[key]
+
+
+def render_prompt(kind: str, job_data: dict, version: str = None) -> RenderedPrompt:
+    return get_template(kind, version).render(job_data)
+
+
+def init_prompts(app):
+    # e.g. "job_feasibility=v1,proposal=v2" to pin versions for an A/B comparison
+    for item in (app.config.get("GEMINI_PROMPT_VERSIONS") or "").split(","):
+        kind, _, version = item.strip().partition("=")
+        if kind and version:
+            get_template(kind, version)
+            active_versions[kind] = version
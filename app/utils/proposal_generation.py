@@ -0,0 +1,54 @@
+from app.models.proposal import Proposal
+from app.enums import ProposalStatusEnum
+
+
+def build_job_data(job) -> dict:
+    """Prepare an UpworkJob for Gemini (cleaned + no duplicate keys)."""
+    return {
+        "job_id": job.job_id,
+        "title": job.title,
+        "description": job.description,
+        "skills": job.skills,
+        "category": job.category,
+        "budget": float(job.budget or 0),
+        "budget_type": job.budget_type.value if job.budget_type else None,
+        "project_length": job.project_length,
+        "hours_per_week": job.hours_per_week,
+        "client_country": job.client_country,
+        "client_payment_verified": job.client_payment_verified,
+        "client_total_spent": float(job.client_total_spent or 0),
+        "client_jobs_posted": job.client_jobs_posted,
+        "client_hire_rate": job.client_hire_rate,
+        "connect_required": job.connect_required,
+        "expected_cost": float(job.expected_cost or 0),
+        "expected_earnings": float(job.expected_earnings or 0),
+        "feasibility_status": job.feasibility_status.value if job.feasibility_status else None,
+        "tags": job.tags,
+        "posted_at": str(job.posted_at) if job.posted_at else None,
+        "client_reviews": job.client_reviews,
+        "proposals_submitted": job.proposals_submitted,
+        "interviewing": job.interviewing,
+        "invites_sent": job.invites_sent,
+        "job_url": job.job_url
+    }
+
+
+def build_proposal(job, user_id, parsed_data: dict) -> Proposal:
+    """Create (but don't add) a draft Proposal from a parsed Gemini result."""
+    return Proposal(
+        job_id=job.id,
+        generated_by=user_id,
+        cover_letter=parsed_data["cover_letter"],
+        proposal=parsed_data["proposal"],
+        feasibility_score=parsed_data["feasibility_score"],
+        feasibility_reason=parsed_data["feasibility_reason"],
+        connects_required=job.connect_required,
+        expected_cost=job.expected_cost,
+        expected_earnings=job.expected_earnings,
+        job_description=job.description,
+        summary=parsed_data["summary"],
+        project_duration=parsed_data["project_duration"],
+        overall_score=parsed_data["overall_score"],
+        tags=job.skills,
+        status=ProposalStatusEnum.draft
+    )
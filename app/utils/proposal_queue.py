@@ -0,0 +1,192 @@
+import threading
+import time
+from concurrent.futures import ThreadPoolExecutor
+from datetime import datetime, timedelta, timezone
+
+from app.extensions import db
+from app.enums import GenerationJobStatusEnum
+
+
+class ProposalQueue:
+    """
+    DB-backed queue for asynchronous proposal generation.
+
+    Rows in `proposal_generation_jobs` are the queue. Web processes hand
+    new rows to an in-process thread pool; `flask proposals work` runs the
+    same claim/process loop as a standalone worker. Claiming is an atomic
+    UPDATE ... WHERE status='pending', so any number of workers can share
+    the table without an external broker.
+
+    Rows left `running` longer than `running_timeout` (a worker crashed
+    mid-job) are returned to pending. In inline mode a sweeper thread
+    re-submits pending rows once at startup and then every
+    PROPOSAL_QUEUE_SWEEP_SECONDS, so a restart doesn't strand them.
+    """
+
+    def __init__(self):
+        self.app = None
+        self.executor = None
+        self.running_timeout = 600
+        self._submitted = set()
+        self._lock = threading.Lock()
+        self._sweeper = None
+
+    def init_app(self, app):
+        self.app = app
+        self.running_timeout = app.config.get("PROPOSAL_QUEUE_RUNNING_TIMEOUT_SECONDS", 600)
+        if app.config.get("PROPOSAL_QUEUE_INLINE_WORKERS", True):
+            self.executor = ThreadPoolExecutor(
+                max_workers=app.config.get("PROPOSAL_QUEUE_WORKERS", 4),
+                thread_name_prefix="proposal-worker"
+            )
+            sweep_interval = app.config.get("PROPOSAL_QUEUE_SWEEP_SECONDS", 60)
+
+            # Started by the first request, so CLI commands (migrations, workers) don't run it
+            @app.before_request
+            def start_proposal_sweeper():
+                if self._sweeper is None:
+                    self._start_sweeper(sweep_interval)
+
+    def _start_sweeper(self, interval):
+        with self._lock:
+            if self._sweeper is not None:
+                return
+            self._sweeper = threading.Thread(
+                target=self._sweep_forever, args=(interval,), name="proposal-sweeper", daemon=True
+            )
+        self._sweeper.start()
+
+    def _sweep_forever(self, interval):
+        while True:
+            with self.app.app_context():
+                try:
+                    self.sweep()
+                except Exception as e:
+                    print("[Proposal Queue] Sweep failed:", e)
+                finally:
+                    db.session.remove()
+            time.sleep(interval)
+
+    def enqueue(self, generation_job_id):
+        """Hand a committed pending row to the in-process pool (if enabled)."""
+        if self.executor is None:
+            return
+        with self._lock:
+            if generation_job_id in self._submitted:
+                return
+            self._submitted.add(generation_job_id)
+        self.executor.submit(self._run_in_context, generation_job_id)
+
+    def _run_in_context(self, generation_job_id):
+        with self.app.app_context():
+            try:
+                self.process(generation_job_id)
+            finally:
+                db.session.remove()
+                with self._lock:
+                    self._submitted.discard(generation_job_id)
+
+    def _pending_ids(self, limit):
+        from app.models.proposal_generation_job import ProposalGenerationJob
+
+        pending_ids = [
+            row.id for row in
+            db.session.query(ProposalGenerationJob.id)
+            .filter_by(status=GenerationJobStatusEnum.pending)
+            .order_by(ProposalGenerationJob.id)
+            .limit(limit)
+        ]
+        db.session.commit()  # end the read transaction so new rows are visible next poll
+        return pending_ids
+
+    def reclaim_stale(self):
+        """Return rows stuck in `running` past `running_timeout` to pending. Returns the count."""
+        from app.models.proposal_generation_job import ProposalGenerationJob
+
+        cutoff = datetime.now(timezone.utc) - timedelta(seconds=self.running_timeout)
+        reclaimed = (
+            ProposalGenerationJob.query
+            .filter(
+                ProposalGenerationJob.status == GenerationJobStatusEnum.running,
+                ProposalGenerationJob.started_at < cutoff
+            )
+            .update({"status": GenerationJobStatusEnum.pending, "started_at": None}, synchronize_session=False)
+        )
+        db.session.commit()
+        return reclaimed
+
+    def sweep(self, batch_size=100):
+        """Reclaim stale rows and hand pending ones to the in-process pool."""
+        self.reclaim_stale()
+        for generation_job_id in self._pending_ids(batch_size):
+            self.enqueue(generation_job_id)
+
+    def claim(self, generation_job_id):
+        from app.models.proposal_generation_job import ProposalGenerationJob
+
+        claimed = (
+            ProposalGenerationJob.query
+            .filter_by(id=generation_job_id, status=GenerationJobStatusEnum.pending)
+            .update(
+                {"status": GenerationJobStatusEnum.running, "started_at": datetime.now(timezone.utc)},
+                synchronize_session=False
+            )
+        )
+        db.session.commit()
+        return claimed == 1
+
+    def process(self, generation_job_id):
+        """Claim and run one generation job. Returns False if another worker owns it."""
+        from app.models.proposal_generation_job import ProposalGenerationJob
+        from app.utils.gemini import assess_proposal_from_job, invalidate_proposal_cache
+        from app.utils.proposal_generation import build_job_data, build_proposal
+        from app.utils.search import get_search_service
+
+        if not self.claim(generation_job_id):
+            return False
+
+        generation_job = db.session.get(ProposalGenerationJob, generation_job_id)
+        try:
+            job = generation_job.job
+            job_data = build_job_data(job)
+            if generation_job.refresh:
+                invalidate_proposal_cache(job_data)
+
+            # No fallback draft here: a failed call should fail the job with its real error
+            parsed_data = assess_proposal_from_job(job_data, fallback=False)
+            proposal = build_proposal(job, generation_job.requested_by, parsed_data)
+            db.session.add(proposal)
+            db.session.flush()
+
+            generation_job.proposal_id = proposal.id
+            generation_job.status = GenerationJobStatusEnum.done
+            generation_job.finished_at = datetime.now(timezone.utc)
+            db.session.commit()
+
+            get_search_service("proposals").index(proposal)
+
+        except Exception as e:
+            db.session.rollback()
+            generation_job = db.session.get(ProposalGenerationJob, generation_job_id)
+            generation_job.status = GenerationJobStatusEnum.failed
+            generation_job.error = f"{type(e).__name__}: {e}"
+            generation_job.finished_at = datetime.now(timezone.utc)
+            db.session.commit()
+        return True
+
+    def work(self, poll_interval=2.0, batch_size=10, once=False):
+        """Poll for pending rows and process them (standalone worker loop)."""
+        while True:
+            self.reclaim_stale()
+            pending_ids = self._pending_ids(batch_size)
+
+            for generation_job_id in pending_ids:
+                self.process(generation_job_id)
+
+            if once:
+                return
+            if not pending_ids:
+                time.sleep(poll_interval)
+
+
+proposal_queue = ProposalQueue()
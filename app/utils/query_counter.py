@@ -0,0 +1,62 @@
+from contextlib import contextmanager
+from sqlalchemy import event
+from sqlalchemy.engine import Engine
+
+
+class QueryCounter:
+    """
+    Records every SQL statement executed on one or more engines while active.
+    Pass `db.engines.values()` to include the read replica binds.
+
+        with QueryCounter(db.engines.values()) as counter:
+            client.get("/api/workspaces/my-workspaces")
+        print(counter.count, counter.statements)
+    """
+
+    def __init__(self, engines):
+        self.engines = [engines] if isinstance(engines, Engine) else list(engines)
+        self.statements = []
+
+    @property
+    def count(self):
+        return len(self.statements)
+
+    def _before_cursor_execute(self, conn, cursor, statement, parameters, context, executemany):
+        self.statements.append(statement)
+
+    def __enter__(self):
+        for engine in self.engines:
+            event.listen(engine, "before_cursor_execute", self._before_cursor_execute)
+        return self
+
+    def __exit__(self, exc_type, exc, tb):
+        for engine in self.engines:
+            event.remove(engine, "before_cursor_execute", self._before_cursor_execute)
+        return False
+
+
+@contextmanager
+def assert_max_queries(engines, max_queries):
+    """
+    Fail with AssertionError if the block issues more than `max_queries`
+    SQL statements. Use it in tests to pin endpoints to a query budget that
+    doesn't grow with result size:
+
+        with assert_max_queries(db.engines.values(), 2):
+            client.get(f"/api/workspaces/{workspace_id}/members")
+    """
+    with QueryCounter(engines) as counter:
+        yield counter
+    if counter.count > max_queries:
+        listing = "\n".join(f"  {i}. {statement}" for i, statement in enumerate(counter.statements, 1))
+        raise AssertionError(f"Expected at most {max_queries} queries, got {counter.count}:\n{listing}")
+
+
+# Query budgets for listing endpoints, independent of how many rows they return.
+# The logged-in user comes from user_cache, so only the endpoint's own queries
+# count (checked by benchmarks/query_budgets.py with a warm cache).
+ENDPOINT_QUERY_BUDGETS = {
+    "workspace.get_workspace_members": 2,
+    "workspace.get_my_workspaces": 1,
+    "project.list_project_members": 2,
+}
@@ -0,0 +1,114 @@
+import json
+from datetime import datetime
+from decimal import Decimal, InvalidOperation
+from sqlalchemy import String, cast, exists, func, or_, select
+
+# Query params that are never treated as filters
+RESERVED_PARAMS = {"limit", "cursor", "fields", "sort", "q"}
+
+# Filter kinds and the operators each one accepts (`field__op=value`)
+OPERATORS = {
+    "range": {"eq", "gt", "gte", "lt", "lte"},
+    "enum": {"eq", "in"},
+    "string": {"eq", "in"},
+    "json_array": {"contains", "any"},
+}
+
+
+class FilterError(ValueError):
+    pass
+
+
+def _convert(column, kind, raw):
+    if kind == "enum":
+        enum_class = column.type.enum_class
+        try:
+            return enum_class(raw)
+        except ValueError:
+            allowed = [e.value for e in enum_class]
+            raise FilterError(f"Invalid value '{raw}' for {column.key}. Allowed: {allowed}")
+
+    if kind == "range":
+        python_type = column.type.python_type
+        try:
+            if python_type is datetime:
+                return datetime.fromisoformat(raw.replace("Z", "+00:00"))
+            if python_type is Decimal:
+                return Decimal(raw)
+            return python_type(raw)
+        except (ValueError, InvalidOperation):
+            raise FilterError(f"Invalid value '{raw}' for {column.key}.")
+
+    return raw
+
+
+def _json_array_contains(column, value, dialect):
+    if dialect == "mysql":
+        return func.json_contains(column, json.dumps(value)) == 1
+    if dialect == "sqlite":
+        each = func.json_each(column).table_valued("value")
+        return exists(select(1).select_from(each).where(each.c.value == value))
+    # Generic fallback: match the serialized array element
+    return cast(column, String).like(f'%{json.dumps(value)}%')
+
+
+def apply_filters(query, model, args, spec, dialect):
+    """
+    Compile `field[__op]=value` query params into SQL filters on `model`.
+
+    `spec` maps filterable field names to a kind from OPERATORS. List
+    values are comma separated, e.g. `skills__contains=Python,AWS` or
+    `budget_type__in=fixed,hourly`.
+    """
+    for param, raw in args.items():
+        if param in RESERVED_PARAMS:
+            continue
+
+        name, _, op = param.partition("__")
+        op = op or "eq"
+        if name not in spec:
+            raise FilterError(f"Unknown filter '{name}'. Filterable fields: {sorted(spec)}")
+        kind = spec[name]
+        if op not in OPERATORS[kind]:
+            raise FilterError(f"Operator '{op}' is not supported for '{name}'. Allowed: {sorted(OPERATORS[kind])}")
+
+        column = getattr(model, name)
+        values = [v.strip() for v in raw.split(",") if v.strip()]
+        if not values:
+            raise FilterError(f"Filter '{param}' needs a value.")
+
+        if kind == "json_array":
+            clauses = [_json_array_contains(column, v, dialect) for v in values]
+            if op == "contains":
+                for clause in clauses:
+                    query = query.filter(clause)
+            else:
+                query = query.filter(or_(*clauses))
+            continue
+
+        if op == "in" or (op == "eq" and len(values) > 1 and kind != "range"):
+            query = query.filter(column.in_([_convert(column, kind, v) for v in values]))
+        elif op == "eq":
+            query = query.filter(column == _convert(column, kind, values[0]))
+        elif op == "gt":
+            query = query.filter(column > _convert(column, kind, values[0]))
+        elif op == "gte":
+            query = query.filter(column >= _convert(column, kind, values[0]))
+        elif op == "lt":
+            query = query.filter(column < _convert(column, kind, values[0]))
+        elif op == "lte":
+            query = query.filter(column <= _convert(column, kind, values[0]))
+
+    return query
+
+
+def parse_sort(value, model, sortable, default="-created_at"):
+    """
+    Parse `sort=budget` / `sort=-budget` into (column, descending).
+    """
+    value = value or default
+    descending = value.startswith("-")
+    name = value.lstrip("-+")
+    if name not in sortable:
+        raise FilterError(f"Cannot sort by '{name}'. Sortable fields: {sorted(sortable)}")
+    return getattr(model, name), descending
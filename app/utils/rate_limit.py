@@ -0,0 +1,73 @@
+import threading
+import time
+
+
+class MemoryBucketStore:
+    """
+    Process-local token-bucket state.
+
+    A shared store (e.g. Redis) only needs the same `consume()` signature,
+    applied atomically per key.
+    """
+
+    def __init__(self, max_keys=100000):
+        self.max_keys = max_keys
+        self._buckets = {}  # key -> (tokens, updated_at)
+        self._lock = threading.Lock()
+
+    def consume(self, key, capacity, refill_per_second, cost=1):
+        """Take `cost` tokens. Returns (allowed, retry_after_seconds)."""
+        now = time.monotonic()
+        with self._lock:
+            tokens, updated_at = self._buckets.get(key, (capacity, now))
+            tokens = min(capacity, tokens + (now - updated_at) * refill_per_second)
+
+            if tokens >= cost:
+                self._buckets[key] = (tokens - cost, now)
+                allowed, retry_after = True, 0.0
+            else:
+                self._buckets[key] = (tokens, now)
+                allowed, retry_after = False, (cost - tokens) / refill_per_second
+
+            if len(self._buckets) > self.max_keys:
+                self._evict_full(now, capacity, refill_per_second)
+        return allowed, retry_after
+
+    def _evict_full(self, now, capacity, refill_per_second):
+        # Buckets that have refilled completely carry no state worth keeping
+        self._buckets = {
+            k: (t, u) for k, (t, u) in self._buckets.items()
+            if t + (now - u) * refill_per_second < capacity
+        }
+
+
+class TokenBucketLimiter:
+    def __init__(self, store, capacity, per_seconds):
+        self.store = store
+        self.capacity = capacity
+        self.refill_per_second = capacity / per_seconds
+
+    def hit(self, key):
+        return self.store.consume(key, self.capacity, self.refill_per_second)
+
+
+# Login throttling (see authenticate() in app/routes/auth_routes.py)
+login_bucket_store = MemoryBucketStore()
+login_limiters = {
+    "ip": TokenBucketLimiter(login_bucket_store, capacity=20, per_seconds=60),
+    "email": TokenBucketLimiter(login_bucket_store, capacity=5, per_seconds=60),
+}
+
+
+def init_login_limiters(app, store=None):
+    store = store or login_bucket_store
+    login_limiters["ip"] = TokenBucketLimiter(
+        store,
+        capacity=app.config.get("LOGIN_RATE_LIMIT_PER_IP", 20),
+        per_seconds=app.config.get("LOGIN_RATE_LIMIT_WINDOW_SECONDS", 60)
+    )
+    login_limiters["email"] = TokenBucketLimiter(
+        store,
+        capacity=app.config.get("LOGIN_RATE_LIMIT_PER_EMAIL", 5),
+        per_seconds=app.config.get("LOGIN_RATE_LIMIT_WINDOW_SECONDS", 60)
+    )
@@ -0,0 +1,212 @@
+import html
+import math
+import re
+import threading
+from collections import defaultdict, Counter
+
+TOKEN_RE = re.compile(r"[a-z0-9][a-z0-9+#.\-]*[a-z0-9+#]|[a-z0-9]", re.IGNORECASE)
+
+# Small English stop list, roughly what MySQL's default FULLTEXT list ignores
+STOPWORDS = {
+    "a", "an", "and", "are", "as", "at", "be", "by", "for", "from", "in", "is",
+    "it", "of", "on", "or", "that", "the", "this", "to", "was", "we", "with", "you",
+}
+
+
+def tokenize(text):
+    if not text:
+        return []
+    return [t for t in (m.group(0).lower() for m in TOKEN_RE.finditer(text)) if t not in STOPWORDS]
+
+
+def highlight_snippet(text, terms, width=160):
+    """
+    Return a window of `text` around the first matching term with every
+    match wrapped in <mark>...</mark>. Text is HTML-escaped first.
+    """
+    if not text:
+        return ""
+    if not terms:
+        return html.escape(text[:width])
+
+    pattern = re.compile(r"\b(" + "|".join(re.escape(t) for t in sorted(terms, key=len, reverse=True)) + r")\b", re.IGNORECASE)
+    match = pattern.search(text)
+    if match:
+        start = max(0, match.start() - width // 3)
+    else:
+        start = 0
+    end = min(len(text), start + width)
+
+    snippet = html.escape(text[start:end])
+    snippet = pattern.sub(lambda m: f"<mark>{m.group(0)}</mark>", snippet)
+    return ("…" if start > 0 else "") + snippet + ("…" if end < len(text) else "")
+
+
+class InvertedIndex:
+    """
+    Thread-safe in-process inverted index with BM25 ranking.
+
+    Used where the database has no FULLTEXT support (e.g. SQLite in tests).
+    """
+
+    k1 = 1.2
+    b = 0.75
+
+    def __init__(self):
+        self._postings = defaultdict(dict)  # term -> {doc_id: term frequency}
+        self._doc_terms = {}  # doc_id -> Counter of terms
+        self._doc_lengths = {}  # doc_id -> number of terms
+        self._total_length = 0
+        self._lock = threading.RLock()
+
+    def __len__(self):
+        return len(self._doc_terms)
+
+    def add(self, doc_id, *texts):
+        terms = Counter()
+        for text in texts:
+            terms.update(tokenize(text))
+
+        with self._lock:
+            self._remove_locked(doc_id)
+            for term, tf in terms.items():
+                self._postings[term][doc_id] = tf
+            self._doc_terms[doc_id] = terms
+            self._doc_lengths[doc_id] = sum(terms.values())
+            self._total_length += self._doc_lengths[doc_id]
+
+    def remove(self, doc_id):
+        with self._lock:
+            self._remove_locked(doc_id)
+
+    def _remove_locked(self, doc_id):
+        terms = self._doc_terms.pop(doc_id, None)
+        if terms is None:
+            return
+        for term in terms:
+            postings = self._postings.get(term)
+            if postings is not None:
+                postings.pop(doc_id, None)
+                if not postings:
+                    del self._postings[term]
+        self._total_length -= self._doc_lengths.pop(doc_id)
+
+    def search(self, query, limit=20):
+        """Return [(doc_id, score)] ordered by descending relevance."""
+        query_terms = set(tokenize(query))
+        with self._lock:
+            doc_count = len(self._doc_terms)
+            if not doc_count or not query_terms:
+                return []
+            avg_length = self._total_length / doc_count
+
+            scores = defaultdict(float)
+            for term in query_terms:
+                postings = self._postings.get(term)
+                if not postings:
+                    continue
+                idf = math.log(1 + (doc_count - len(postings) + 0.5) / (len(postings) + 0.5))
+                for doc_id, tf in postings.items():
+                    length = self._doc_lengths[doc_id]
+                    norm = tf * (self.k1 + 1) / (tf + self.k1 * (1 - self.b + self.b * length / avg_length))
+                    scores[doc_id] += idf * norm
+
+        ranked = sorted(scores.items(), key=lambda item: (-item[1], -item[0]))
+        return ranked[:limit]
+
+
+class SearchService:
+    """
+    Full-text search over a model's text columns.
+
+    MySQL uses MATCH ... AGAINST on a FULLTEXT index; every other dialect
+    falls back to an InvertedIndex built lazily on first search and kept
+    up to date through `index()` / `remove()`.
+    """
+
+    def __init__(self, model, fields):
+        self.model = model
+        self.fields = fields
+        self._index = InvertedIndex()
+        self._built = False
+        self._build_lock = threading.Lock()
+
+    def _columns(self):
+        return [getattr(self.model, name) for name in self.fields]
+
+    def _ensure_index(self):
+        if self._built:
+            return
+        with self._build_lock:
+            if self._built:
+                return
+            from app.extensions import db
+            rows = db.session.query(self.model.id, *self._columns()).yield_per(1000)
+            for row in rows:
+                self._index.add(row[0], *row[1:])
+            self._built = True
+
+    def index(self, obj):
+        # Until the first search builds the full index there is nothing to update
+        if self._built:
+            self._index.add(obj.id, *(getattr(obj, name) for name in self.fields))
+
+    def remove(self, obj_id):
+        if self._built:
+            self._index.remove(obj_id)
+
+    def reset(self):
+        with self._build_lock:
+            self._index = InvertedIndex()
+            self._built = False
+
+    def search(self, query, limit=20):
+        """Return [(obj, score)] ordered by relevance."""
+        from app.extensions import db
+
+        if db.engine.dialect.name == "mysql":
+            from sqlalchemy.dialects.mysql import match
+
+            score = match(*self._columns(), against=query).in_natural_language_mode()
+            rows = (
+                db.session.query(self.model, score.label("score"))
+                .filter(score > 0)
+                .order_by(score.desc())
+                .limit(limit)
+                .all()
+            )
+            return [(obj, float(s)) for obj, s in rows]
+
+        self._ensure_index()
+        ranked = self._index.search(query, limit)
+        if not ranked:
+            return []
+        objects = {obj.id: obj for obj in self.model.query.filter(self.model.id.in_([doc_id for doc_id, _ in ranked]))}
+        return [(objects[doc_id], score) for doc_id, score in ranked if doc_id in objects]
+
+    def snippets(self, obj, query, width=160):
+        terms = set(tokenize(query))
+        return {name: highlight_snippet(getattr(obj, name), terms, width) for name in self.fields}
+
+
+def _make_services():
+    from app.models.upwork_job import UpworkJob
+    from app.models.proposal import Proposal
+
+    return {
+        "jobs": SearchService(UpworkJob, ["title", "description"]),
+        "proposals": SearchService(Proposal, ["proposal", "cover_letter"]),
+    }
+
+
+_services = None
+_services_lock = threading.Lock()
+
+
+def get_search_service(kind):
+    global _services
+    if _services is None:
+        with _services_lock:
+            if _services is None:
+                _services = _make_services()
+    return _services.get(kind)
@@ -0,0 +1,168 @@
+import json
+import re
+import threading
+import time
+from collections import Counter, defaultdict, deque
+
+from flask import g, has_request_context, request
+from sqlalchemy import event
+from sqlalchemy.engine import Engine
+
+_WHITESPACE_RE = re.compile(r"\s+")
+_IN_LIST_RE = re.compile(r"\bIN\s*\((?:[^()]|\([^()]*\))*\)", re.IGNORECASE)
+_LITERAL_RE = re.compile(r"'(?:[^']|'')*'|\b\d+\b")
+
+
+def statement_shape(statement):
+    """Normalize a statement so repeats with different parameters compare equal."""
+    shape = _IN_LIST_RE.sub("IN (...)", statement)
+    shape = _LITERAL_RE.sub("?", shape)
+    return _WHITESPACE_RE.sub(" ", shape).strip()
+
+
+def percentile(values, pct):
+    if not values:
+        return 0.0
+    ordered = sorted(values)
+    index = min(len(ordered) - 1, max(0, int(round(pct / 100 * (len(ordered) - 1)))))
+    return ordered[index]
+
+
+class RequestSQLStats:
+    def __init__(self):
+        self.started = time.perf_counter()
+        self.queries = []  # (statement, seconds)
+
+    @property
+    def count(self):
+        return len(self.queries)
+
+    @property
+    def db_time(self):
+        return sum(seconds for _, seconds in self.queries)
+
+    def slowest(self, n=3):
+        return sorted(self.queries, key=lambda q: q[1], reverse=True)[:n]
+
+    def repeated_shapes(self, threshold):
+        shapes = Counter(statement_shape(statement) for statement, _ in self.queries)
+        return {shape: count for shape, count in shapes.items() if count >= threshold}
+
+
+class RouteMetrics:
+    """Bounded per-route samples of request time, DB time and query count."""
+
+    def __init__(self, window=1000):
+        self.window = window
+        self._lock = threading.Lock()
+        self._samples = defaultdict(lambda: deque(maxlen=self.window))
+        self._totals = Counter()
+        self._nplus1 = Counter()
+
+    def record(self, route, duration, db_time, query_count, nplus1):
+        with self._lock:
+            self._samples[route].append((duration, db_time, query_count))
+            self._totals[route] += 1
+            if nplus1:
+                self._nplus1[route] += 1
+
+    def snapshot(self):
+        with self._lock:
+            samples = {route: list(values) for route, values in self._samples.items()}
+            totals = dict(self._totals)
+            nplus1 = dict(self._nplus1)
+
+        routes = {}
+        for route, values in samples.items():
+            durations = [v[0] * 1000 for v in values]
+            db_times = [v[1] * 1000 for v in values]
+            counts = [v[2] for v in values]
+            routes[route] = {
+                "requests": totals.get(route, 0),
+                "nplus1_requests": nplus1.get(route, 0),
+                "latency_ms": {p: round(percentile(durations, n), 2) for p, n in (("p50", 50), ("p95", 95), ("p99", 99))},
+                "db_time_ms": {p: round(percentile(db_times, n), 2) for p, n in (("p50", 50), ("p95", 95), ("p99", 99))},
+                "queries": {"p50": percentile(counts, 50), "p95": percentile(counts, 95), "max": max(counts)},
+            }
+        return routes
+
+    def reset(self):
+        with self._lock:
+            self._samples.clear()
+            self._totals.clear()
+            self._nplus1.clear()
+
+
+route_metrics = RouteMetrics()
+
+
+def _before_cursor_execute(conn, cursor, statement, parameters, context, executemany):
+    if has_request_context() and "sql_stats" in g:
+        # Per-statement context, so a statement that fails leaves nothing behind
+        context._query_start_time = time.perf_counter()
+
+
+def _after_cursor_execute(conn, cursor, statement, parameters, context, executemany):
+    if has_request_context() and "sql_stats" in g:
+        start = getattr(context, "_query_start_time", None)
+        if start is not None:
+            g.sql_stats.queries.append((statement, time.perf_counter() - start))
+
+
+def init_sql_profiler(app):
+    """
+    Per-request SQL instrumentation.
+
+    Every request gets its query count, total DB time, slowest statements
+    and N+1 candidates (same statement shape repeated SQL_PROFILER_NPLUS1_THRESHOLD
+    times) recorded. Results go to a structured log line, to X-DB-* response
+    headers in debug mode, and to `route_metrics` for /metrics.
+    """
+    if not app.config.get("SQL_PROFILER_ENABLED", True):
+        return
+
+    # Listen on the Engine class so every bind is covered
+    if not event.contains(Engine, "before_cursor_execute", _before_cursor_execute):
+        event.listen(Engine, "before_cursor_execute", _before_cursor_execute)
+        event.listen(Engine, "after_cursor_execute", _after_cursor_execute)
+
+    threshold = app.config.get("SQL_PROFILER_NPLUS1_THRESHOLD", 5)
+    slow_ms = app.config.get("SQL_PROFILER_SLOW_QUERY_MS", 100)
+
+    @app.before_request
+    def start_sql_profiling():
+        g.sql_stats = RequestSQLStats()
+
+    @app.after_request
+    def finish_sql_profiling(response):
+        stats = g.pop("sql_stats", None)
+        if stats is None:
+            return response
+
+        duration = time.perf_counter() - stats.started
+        repeated = stats.repeated_shapes(threshold)
+        route = f"{request.method} {request.url_rule.rule if request.url_rule else '<unmatched>'}"
+        route_metrics.record(route, duration, stats.db_time, stats.count, bool(repeated))
+
+        if app.config.get("SQL_PROFILER_HEADERS", app.debug):
+            response.headers["X-DB-Query-Count"] = str(stats.count)
+            response.headers["X-DB-Time-ms"] = f"{stats.db_time * 1000:.2f}"
+            if repeated:
+                response.headers["X-DB-Nplus1"] = str(max(repeated.values()))
+
+        slow = [
+            {"ms": round(seconds * 1000, 2), "statement": statement_shape(statement)[:500]}
+            for statement, seconds in stats.slowest()
+            if seconds * 1000 >= slow_ms
+        ]
+        app.logger.info(json.dumps({
+            "event": "request_sql",
+            "route": route,
+            "status": response.status_code,
+            "duration_ms": round(duration * 1000, 2),
+            "query_count": stats.count,
+            "db_time_ms": round(stats.db_time * 1000, 2),
+            "slow_queries": slow,
+            "nplus1": [{"count": count, "statement": shape[:500]} for shape, count in repeated.items()],
+        }))
+        return response
@@ -0,0 +1,74 @@
+from collections import defaultdict
+from sqlalchemy import func, select
+from app.extensions import db
+from app.models.task import Task
+from app.enums import TaskStatusEnum, TaskPriorityEnum
+from app.utils.pagination import encode_cursor
+
+
+def board_aggregates(project_id: int) -> dict:
+    """
+    Per-status counts broken down by priority and assignee, plus project totals.
+
+    One GROUP BY (status, priority, assigned_to) query; the roll-ups are summed here.
+    """
+    rows = (
+        db.session.query(Task.status, Task.priority, Task.assigned_to, func.count(Task.id))
+        .filter(Task.project_id == project_id)
+        .group_by(Task.status, Task.priority, Task.assigned_to)
+        .all()
+    )
+
+    def empty():
+        return {
+            "count": 0,
+            "by_priority": {p.value: 0 for p in TaskPriorityEnum},
+            "by_assignee": defaultdict(int),
+        }
+
+    columns = {s.value: empty() for s in TaskStatusEnum}
+    totals = empty()
+    for status, priority, assigned_to, count in rows:
+        for bucket in (columns[status.value], totals):
+            bucket["count"] += count
+            bucket["by_priority"][priority.value] += count
+            bucket["by_assignee"][str(assigned_to)] += count
+
+    for bucket in (*columns.values(), totals):
+        bucket["by_assignee"] = dict(bucket["by_assignee"])
+    return {"columns": columns, "totals": totals}
+
+
+def board_first_pages(project_id: int, limit: int) -> dict:
+    """
+    First `limit` tasks of every status column (newest first) in a single query.
+
+    ROW_NUMBER() is partitioned by status so each column is cut independently.
+    Returns {status: (tasks, next_cursor)}; cursors continue via keyset_paginate.
+    """
+    row_number = func.row_number().over(
+        partition_by=Task.status,
+        order_by=(Task.created_at.desc(), Task.id.desc())
+    ).label("row_number")
+    ranked = select(Task.id, row_number).where(Task.project_id == project_id).subquery()
+
+    tasks = (
+        Task.query.join(ranked, Task.id == ranked.c.id)
+        .filter(ranked.c.row_number <= limit + 1)
+        .order_by(Task.created_at.desc(), Task.id.desc())
+        .all()
+    )
+
+    grouped = defaultdict(list)
+    for task in tasks:
+        grouped[task.status.value].append(task)
+
+    pages = {}
+    for status in TaskStatusEnum:
+        items = grouped.get(status.value, [])
+        next_cursor = None
+        if len(items) > limit:
+            items = items[:limit]
+            next_cursor = encode_cursor(items[-1].created_at, items[-1].id)
+        pages[status.value] = (items, next_cursor)
+    return pages
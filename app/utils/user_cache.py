@@ -0,0 +1,96 @@
+import threading
+from dataclasses import dataclass
+
+from cachetools import TTLCache
+
+from app.enums import UserRoleEnum
+
+
+@dataclass(frozen=True)
+class UserSnapshot:
+    """
+    Immutable, detached view of a User used as Flask-Login's current_user.
+
+    Carries just what authorization and the profile endpoint need, so
+    authenticated requests don't load the User row. Query the User model
+    when anything else is needed. Snapshots built from bearer tokens
+    (app/utils/auth_tokens.py) carry only id, role and is_active.
+    """
+    id: int
+    role: UserRoleEnum
+    is_active: bool
+    first_name: str = None
+    last_name: str = None
+    email: str = None
+    profile_image_url: str = None
+
+    is_authenticated = True
+    is_anonymous = False
+
+    def get_id(self):
+        return str(self.id)
+
+    @classmethod
+    def from_user(cls, user):
+        return cls(
+            id=user.id,
+            first_name=user.first_name,
+            last_name=user.last_name,
+            email=user.email,
+            role=user.role,
+            is_active=user.is_active,
+            profile_image_url=user.profile_image_url,
+        )
+
+
+class UserCache:
+    """Size-bounded TTL cache of UserSnapshots keyed by user id."""
+
+    def __init__(self, maxsize=10000, ttl=60):
+        self._cache = TTLCache(maxsize=maxsize, ttl=ttl)
+        self._lock = threading.Lock()
+        self.hits = 0
+        self.misses = 0
+
+    def configure(self, maxsize, ttl):
+        with self._lock:
+            self._cache = TTLCache(maxsize=maxsize, ttl=ttl)
+
+    def get(self, user_id, loader):
+        with self._lock:
+            snapshot = self._cache.get(user_id)
+            if snapshot is not None:
+                self.hits += 1
+                return snapshot
+            self.misses += 1
+
+        user = loader(user_id)
+        if user is None:
+            return None
+        snapshot = UserSnapshot.from_user(user)
+        with self._lock:
+            self._cache[user_id] = snapshot
+        return snapshot
+
+    def invalidate(self, user_id):
+        with self._lock:
+            self._cache.pop(user_id, None)
+
+    def clear(self):
+        with self._lock:
+            self._cache.clear()
+
+    def stats(self):
+        with self._lock:
+            return {"size": len(self._cache), "hits": self.hits, "misses": self.misses}
+
+
+user_cache = UserCache()
+
+
+def init_user_cache(app):
+    user_cache.configure(
+        maxsize=app.config.get("USER_CACHE_MAXSIZE", 10000),
+        ttl=app.config.get("USER_CACHE_TTL_SECONDS", 60)
+    )
+
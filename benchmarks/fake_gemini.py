@@ -0,0 +1,127 @@
+"""
+Local fake Gemini API for exercising app/utils/gemini_gateway.py.
+
+Serves generateContent and streamGenerateContent (SSE) with configurable
+latency and injected 429 / 503 failures, then drives the gateway against it
+and prints its metrics (latency percentiles, retries, throttling, circuit).
+
+    python -m benchmarks.fake_gemini --calls 50 --fail-rate 0.2
+    python -m benchmarks.fake_gemini --fail-rate 1.0      # watch the circuit open
+    python -m benchmarks.fake_gemini --serve --port 8765  # then GEMINI_BASE_URL=http://127.0.0.1:8765
+"""
+import argparse
+import json
+import random
+import threading
+import time
+from http.server import BaseHTTPRequestHandler, ThreadingHTTPServer
+
+
+def _response_body(text, prompt_tokens):
+    output_tokens = max(1, len(text) // 4)
+    return {
+        "candidates": [{"content": {"role": "model", "parts": [{"text": text}]}, "finishReason": "STOP"}],
+        "usageMetadata": {
+            "promptTokenCount": prompt_tokens,
+            "candidatesTokenCount": output_tokens,
+            "totalTokenCount": prompt_tokens + output_tokens,
+        },
+    }
+
+
+def make_handler(latency, fail_rate, answer, rng):
+    class FakeGeminiHandler(BaseHTTPRequestHandler):
+        def log_message(self, format, *args):
+            pass
+
+        def _json(self, status, payload):
+            body = json.dumps(payload).encode("utf-8")
+            self.send_response(status)
+            self.send_header("Content-Type", "application/json")
+            self.send_header("Content-Length", str(len(body)))
+            self.end_headers()
+            self.wfile.write(body)
+
+        def do_POST(self):
+            request_body = self.rfile.read(int(self.headers.get("Content-Length") or 0))
+            prompt_tokens = max(1, len(request_body) // 4)
+            time.sleep(latency)
+
+            if rng.random() < fail_rate:
+                status, reason = rng.choice(((429, "RESOURCE_EXHAUSTED"), (503, "UNAVAILABLE")))
+                return self._json(status, {"error": {"code": status, "message": "injected failure", "status": reason}})
+
+            if ":streamGenerateContent" in self.path:
+                self.send_response(200)
+                self.send_header("Content-Type", "text/event-stream")
+                self.end_headers()
+                words = answer.split(" ")
+                for index, word in enumerate(words):
+                    text = word if index == len(words) - 1 else word + " "
+                    self.wfile.write(f"data: {json.dumps(_response_body(text, prompt_tokens))}\r\n\r\n".encode("utf-8"))
+                    self.wfile.flush()
+                return
+
+            if ":generateContent" in self.path:
+                return self._json(200, _response_body(answer, prompt_tokens))
+
+            self._json(404, {"error": {"code": 404, "message": "not found", "status": "NOT_FOUND"}})
+
+    return FakeGeminiHandler
+
+
+def start_server(port=0, latency=0.05, fail_rate=0.0, answer="valid", seed=42):
+    server = ThreadingHTTPServer(("127.0.0.1", port), make_handler(latency, fail_rate, answer, random.Random(seed)))
+    threading.Thread(target=server.serve_forever, daemon=True).start()
+    return server
+
+
+def main():
+    parser = argparse.ArgumentParser()
+    parser.add_argument("--port", type=int, default=0)
+    parser.add_argument("--serve", action="store_true", help="only run the fake server")
+    parser.add_argument("--calls", type=int, default=50)
+    parser.add_argument("--latency", type=float, default=0.05)
+    parser.add_argument("--fail-rate", type=float, default=0.2)
+    parser.add_argument("--rpm", type=int, default=600)
+    args = parser.parse_args()
+
+    server = start_server(args.port, args.latency, args.fail_rate)
+    base_url = f"http://127.0.0.1:{server.server_address[1]}"
+    if args.serve:
+        print(f"Fake Gemini listening on {base_url}")
+        threading.Event().wait()
+
+    from app.utils.gemini_gateway import gemini_gateway
+    from app.utils.gemini import assess_jobs_feasibility
+
+    gemini_gateway.configure(
+        api_key="fake", base_url=base_url, timeout=5.0, retry_attempts=4, retry_max_wait=0.5,
+        requests_per_minute=args.rpm, tokens_per_minute=250000, max_wait=30.0,
+        failure_threshold=5, reset_timeout=2.0
+    )
+
+    outcomes = {"ok": 0, "failed": 0}
+    for i in range(args.calls):
+        try:
+            gemini_gateway.generate(f"sync call {i}", kind="sync")
+            outcomes["ok"] += 1
+        except Exception:
+            outcomes["failed"] += 1
+
+    statuses = assess_jobs_feasibility([{"job_id": f"fake-{i}", "title": f"Job {i}"} for i in range(args.calls)],
+                                       max_concurrency=10, timeout=5.0)
+    try:
+        text = "".join(chunk.text or "" for chunk in gemini_gateway.stream("stream call", kind="stream"))
+    except Exception as e:
+        text = f"{type(e).__name__}: {e}"
+
+    print(f"sync: {outcomes}")
+    print(f"async batch: {{'valid': {statuses.count('valid')}, 'unsure': {statuses.count('unsure')}}}")
+    print(f"stream: {text!r}")
+    print(json.dumps(gemini_gateway.snapshot(), indent=2))
+    server.shutdown()
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,78 @@
+"""
+Login hashing throughput under contention.
+
+Compares verifying passwords inline in request threads (the old /login
+behaviour) against the bounded process pool used by authenticate(), and
+reports logins/sec plus how responsive a cheap "other endpoint" stays
+while the logins run.
+
+    python -m benchmarks.login_throughput --threads 32 --logins 200
+"""
+import argparse
+import statistics
+import time
+from concurrent.futures import ThreadPoolExecutor
+
+from werkzeug.security import check_password_hash, generate_password_hash
+
+from app.utils.password_hashing import HashingBusy, PasswordHasher
+
+
+def _probe_latency(stop_at):
+    # Stand-in for a cheap endpoint competing for the same CPU
+    samples = []
+    while time.perf_counter() < stop_at:
+        started = time.perf_counter()
+        sum(range(10000))
+        samples.append((time.perf_counter() - started) * 1000)
+        time.sleep(0.01)
+    return samples
+
+
+def run(label, verify, password_hash, threads, logins):
+    started = time.perf_counter()
+    with ThreadPoolExecutor(max_workers=threads) as pool:
+        results = list(pool.map(lambda _: _safe(verify, password_hash), range(logins)))
+    elapsed = time.perf_counter() - started
+
+    rejected = results.count(None)
+    print(f"{label:<14} {logins / elapsed:8.1f} logins/sec  "
+          f"elapsed {elapsed:6.2f}s  rejected {rejected}")
+
+
+def main():
+    parser = argparse.ArgumentParser()
+    parser.add_argument("--threads", type=int, default=32)
+    parser.add_argument("--logins", type=int, default=200)
+    parser.add_argument("--workers", type=int, default=2)
+    parser.add_argument("--method", default="scrypt")
+    args = parser.parse_args()
+
+    password_hash = generate_password_hash("correct horse battery staple", args.method)
+    hasher = PasswordHasher(workers=args.workers, max_pending=args.threads, timeout=60, method=args.method)
+
+    print(f"{args.logins} logins, {args.threads} concurrent clients, method={args.method}")
+    run("inline", check_password_hash, password_hash, args.threads, args.logins)
+    run(f"pool({args.workers})", hasher.verify, password_hash, args.threads, args.logins)
+
+    # Responsiveness of other work while logins saturate the hashing path
+    for label, verify in (("inline", check_password_hash), (f"pool({args.workers})", hasher.verify)):
+        stop_at = time.perf_counter() + 3
+        with ThreadPoolExecutor(max_workers=args.threads + 1) as pool:
+            probe = pool.submit(_probe_latency, stop_at)
+            while time.perf_counter() < stop_at:
+                list(pool.map(lambda _: _safe(verify, password_hash), range(args.threads)))
+            samples = probe.result()
+        print(f"{label:<14} other-endpoint p50 {statistics.median(samples):6.2f}ms  "
+              f"max {max(samples):6.2f}ms")
+
+
+def _safe(verify, password_hash):
+    try:
+        return verify(password_hash, "correct horse battery staple")
+    except HashingBusy:
+        return None
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,104 @@
+"""
+Query budgets for listing endpoints (app/utils/query_counter.py).
+
+Seeds a small (N members) and a large (10*N members) data set, requests
+every endpoint in ENDPOINT_QUERY_BUDGETS against both under
+assert_max_queries, and exits non-zero if an endpoint goes over its budget
+or issues more queries for the larger data set.
+
+    DATABASE_URL=sqlite:////tmp/query_budgets.db python -m benchmarks.query_budgets --members 20
+"""
+import argparse
+import os
+
+os.environ.setdefault("DATABASE_URL", "sqlite:////tmp/query_budgets.db")
+
+PASSWORD = "budget-password"
+
+
+def _seed(db, label, members, password_hash):
+    from app.models.user import User
+    from app.models.workspace import Workspace
+    from app.models.workspace_member import WorkspaceMember
+    from app.models.upwork_job import UpworkJob
+    from app.models.project import Project
+    from app.models.project_member import ProjectMember
+    from app.enums import UserRoleEnum
+
+    users = [
+        User(first_name="Budget", last_name=str(i), email=f"{label}-{i}@example.com", password=password_hash,
+             contact="0000000000", role=UserRoleEnum.admin)
+        for i in range(members)
+    ]
+    workspaces = [Workspace(name=f"{label} workspace {i}", invite_code=f"{label.upper()}-{i:05d}") for i in range(members)]
+    job = UpworkJob(job_id=f"{label}-job", title="Budget job", description="Budget job", job_url="https://example.com")
+    db.session.add_all(users + workspaces + [job])
+    db.session.flush()
+
+    project = Project(name=f"{label} project", job_id=job.id, team_lead_id=users[0].id, workspace_id=workspaces[0].id)
+    db.session.add(project)
+    db.session.flush()
+
+    # Every user is in the first workspace and the project; the first user is in every workspace
+    db.session.add_all([WorkspaceMember(user_id=user.id, workspace_id=workspaces[0].id) for user in users])
+    db.session.add_all([WorkspaceMember(user_id=users[0].id, workspace_id=w.id) for w in workspaces[1:]])
+    db.session.add_all([ProjectMember(user_id=user.id, project_id=project.id) for user in users])
+    db.session.commit()
+    return {"email": users[0].email, "workspace_id": workspaces[0].id, "project_id": project.id}
+
+
+def main():
+    parser = argparse.ArgumentParser()
+    parser.add_argument("--members", type=int, default=20)
+    args = parser.parse_args()
+
+    from flask import url_for
+    from app import create_app
+    from app.extensions import db
+    from app.utils.password_hashing import password_hasher
+    from app.utils.query_counter import ENDPOINT_QUERY_BUDGETS, assert_max_queries
+
+    app = create_app()
+    failures = 0
+    with app.app_context():
+        db.drop_all()
+        db.create_all()
+        password_hash = password_hasher.hash(PASSWORD)
+        datasets = [(n, _seed(db, f"n{n}", n, password_hash)) for n in (args.members, args.members * 10)]
+
+    for endpoint, budget in ENDPOINT_QUERY_BUDGETS.items():
+        counts = []
+        for size, dataset in datasets:
+            client = app.test_client()
+            response = client.post("/api/auth/login", json={"email": dataset["email"], "password": PASSWORD})
+            assert response.status_code == 200, response.get_json()
+
+            rule = next(app.url_map.iter_rules(endpoint))
+            with app.test_request_context():
+                url = url_for(endpoint, **{arg: dataset[arg] for arg in rule.arguments})
+
+            client.get(url)  # warm the user cache
+            with app.app_context():
+                engines = list(db.engines.values())
+            try:
+                with assert_max_queries(engines, budget) as counter:
+                    response = client.get(url)
+                assert response.status_code == 200, f"{url} returned {response.status_code}"
+            except AssertionError as e:
+                failures += 1
+                print(f"FAIL {endpoint} ({size} members): {e}")
+                continue
+            counts.append(counter.count)
+
+        if len(counts) == len(datasets):
+            grows = counts[-1] > counts[0]
+            failures += grows
+            print(f"{'FAIL' if grows else 'ok  '} {endpoint:36} budget {budget}   "
+                  + "   ".join(f"{size} members: {count}" for (size, _), count in zip(datasets, counts)))
+
+    if failures:
+        raise SystemExit(1)
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,133 @@
+"""
+List serialization throughput: marshmallow dumps vs compiled serializers.
+
+Seeds Upwork jobs, tasks and proposals, then times
+  - schema.dump() over ORM objects (the old list endpoints)
+  - CompiledSerializer.dump_rows() over Row tuples (app/utils/fast_serializer.py)
+and fails if the two produce different JSON bytes.
+
+    DATABASE_URL=sqlite:////tmp/serialization.db python -m benchmarks.serialization --rows 5000
+"""
+import argparse
+import os
+import random
+import time
+from datetime import datetime, timedelta, timezone
+from decimal import Decimal
+
+os.environ.setdefault("DATABASE_URL", "sqlite:////tmp/serialization_bench.db")
+
+
+def _seed(db, rows):
+    from app.models.user import User
+    from app.models.workspace import Workspace
+    from app.models.upwork_job import UpworkJob
+    from app.models.project import Project
+    from app.models.task import Task
+    from app.models.proposal import Proposal
+    from app.enums import (
+        BudgetTypeEnum, FeasibilityEnum, ProposalStatusEnum, TaskPriorityEnum, TaskStatusEnum, UserRoleEnum
+    )
+
+    rng = random.Random(42)
+    now = datetime.now(timezone.utc)
+
+    user = User(first_name="Bench", last_name="User", email="bench@example.com", password="x",
+                contact="0000000000", role=UserRoleEnum.admin)
+    workspace = Workspace(name="Bench", invite_code="BENCH-00000")
+    db.session.add_all([user, workspace])
+    db.session.flush()
+
+    jobs = [
+        UpworkJob(
+            job_id=f"bench-{i}", title=f"Bench job {i}", description="Benchmark job description " * 4,
+            skills=["Python", "Flask"], tags=["api"], category="Web", client_country="Canada",
+            client_payment_verified=bool(i % 2), client_total_spent=Decimal(rng.randint(0, 10 ** 6)) / 100,
+            budget=Decimal(rng.randint(100, 10 ** 5)) / 100, budget_type=rng.choice(list(BudgetTypeEnum)),
+            connect_required=rng.randint(1, 16), posted_at=now - timedelta(hours=i),
+            job_url=f"https://example.com/{i}", feasibility_status=rng.choice(list(FeasibilityEnum))
+        )
+        for i in range(rows)
+    ]
+    db.session.add_all(jobs)
+    db.session.flush()
+
+    project = Project(name="Bench project", job_id=jobs[0].id, team_lead_id=user.id, workspace_id=workspace.id)
+    db.session.add(project)
+    db.session.flush()
+
+    db.session.add_all([
+        Task(task_code=f"TSK-{i:06d}", project_id=project.id, assigned_to=user.id, created_by=user.id,
+             title=f"Bench task {i}", description="Do the thing",
+             status=rng.choice(list(TaskStatusEnum)), priority=rng.choice(list(TaskPriorityEnum)),
+             due_date=(now + timedelta(days=i % 30)).replace(tzinfo=None) if i % 3 else None)
+        for i in range(rows)
+    ])
+    db.session.add_all([
+        Proposal(job_id=jobs[i].id, generated_by=user.id, cover_letter="Hello", proposal="Proposal text " * 20,
+                 feasibility_score=rng.random() * 100, status=rng.choice(list(ProposalStatusEnum)),
+                 expected_earnings=Decimal(rng.randint(0, 10 ** 5)) / 100, tags=["python"])
+        for i in range(rows)
+    ])
+    db.session.commit()
+
+
+def _time(fn, repeat):
+    best = None
+    for _ in range(repeat):
+        started = time.perf_counter()
+        result = fn()
+        elapsed = time.perf_counter() - started
+        best = elapsed if best is None else min(best, elapsed)
+    return best, result
+
+
+def main():
+    parser = argparse.ArgumentParser()
+    parser.add_argument("--rows", type=int, default=5000)
+    parser.add_argument("--repeat", type=int, default=3)
+    args = parser.parse_args()
+
+    from app import create_app
+    from app.extensions import db
+    from app.models.upwork_job import UpworkJob
+    from app.models.task import Task
+    from app.models.proposal import Proposal
+    from app.schemas.upwork_jobs_schema import UpworkJobSchema
+    from app.schemas.task_schema import TaskSchema
+    from app.schemas.proposal_schema import ProposalSchema
+    from app.utils.fast_serializer import compile_schema
+
+    app = create_app()
+    mismatches = 0
+    with app.app_context():
+        db.drop_all()
+        db.create_all()
+        _seed(db, args.rows)
+
+        for model, schema_class in ((UpworkJob, UpworkJobSchema), (Task, TaskSchema), (Proposal, ProposalSchema)):
+            schema = schema_class(many=True)
+            serializer = compile_schema(schema_class)
+
+            def marshmallow_path():
+                db.session.expire_all()
+                return schema.dump(model.query.order_by(model.id).all())
+
+            def compiled_path():
+                return serializer.dump_rows(db.session.execute(serializer.select().order_by(model.id)).all())
+
+            slow, expected = _time(marshmallow_path, args.repeat)
+            fast, actual = _time(compiled_path, args.repeat)
+
+            identical = app.json.dumps(expected) == app.json.dumps(actual)
+            mismatches += not identical
+            print(f"{schema_class.__name__:16} marshmallow {args.rows / slow:>10,.0f} rows/sec   "
+                  f"compiled {args.rows / fast:>10,.0f} rows/sec   x{slow / fast:.1f}   "
+                  f"{'identical' if identical else 'MISMATCH'}")
+
+    if mismatches:
+        raise SystemExit(1)
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,43 @@
+"""Add updated_at columns
+
+Revision ID: c6e2a9d4f813
+Revises: b8d3f6a2c419
+Create Date: 2026-10-18 16:31:52.907215
+
+"""
+from alembic import op
+import sqlalchemy as sa
+from sqlalchemy.dialects import mysql
+
+
+# revision identifiers, used by Alembic.
+revision = 'c6e2a9d4f813'
+down_revision = 'b8d3f6a2c419'
+branch_labels = None
+depends_on = None
+
+TABLES = ('projects', 'proposals', 'tasks', 'upwork_jobs', 'workspaces')
+
+
+def _updated_at_type():
+    return sa.DateTime(timezone=True).with_variant(mysql.DATETIME(timezone=True, fsp=6), 'mysql')
+
+
+def upgrade():
+    for table in TABLES:
+        with op.batch_alter_table(table, schema=None) as batch_op:
+            batch_op.add_column(sa.Column('updated_at', _updated_at_type(), nullable=True))
+
+        # Existing rows start out at their creation time
+        op.execute(f"UPDATE {table} SET updated_at = COALESCE(created_at, CURRENT_TIMESTAMP)")
+
+        with op.batch_alter_table(table, schema=None) as batch_op:
+            batch_op.alter_column('updated_at', existing_type=_updated_at_type(), nullable=False)
+            batch_op.create_index(batch_op.f(f'ix_{table}_updated_at'), ['updated_at'], unique=False)
+
+
+def downgrade():
+    for table in reversed(TABLES):
+        with op.batch_alter_table(table, schema=None) as batch_op:
+            batch_op.drop_index(batch_op.f(f'ix_{table}_updated_at'))
+            batch_op.drop_column('updated_at')
@@ -0,0 +1,39 @@
+"""Add fulltext search indexes
+
+Revision ID: d9e4b2f7a051
+Revises: c3f8a1d5e274
+Create Date: 2026-10-18 11:26:08.394751
+
+"""
+from alembic import op
+import sqlalchemy as sa
+
+
+# revision identifiers, used by Alembic.
+revision = 'd9e4b2f7a051'
+down_revision = 'c3f8a1d5e274'
+branch_labels = None
+depends_on = None
+
+
+def upgrade():
+    # FULLTEXT indexes only exist on MySQL; other dialects use the in-process index
+    if op.get_bind().dialect.name != 'mysql':
+        return
+
+    with op.batch_alter_table('upwork_jobs', schema=None) as batch_op:
+        batch_op.create_index('ft_upwork_jobs_title_description', ['title', 'description'], unique=False, mysql_prefix='FULLTEXT')
+
+    with op.batch_alter_table('proposals', schema=None) as batch_op:
+        batch_op.create_index('ft_proposals_proposal_cover_letter', ['proposal', 'cover_letter'], unique=False, mysql_prefix='FULLTEXT')
+
+
+def downgrade():
+    if op.get_bind().dialect.name != 'mysql':
+        return
+
+    with op.batch_alter_table('proposals', schema=None) as batch_op:
+        batch_op.drop_index('ft_proposals_proposal_cover_letter')
+
+    with op.batch_alter_table('upwork_jobs', schema=None) as batch_op:
+        batch_op.drop_index('ft_upwork_jobs_title_description')